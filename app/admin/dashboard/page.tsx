@@ -1,10 +1,11 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { supabase } from '@/lib/supabase';
 import { useRouter } from 'next/navigation';
 import Link from 'next/link';
 import AdminDatePicker from '@/app/components/AdminDatePicker';
+import ResponsiveImage from '@/app/components/ResponsiveImage';
 
 // Simple Icons
 const Icons = {
@@ -16,13 +17,29 @@ const Icons = {
     Trash: () => <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round"><polyline points="3 6 5 6 21 6"></polyline><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"></path></svg>
 };
 
+const LOCATIONS = [
+    { id: 'central', label: 'Chama Church - Manaus' },
+    { id: 'manacapuru', label: 'Chama Church - Manacapuru' },
+    { id: 'africa', label: 'Chama Church África' },
+    { id: 'online', label: 'Chama Church On-line' },
+];
+
+const filterSelectStyle = { padding: '0.5rem', border: '1px solid #e5e7eb', borderRadius: '0.375rem', background: 'white', fontSize: '0.875rem' };
+
 export default function AdminDashboard() {
     const [donations, setDonations] = useState<any[]>([]);
     const [loading, setLoading] = useState(true);
     const [stats, setStats] = useState({ total: 0, todayTotal: 0, monthTotal: 0, count: 0, pix: 0, card: 0, members: 0 });
     const [startDate, setStartDate] = useState('');
     const [endDate, setEndDate] = useState('');
-    const [currentPage, setCurrentPage] = useState(1);
+    const [statusFilter, setStatusFilter] = useState('');
+    const [methodFilter, setMethodFilter] = useState('');
+    const [locationFilter, setLocationFilter] = useState('');
+    // Keyset pagination: the cursor that opened each visited page (null = first page)
+    const [pageCursors, setPageCursors] = useState<(string | null)[]>([null]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [totalResults, setTotalResults] = useState<number | null>(null);
+    const currentPage = pageCursors.length;
     const itemsPerPage = 10;
     const router = useRouter();
 
@@ -38,91 +55,154 @@ export default function AdminDashboard() {
         checkAuth();
     }, [router]);
 
-    const fetchDonations = async () => {
-        try {
-            const { data, error } = await supabase
-                .from('donations')
-                .select('*')
-                .order('created_at', { ascending: false });
-
-            if (error) throw error;
-
-            if (data) {
-                setDonations(data);
-
-                // Calculate stats
-                const total = data.filter(d => d.status === 'paid').reduce((acc, curr) => acc + Number(curr.amount), 0);
-                const count = data.length;
-                const pix = data.filter(d => d.payment_method === 'pix').length;
-                const card = data.filter(d => d.payment_method === 'credit_card').length;
-
-                // Calculate today total
-                const today = new Date();
-                today.setHours(0, 0, 0, 0); // Start of today (local browser time)
-
-                const todayTotal = data.filter(d => {
-                    if (d.status !== 'paid') return false;
-                    const dDate = new Date(d.created_at);
-                    // Adjust donation date to local time comparison?
-                    // Actually, if we just check if it's >= today start and < tomorrow start in local time
-                    return dDate >= today;
-                }).reduce((acc, curr) => acc + Number(curr.amount), 0);
-
-                // Calculate month total
-                const startOfMonth = new Date(today.getFullYear(), today.getMonth(), 1);
-                const monthTotal = data.filter(d => {
-                    if (d.status !== 'paid') return false;
-                    const dDate = new Date(d.created_at);
-                    return dDate >= startOfMonth;
-                }).reduce((acc, curr) => acc + Number(curr.amount), 0);
-
-                setStats({ total, todayTotal, monthTotal, count, pix, card, members: new Set(data.map(d => d.payer_cpf)).size });
-            }
-        } catch (error) {
-            console.error('Error fetching donations:', error);
-        } finally {
-            setLoading(false);
+    const authHeaders = async () => {
+        const { data: { session } } = await supabase.auth.getSession();
+        if (!session) {
+            router.push('/admin');
+            throw new Error('Sessão expirada');
         }
+        return { Authorization: `Bearer ${session.access_token}` };
     };
 
-    // Filter Logic
-    const filteredDonations = donations.filter(d => {
-        if (!startDate && !endDate) return true;
+    const fetchStats = async () => {
+        // Boundaries in the admin's local time, aggregated server-side
+        const today = new Date();
+        today.setHours(0, 0, 0, 0);
+        const startOfMonth = new Date(today.getFullYear(), today.getMonth(), 1);
+        const params = new URLSearchParams({ todayStart: today.toISOString(), monthStart: startOfMonth.toISOString() });
 
-        const donationDate = new Date(d.created_at);
+        const res = await fetch(`/api/admin/stats?${params}`, { headers: await authHeaders() });
+        if (!res.ok) throw new Error((await res.json()).error || 'Erro ao carregar estatísticas');
+        setStats(await res.json());
+    };
 
-        // Start Date: Beginning of the day (00:00:00)
-        let start = null;
+    // Current filters as the API's query parameters
+    const filterParams = () => {
+        const params = new URLSearchParams();
         if (startDate) {
             // Create date object treating input as local date (handling "YYYY-MM-DD")
             const [year, month, day] = startDate.split('-').map(Number);
-            start = new Date(year, month - 1, day, 0, 0, 0, 0);
+            params.set('start', new Date(year, month - 1, day, 0, 0, 0, 0).toISOString());
         }
-
-        // End Date: End of the day (23:59:59)
-        let end = null;
         if (endDate) {
+            // End Date: End of the day (23:59:59)
             const [year, month, day] = endDate.split('-').map(Number);
-            end = new Date(year, month - 1, day, 23, 59, 59, 999);
+            params.set('end', new Date(year, month - 1, day, 23, 59, 59, 999).toISOString());
         }
+        if (statusFilter) params.set('status', statusFilter);
+        if (methodFilter) params.set('method', methodFilter);
+        if (locationFilter) params.set('location', locationFilter);
+        return params;
+    };
 
-        if (start && donationDate < start) return false;
-        if (end && donationDate > end) return false;
+    // Loads the page that starts after `cursor`; filters are applied by the API
+    const fetchPage = async (cursor: string | null) => {
+        const params = filterParams();
+        params.set('limit', String(itemsPerPage));
+        if (cursor) params.set('cursor', cursor);
 
-        return true;
-    });
+        const res = await fetch(`/api/admin/donations?${params}`, { headers: await authHeaders() });
+        const body = await res.json();
+        if (!res.ok) throw new Error(body.error || 'Erro ao carregar contribuições');
 
-    // Pagination Logic
-    const totalPages = Math.ceil(filteredDonations.length / itemsPerPage);
-    const paginatedDonations = filteredDonations.slice(
-        (currentPage - 1) * itemsPerPage,
-        currentPage * itemsPerPage
-    );
+        setDonations(body.donations);
+        setNextCursor(body.nextCursor);
+        if (!cursor) setTotalResults(body.total);
+    };
+
+    const loadFirstPage = async () => {
+        await fetchPage(null);
+        setPageCursors([null]);
+    };
+
+    const fetchDonations = async () => {
+        try {
+            await Promise.all([loadFirstPage(), fetchStats()]);
+        } catch (error) {
+            console.error('Error fetching donations:', error);
+        } finally {
+            setLoading(false);
+        }
+    };
+
+    // Filters are applied server-side: changing one reloads from the first page
+    const filtersKey = [startDate, endDate, statusFilter, methodFilter, locationFilter].join('|');
+    const appliedFilters = useRef(filtersKey);
+    useEffect(() => {
+        if (appliedFilters.current === filtersKey) return;
+        appliedFilters.current = filtersKey;
+        loadFirstPage().catch(error => console.error('Error fetching donations:', error));
+    }, [filtersKey]);
+
+    // Resolve pending rows of the visible page with a single batch status check
+    const checkedIds = useRef(new Set<string>());
+    useEffect(() => {
+        const pendingIds = donations
+            .filter(d => d.status === 'pending' && d.pagbank_order_id && !checkedIds.current.has(d.pagbank_order_id))
+            .map(d => d.pagbank_order_id);
+        if (pendingIds.length === 0) return;
+        pendingIds.forEach(id => checkedIds.current.add(id));
+
+        fetch('/api/check-status/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ ids: pendingIds })
+        })
+            .then(res => res.json())
+            .then(({ results = {} }) => {
+                const changed = pendingIds.filter(id => results[id]?.donation_status && results[id].donation_status !== 'pending');
+                if (changed.length === 0) return;
+                setDonations(current => current.map(d =>
+                    changed.includes(d.pagbank_order_id) ? { ...d, status: results[d.pagbank_order_id].donation_status } : d
+                ));
+            })
+            .catch(e => console.error('Failed to check pending statuses', e));
+    }, [donations]);
+
+    const goToNextPage = async () => {
+        if (!nextCursor) return;
+        try {
+            await fetchPage(nextCursor);
+            setPageCursors(cursors => [...cursors, nextCursor]);
+        } catch (error) {
+            console.error('Error fetching donations:', error);
+        }
+    };
+
+    const goToPreviousPage = async () => {
+        if (pageCursors.length <= 1) return;
+        const cursors = pageCursors.slice(0, -1);
+        try {
+            await fetchPage(cursors[cursors.length - 1]);
+            setPageCursors(cursors);
+        } catch (error) {
+            console.error('Error fetching donations:', error);
+        }
+    };
+
+    // Streams every donation matching the filters as CSV. A form POST lets the
+    // browser save the response as it arrives instead of buffering it in JS.
+    const exportCsv = async () => {
+        const { data: { session } } = await supabase.auth.getSession();
+        if (!session) {
+            router.push('/admin');
+            return;
+        }
 
-    const handlePageChange = (newPage: number) => {
-        if (newPage >= 1 && newPage <= totalPages) {
-            setCurrentPage(newPage);
+        const form = document.createElement('form');
+        form.method = 'POST';
+        form.action = '/api/admin/donations/export';
+        const fields = [['access_token', session.access_token], ...Array.from(filterParams().entries())];
+        for (const [name, value] of fields) {
+            const input = document.createElement('input');
+            input.type = 'hidden';
+            input.name = name;
+            input.value = value;
+            form.appendChild(input);
         }
+        document.body.appendChild(form);
+        form.submit();
+        form.remove();
     };
 
     const handleLogout = async () => {
@@ -169,12 +249,13 @@ export default function AdminDashboard() {
             {/* Header */}
             <header style={{ background: 'white', borderBottom: '1px solid #e5e7eb', padding: '1rem 2rem', display: 'flex', justifyContent: 'space-between', alignItems: 'center', flexWrap: 'wrap', gap: '1rem' }}>
                 <div style={{ display: 'flex', alignItems: 'center', gap: '1rem' }}>
-                    <img src="/logo-black.png" alt="Logo" style={{ height: '32px' }} />
+                    <ResponsiveImage name="logo-black" alt="Logo" sizes="96px" style={{ height: '32px', width: 'auto' }} priority />
                     <h1 style={{ fontSize: '1.25rem', fontWeight: 700, margin: 0 }}>Dashboard</h1>
                 </div>
                 <div style={{ display: 'flex', alignItems: 'center', gap: '1rem' }}>
                     <button
                         onClick={handleLogout}
+                        data-testid="logout"
                         style={{ display: 'flex', alignItems: 'center', gap: '0.5rem', padding: '0.5rem 1rem', borderRadius: '0.375rem', border: '1px solid #e5e7eb', background: 'white', cursor: 'pointer' }}
                     >
                         <Icons.Logout /> Sair
@@ -190,7 +271,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Arrecadação Total (Pago)</span>
                             <div style={{ color: '#10b981' }}><Icons.Money /></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>R$ {stats.total.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-total">R$ {stats.total.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -198,7 +279,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Arrecadação Hoje</span>
                             <div style={{ color: '#10b981' }}><Icons.Clock /></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>R$ {stats.todayTotal.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-today">R$ {stats.todayTotal.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -206,7 +287,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Arrecadação Mês</span>
                             <div style={{ color: '#10b981' }}><Icons.Money /></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>R$ {stats.monthTotal.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-month">R$ {stats.monthTotal.toLocaleString('pt-BR', { minimumFractionDigits: 2 })}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -214,7 +295,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Total de Transações</span>
                             <div style={{ color: '#3b82f6' }}><Icons.Users /></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>{stats.count}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-count">{stats.count}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -222,7 +303,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Via PIX</span>
                             <div style={{ color: '#8b5cf6' }}><span style={{ fontSize: '0.875rem', fontWeight: 800 }}>PIX</span></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>{stats.pix}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-pix">{stats.pix}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -230,7 +311,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Via Cartão</span>
                             <div style={{ color: '#f59e0b' }}><span style={{ fontSize: '0.875rem', fontWeight: 800 }}>CARTÃO</span></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>{stats.card}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-card">{stats.card}</div>
                     </div>
 
                     <div style={{ background: 'white', padding: '1.5rem', borderRadius: '0.75rem', boxShadow: '0 1px 3px rgba(0,0,0,0.1)' }}>
@@ -238,7 +319,7 @@ export default function AdminDashboard() {
                             <span style={{ color: '#6b7280', fontSize: '0.875rem' }}>Membros (CPF Único)</span>
                             <div style={{ color: '#ec4899' }}><Icons.Users /></div>
                         </div>
-                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }}>{stats.members}</div>
+                        <div style={{ fontSize: '1.5rem', fontWeight: 800 }} data-testid="stat-members">{stats.members}</div>
                     </div>
                 </div>
 
@@ -265,34 +346,52 @@ export default function AdminDashboard() {
                                         />
                                     </div>
                                 </div>
+                                <select value={statusFilter} onChange={e => setStatusFilter(e.target.value)} style={filterSelectStyle} data-testid="filter-status">
+                                    <option value="">Todos os status</option>
+                                    <option value="paid">Pago</option>
+                                    <option value="pending">Pendente</option>
+                                    <option value="canceled">Cancelado</option>
+                                </select>
+                                <select value={methodFilter} onChange={e => setMethodFilter(e.target.value)} style={filterSelectStyle} data-testid="filter-method">
+                                    <option value="">PIX e Cartão</option>
+                                    <option value="pix">PIX</option>
+                                    <option value="credit_card">Cartão</option>
+                                </select>
+                                <select value={locationFilter} onChange={e => setLocationFilter(e.target.value)} style={filterSelectStyle} data-testid="filter-location">
+                                    <option value="">Todas as unidades</option>
+                                    {LOCATIONS.map(loc => <option key={loc.id} value={loc.id}>{loc.label}</option>)}
+                                </select>
                             </div>
                         </div>
                         <div style={{ display: 'flex', gap: '0.5rem' }}>
-                            <details style={{ position: 'relative' }}>
+                            <details style={{ position: 'relative' }} data-testid="cleanup-menu">
                                 <summary style={{ listStyle: 'none', cursor: 'pointer', padding: '0.5rem 1rem', background: '#f3f4f6', border: '1px solid #e5e7eb', borderRadius: '0.375rem', fontSize: '0.875rem', display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
                                     <Icons.Trash /> Limpar <span style={{ fontSize: '0.7em' }}>▼</span>
                                 </summary>
                                 <div style={{ position: 'absolute', right: 0, top: '100%', marginTop: '0.25rem', background: 'white', border: '1px solid #e5e7eb', borderRadius: '0.375rem', boxShadow: '0 4px 6px -1px rgba(0,0,0,0.1)', zIndex: 10, minWidth: '180px' }}>
                                     <button
                                         onClick={() => cleanupDonations('pending')}
+                                        data-testid="cleanup-pending"
                                         style={{ display: 'block', width: '100%', textAlign: 'left', padding: '0.75rem 1rem', background: 'none', border: 'none', borderBottom: '1px solid #f3f4f6', cursor: 'pointer', fontSize: '0.875rem', color: '#b45309' }}
                                     >
                                         Apagar Pendentes
                                     </button>
                                     <button
                                         onClick={() => cleanupDonations('canceled')}
+                                        data-testid="cleanup-canceled"
                                         style={{ display: 'block', width: '100%', textAlign: 'left', padding: '0.75rem 1rem', background: 'none', border: 'none', cursor: 'pointer', fontSize: '0.875rem', color: '#991b1b' }}
                                     >
                                         Apagar Cancelados
                                     </button>
                                 </div>
                             </details>
-                            <button onClick={fetchDonations} style={{ fontSize: '0.875rem', color: '#3b82f6', background: 'none', border: 'none', cursor: 'pointer' }}>Atualizar</button>
+                            <button onClick={exportCsv} style={{ fontSize: '0.875rem', color: '#3b82f6', background: 'none', border: 'none', cursor: 'pointer' }} data-testid="export-csv">Exportar CSV</button>
+                            <button onClick={fetchDonations} style={{ fontSize: '0.875rem', color: '#3b82f6', background: 'none', border: 'none', cursor: 'pointer' }} data-testid="refresh">Atualizar</button>
                         </div>
                     </div>
 
                     <div style={{ overflowX: 'auto' }}>
-                        <table style={{ width: '100%', borderCollapse: 'collapse', textAlign: 'left', minWidth: '800px' }}>
+                        <table style={{ width: '100%', borderCollapse: 'collapse', textAlign: 'left', minWidth: '800px' }} data-testid="donations-table">
                             <thead style={{ background: '#f9fafb' }}>
                                 <tr>
                                     <th style={{ padding: '0.75rem 1.5rem', fontSize: '0.75rem', fontWeight: 600, color: '#6b7280', textTransform: 'uppercase' }}>Data/Hora</th>
@@ -304,8 +403,8 @@ export default function AdminDashboard() {
                                 </tr>
                             </thead>
                             <tbody style={{ fontSize: '0.875rem', color: '#111827' }}>
-                                {paginatedDonations.map((d) => (
-                                    <tr key={d.id} style={{ borderBottom: '1px solid #f3f4f6' }}>
+                                {donations.map((d) => (
+                                    <tr key={d.id} style={{ borderBottom: '1px solid #f3f4f6' }} data-testid="donation-row" data-status={d.status}>
                                         <td style={{ padding: '1rem 1.5rem' }}>
                                             <div style={{ fontWeight: 500 }}>{new Date(d.created_at).toLocaleDateString('pt-BR')}</div>
                                             <div style={{ color: '#6b7280', fontSize: '0.75rem' }}>{new Date(d.created_at).toLocaleTimeString('pt-BR')}</div>
@@ -342,7 +441,7 @@ export default function AdminDashboard() {
                                         </td>
                                     </tr>
                                 ))}
-                                {filteredDonations.length === 0 && (
+                                {donations.length === 0 && (
                                     <tr>
                                         <td colSpan={6} style={{ padding: '3rem', textAlign: 'center', color: '#6b7280' }}>
                                             Nenhuma doação encontrada neste período.
@@ -355,20 +454,22 @@ export default function AdminDashboard() {
                     {/* Pagination Controls */}
                     <div style={{ padding: '1rem 1.5rem', display: 'flex', justifyContent: 'space-between', alignItems: 'center', borderTop: '1px solid #e5e7eb' }}>
                         <div style={{ fontSize: '0.875rem', color: '#6b7280' }}>
-                            Mostrando {filteredDonations.length > 0 ? (currentPage - 1) * itemsPerPage + 1 : 0} até {Math.min(currentPage * itemsPerPage, filteredDonations.length)} de {filteredDonations.length} resultados
+                            Mostrando {donations.length > 0 ? (currentPage - 1) * itemsPerPage + 1 : 0} até {(currentPage - 1) * itemsPerPage + donations.length}{totalResults !== null ? ` de ~${totalResults}` : ''} resultados
                         </div>
                         <div style={{ display: 'flex', gap: '0.5rem' }}>
                             <button
-                                onClick={() => handlePageChange(currentPage - 1)}
+                                onClick={goToPreviousPage}
+                                data-testid="page-prev"
                                 disabled={currentPage === 1}
                                 style={{ padding: '0.375rem 0.75rem', border: '1px solid #d1d5db', background: 'white', borderRadius: '0.375rem', cursor: currentPage === 1 ? 'not-allowed' : 'pointer', opacity: currentPage === 1 ? 0.5 : 1 }}
                             >
                                 Anterior
                             </button>
                             <button
-                                onClick={() => handlePageChange(currentPage + 1)}
-                                disabled={currentPage === totalPages || totalPages === 0}
-                                style={{ padding: '0.375rem 0.75rem', border: '1px solid #d1d5db', background: 'white', borderRadius: '0.375rem', cursor: currentPage === totalPages || totalPages === 0 ? 'not-allowed' : 'pointer', opacity: currentPage === totalPages || totalPages === 0 ? 0.5 : 1 }}
+                                onClick={goToNextPage}
+                                data-testid="page-next"
+                                disabled={!nextCursor}
+                                style={{ padding: '0.375rem 0.75rem', border: '1px solid #d1d5db', background: 'white', borderRadius: '0.375rem', cursor: !nextCursor ? 'not-allowed' : 'pointer', opacity: !nextCursor ? 0.5 : 1 }}
                             >
                                 Próxima
                             </button>
@@ -3,6 +3,7 @@
 import { useState } from 'react';
 import { supabase } from '@/lib/supabase';
 import { useRouter } from 'next/navigation';
+import ResponsiveImage from '@/app/components/ResponsiveImage';
 
 export default function AdminLogin() {
     const [email, setEmail] = useState('');
@@ -55,7 +56,7 @@ export default function AdminLogin() {
                 maxWidth: '400px'
             }}>
                 <div style={{ textAlign: 'center', marginBottom: '2rem' }}>
-                    <img src="/logo.png" alt="Chama Church" style={{ height: '60px', margin: '0 auto' }} />
+                    <ResponsiveImage name="logo" alt="Chama Church" sizes="180px" style={{ height: '60px', width: 'auto', margin: '0 auto' }} priority />
                     <h1 style={{ fontSize: '1.5rem', fontWeight: 'bold', marginTop: '1rem', color: '#111' }}>Painel Administrativo</h1>
                     <p style={{ color: '#666' }}>Entre para gerenciar contribuições</p>
                 </div>
@@ -69,6 +70,7 @@ export default function AdminLogin() {
                             type="email"
                             value={email}
                             onChange={(e) => setEmail(e.target.value)}
+                            data-testid="admin-email"
                             required
                             style={{
                                 width: '100%',
@@ -89,6 +91,7 @@ export default function AdminLogin() {
                             type="password"
                             value={password}
                             onChange={(e) => setPassword(e.target.value)}
+                            data-testid="admin-password"
                             required
                             style={{
                                 width: '100%',
@@ -110,7 +113,7 @@ export default function AdminLogin() {
                             borderRadius: '0.5rem',
                             fontSize: '0.875rem',
                             textAlign: 'center'
-                        }}>
+                        }} data-testid="admin-login-error">
                             {error}
                         </div>
                     )}
@@ -118,6 +121,7 @@ export default function AdminLogin() {
                     <button
                         type="submit"
                         disabled={loading}
+                        data-testid="admin-login"
                         style={{
                             backgroundColor: '#000',
                             color: 'white',
@@ -0,0 +1,117 @@
+import { NextResponse } from 'next/server';
+import { getAdminClient, getAdminClientForToken } from '@/lib/supabase';
+import {
+    applyCursor,
+    applyDonationFilters,
+    DonationCursor,
+    DonationFilters,
+    orderForKeyset,
+    parseDonationFilters
+} from '@/lib/donationsQuery';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+// Rows fetched per Supabase round trip; the server only ever holds one chunk
+const CHUNK_SIZE = 1000;
+
+const COLUMNS: [string, string][] = [
+    ['id', 'ID'],
+    ['created_at', 'Data/Hora (UTC)'],
+    ['payer_name', 'Doador'],
+    ['payer_cpf', 'CPF'],
+    ['payer_email', 'Email'],
+    ['payer_phone', 'Telefone'],
+    ['amount', 'Valor'],
+    ['type', 'Tipo'],
+    ['church_location', 'Local'],
+    ['payment_method', 'Método'],
+    ['status', 'Status'],
+    ['pagbank_order_id', 'ID Mercado Pago']
+];
+
+// Excel pt-BR expects ";" separators and decimal commas
+function csvField(key: string, value: any): string {
+    if (value === null || value === undefined) return '';
+    let text = key === 'amount' ? Number(value).toFixed(2).replace('.', ',') : String(value);
+    // Donor-typed text must not be evaluated as a spreadsheet formula
+    if (key !== 'amount' && /^[=+\-@\t\r]/.test(text)) text = `'${text}`;
+    return /[";\n\r]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function csvRow(row: any): string {
+    return COLUMNS.map(([key]) => csvField(key, row[key])).join(';') + '\r\n';
+}
+
+function exportStream(client: any, filters: DonationFilters) {
+    const encoder = new TextEncoder();
+    let cursor: DonationCursor | null = null;
+    let started = false;
+
+    // pull() runs only when the client has drained the previous chunk, so a
+    // slow download pauses the Supabase reads instead of buffering them
+    return new ReadableStream<Uint8Array>({
+        async pull(controller) {
+            try {
+                if (!started) {
+                    started = true;
+                    // BOM so Excel detects UTF-8 (accents in names and locations)
+                    controller.enqueue(encoder.encode('\uFEFF' + COLUMNS.map(([, label]) => label).join(';') + '\r\n'));
+                    return;
+                }
+
+                let query = client.from('donations').select(COLUMNS.map(([key]) => key).join(','));
+                query = applyDonationFilters(query, filters);
+                query = applyCursor(query, cursor);
+                const { data, error } = await orderForKeyset(query).limit(CHUNK_SIZE);
+                if (error) throw error;
+
+                if (data.length > 0) {
+                    controller.enqueue(encoder.encode(data.map(csvRow).join('')));
+                    const last = data[data.length - 1];
+                    cursor = { createdAt: last.created_at, id: last.id.toString() };
+                }
+                if (data.length < CHUNK_SIZE) controller.close();
+            } catch (error) {
+                logger.error('Donations Export Error:', error);
+                controller.error(error);
+            }
+        }
+    }, { highWaterMark: 1 });
+}
+
+function csvResponse(client: any, filters: DonationFilters) {
+    const date = new Date().toISOString().slice(0, 10);
+    return new Response(exportStream(client, filters), {
+        headers: {
+            'Content-Type': 'text/csv; charset=utf-8',
+            'Content-Disposition': `attachment; filename="contribuicoes_${date}.csv"`,
+            'Cache-Control': 'private, no-store'
+        }
+    });
+}
+
+// GET /api/admin/donations/export?start=&end=&status=&method=&location=
+// with "Authorization: Bearer <jwt>" (scripts, curl)
+export const GET = instrumented('/api/admin/donations/export', async (request: Request) => {
+    const client = await getAdminClient(request);
+    if (!client) {
+        return NextResponse.json({ error: 'Não autorizado' }, { status: 401 });
+    }
+    return csvResponse(client, parseDonationFilters(new URL(request.url).searchParams));
+});
+
+// Form POST from the dashboard: a plain form submission lets the browser
+// stream the download to disk, and keeps the token out of the URL
+export const POST = instrumented('/api/admin/donations/export', async (request: Request) => {
+    const form = await request.formData();
+    const client = await getAdminClientForToken(form.get('access_token')?.toString());
+    if (!client) {
+        return NextResponse.json({ error: 'Não autorizado' }, { status: 401 });
+    }
+
+    const params = new URLSearchParams();
+    for (const [key, value] of form.entries()) {
+        if (key !== 'access_token' && typeof value === 'string') params.set(key, value);
+    }
+    return csvResponse(client, parseDonationFilters(params));
+});
@@ -0,0 +1,66 @@
+import { NextResponse } from 'next/server';
+import { getAdminClient } from '@/lib/supabase';
+import {
+    applyCursor,
+    applyDonationFilters,
+    decodeCursor,
+    encodeCursor,
+    orderForKeyset,
+    parseDonationFilters
+} from '@/lib/donationsQuery';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+const DEFAULT_LIMIT = 10;
+const MAX_LIMIT = 100;
+
+// GET /api/admin/donations?limit=10&cursor=...&start=&end=&status=&method=&location=
+// One page of donations, newest first. Pass back nextCursor to get the next page.
+export const GET = instrumented('/api/admin/donations', async (request: Request) => {
+    try {
+        const client = await getAdminClient(request);
+        if (!client) {
+            return NextResponse.json({ error: 'Não autorizado' }, { status: 401 });
+        }
+
+        const { searchParams } = new URL(request.url);
+        const limit = Math.min(Math.max(parseInt(searchParams.get('limit') || '', 10) || DEFAULT_LIMIT, 1), MAX_LIMIT);
+        const filters = parseDonationFilters(searchParams);
+
+        const rawCursor = searchParams.get('cursor');
+        const cursor = decodeCursor(rawCursor);
+        if (rawCursor && !cursor) {
+            return NextResponse.json({ error: 'Cursor inválido' }, { status: 400 });
+        }
+
+        // The planner's estimate is enough for "de ~N resultados" and stays
+        // cheap on large tables; only asked for on the first page.
+        let query = client
+            .from('donations')
+            .select('*', cursor ? undefined : { count: 'estimated' });
+        query = applyDonationFilters(query, filters);
+        query = applyCursor(query, cursor);
+        // One extra row tells whether there is a next page
+        query = orderForKeyset(query).limit(limit + 1);
+
+        const { data, error, count } = await query;
+        if (error) throw error;
+
+        const rows = data || [];
+        const hasMore = rows.length > limit;
+        const donations = hasMore ? rows.slice(0, limit) : rows;
+
+        return NextResponse.json({
+            donations,
+            nextCursor: hasMore ? encodeCursor(donations[donations.length - 1]) : null,
+            ...(cursor ? {} : { total: count ?? null })
+        }, { headers: { 'Cache-Control': 'private, no-store' } });
+
+    } catch (error: any) {
+        logger.error('Admin Donations Error:', error);
+        return NextResponse.json(
+            { error: error.message || 'Internal Server Error' },
+            { status: 500 }
+        );
+    }
+});
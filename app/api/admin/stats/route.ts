@@ -0,0 +1,48 @@
+import { NextResponse } from 'next/server';
+import { getAdminClient } from '@/lib/supabase';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+// GET /api/admin/stats?todayStart=<ISO>&monthStart=<ISO>
+// Summary numbers for the dashboard cards, aggregated in Postgres.
+export const GET = instrumented('/api/admin/stats', async (request: Request) => {
+    try {
+        const client = await getAdminClient(request);
+        if (!client) {
+            return NextResponse.json({ error: 'Não autorizado' }, { status: 401 });
+        }
+
+        const { searchParams } = new URL(request.url);
+        const todayStart = new Date(searchParams.get('todayStart') || '');
+        const monthStart = new Date(searchParams.get('monthStart') || '');
+
+        if (isNaN(todayStart.getTime()) || isNaN(monthStart.getTime())) {
+            return NextResponse.json({ error: 'todayStart and monthStart must be ISO dates' }, { status: 400 });
+        }
+
+        const { data, error } = await client.rpc('admin_donation_stats', {
+            today_start: todayStart.toISOString(),
+            month_start: monthStart.toISOString()
+        });
+
+        // Signed in, but not listed in admin_users
+        if (error?.code === '42501') {
+            return NextResponse.json({ error: 'Não autorizado' }, { status: 403 });
+        }
+        if (error) throw error;
+
+        // Normalize in case sums arrive as strings (numeric/text amount columns)
+        const stats = Object.fromEntries(
+            Object.entries(data as Record<string, any>).map(([key, value]) => [key, Number(value)])
+        );
+
+        return NextResponse.json(stats, { headers: { 'Cache-Control': 'private, no-store' } });
+
+    } catch (error: any) {
+        logger.error('Admin Stats Error:', error);
+        return NextResponse.json(
+            { error: error.message || 'Internal Server Error' },
+            { status: 500 }
+        );
+    }
+});
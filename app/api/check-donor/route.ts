@@ -1,55 +1,40 @@
 import { NextResponse } from 'next/server';
-import { supabase } from '@/lib/supabase';
+import { lookupDonor } from '@/lib/donors';
+import { isValidCPF } from '@/lib/validation';
+import { instrumented, observeStage } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
 
-export async function POST(request: Request) {
+export const POST = instrumented('/api/check-donor', async (request: Request) => {
     try {
         const { cpf } = await request.json();
 
         if (!cpf) {
-            return NextResponse.json({ error: 'CPF is required' }, { status: 400 });
+            return NextResponse.json({ error: 'Campo obrigatório ausente: cpf', field: 'cpf' }, { status: 400 });
         }
 
-        // Clean CPF just in case
-        const cleanCpf = cpf.replace(/\D/g, '');
-
-        // Fetch the most recent donation from this CPF
-        const { data, error } = await supabase
-            .from('donations')
-            .select('payer_name, payer_email, payer_phone')
-            .eq('payer_cpf', cleanCpf)
-            .order('created_at', { ascending: false })
-            .limit(1)
-            .single();
-
-        if (error) {
-            // PGRST116 means no rows found, which is fine, just return exists: false
-            if (error.code === 'PGRST116') {
-                return NextResponse.json({ exists: false });
-            }
-            throw error;
+        // /api/donate never stores an invalid CPF, so there is nothing to look up
+        const validationStart = performance.now();
+        const valid = isValidCPF(cpf);
+        observeStage('validation', 'cpf', validationStart, valid ? 'ok' : 'invalid');
+        if (!valid) {
+            return NextResponse.json({ exists: false });
         }
 
-        if (data) {
-            // Filter out legacy PagBank sandbox emails
-            const email = data.payer_email === 'comprador@sandbox.pagseguro.com.br' ? '' : data.payer_email;
+        // Clean CPF just in case
+        const cleanCpf = cpf.replace(/\D/g, '');
 
-            return NextResponse.json({
-                exists: true,
-                donor: {
-                    name: data.payer_name,
-                    email: email,
-                    phone: data.payer_phone
-                }
-            });
+        const donor = await lookupDonor(cleanCpf);
+        if (!donor) {
+            return NextResponse.json({ exists: false });
         }
 
-        return NextResponse.json({ exists: false });
+        return NextResponse.json({ exists: true, donor });
 
     } catch (error: any) {
-        console.error('Check Donor Error:', error);
+        logger.error('Check Donor Error:', error);
         return NextResponse.json(
             { error: error.message || 'Internal Server Error' },
             { status: 500 }
         );
     }
-}
+});
@@ -0,0 +1,96 @@
+import { NextResponse } from 'next/server';
+import { getPaymentStatus, mapPaymentStatus } from '@/lib/mercadopago';
+import { supabase } from '@/lib/supabase';
+import { TTLCache } from '@/lib/cache';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+// Upper bounds per request: ids accepted and MP calls in flight at once
+const MAX_IDS = 100;
+const MP_CONCURRENCY = 5;
+
+// Final status this instance already wrote per payment id. Polling answers
+// those from the status cache; writing them again on every poll would only
+// add UPDATEs under the load the cache is there to absorb.
+const STORED_STATUS_TTL_MS = 24 * 60 * 60 * 1000;
+const storedStatuses = new TTLCache<string>(5000, STORED_STATUS_TTL_MS, 'batch_stored_statuses');
+
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+    const results: R[] = new Array(items.length);
+    let next = 0;
+    const worker = async () => {
+        while (next < items.length) {
+            const index = next++;
+            results[index] = await fn(items[index]);
+        }
+    };
+    await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+    return results;
+}
+
+// Resolves many payment ids at once (history and admin views) and returns
+// { results: { [id]: { status, status_detail, donation_status } | { error } } }
+export const POST = instrumented('/api/check-status/batch', async (request: Request) => {
+    try {
+        const { ids } = await request.json();
+
+        if (!Array.isArray(ids) || ids.length === 0) {
+            return NextResponse.json({ error: 'Payment IDs are required' }, { status: 400 });
+        }
+        if (ids.length > MAX_IDS) {
+            return NextResponse.json({ error: `At most ${MAX_IDS} payment IDs per request` }, { status: 400 });
+        }
+
+        const uniqueIds: string[] = Array.from(new Set(ids.filter(Boolean).map((id: any) => id.toString())));
+
+        const resolved = await mapWithConcurrency(uniqueIds, MP_CONCURRENCY, async (id) => {
+            try {
+                const payment = await getPaymentStatus(id);
+                return {
+                    id,
+                    status: payment.status,
+                    status_detail: payment.status_detail,
+                    donation_status: mapPaymentStatus(payment.status)
+                };
+            } catch (error: any) {
+                logger.error(`Batch Check Status Error (${id}):`, error);
+                return { id, error: error.message || 'Failed to fetch payment' };
+            }
+        });
+
+        // One UPDATE ... WHERE pagbank_order_id IN (...) per final status
+        // (at most three statements) instead of one update per donation
+        const idsByStatus: Record<string, string[]> = {};
+        for (const result of resolved) {
+            if ('donation_status' in result && result.donation_status !== 'pending'
+                && storedStatuses.get(result.id) !== result.donation_status) {
+                (idsByStatus[result.donation_status!] ||= []).push(result.id);
+            }
+        }
+
+        await Promise.all(Object.entries(idsByStatus).map(async ([status, statusIds]) => {
+            const { error } = await supabase
+                .from('donations')
+                .update({ status })
+                .in('pagbank_order_id', statusIds)
+                .neq('status', status);
+            if (error) {
+                logger.error(`Batch status update (${status}) failed:`, error);
+                return;
+            }
+            statusIds.forEach(id => storedStatuses.set(id, status));
+        }));
+
+        const results: Record<string, any> = {};
+        for (const { id, ...result } of resolved) results[id] = result;
+
+        return NextResponse.json({ results });
+
+    } catch (error: any) {
+        logger.error('Batch Check Status Error:', error);
+        return NextResponse.json(
+            { error: error.message || 'Internal Server Error' },
+            { status: 500 }
+        );
+    }
+});
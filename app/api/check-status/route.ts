@@ -1,8 +1,10 @@
 import { NextResponse } from 'next/server';
-import { getPayment } from '@/lib/mercadopago';
+import { getPaymentStatus, mapPaymentStatus, paymentStatusCache } from '@/lib/mercadopago';
 import { supabase } from '@/lib/supabase';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
 
-export async function POST(request: Request) {
+export const POST = instrumented('/api/check-status', async (request: Request) => {
     try {
         const { id } = await request.json();
 
@@ -10,23 +12,27 @@ export async function POST(request: Request) {
             return NextResponse.json({ error: 'Payment ID is required' }, { status: 400 });
         }
 
-        const payment = await getPayment(id);
-
-        // Map status
-        let status = 'pending';
-        if (payment.status === 'approved') status = 'paid';
-        else if (payment.status === 'rejected') status = 'declined';
-        else if (payment.status === 'cancelled') status = 'canceled';
-        else if (payment.status === 'in_process') status = 'pending';
+        // Served from the in-process cache when possible; the Supabase sync
+        // below only runs when MP was actually queried.
+        let syncFailed = false;
+        const payment = await getPaymentStatus(id, async (fresh) => {
+            // Update in Supabase if status changed to paid
+            // We can do an optimistic update here to ensure DB is consistent
+            if (mapPaymentStatus(fresh.status) === 'paid') {
+                const { error } = await supabase
+                    .from('donations')
+                    .update({ status: 'paid' })
+                    .eq('pagbank_order_id', id.toString());
+                if (error) {
+                    logger.error('Check Status sync failed:', error);
+                    syncFailed = true;
+                }
+            }
+        });
 
-        // Update in Supabase if status changed to paid
-        // We can do an optimistic update here to ensure DB is consistent
-        if (status === 'paid') {
-            await supabase
-                .from('donations')
-                .update({ status: 'paid' })
-                .eq('pagbank_order_id', id.toString());
-        }
+        // A final status would be served from the cache from now on and the
+        // write-back never retried: drop it so the next poll queries MP again
+        if (syncFailed) paymentStatusCache.delete(id.toString());
 
         return NextResponse.json({
             id: payment.id,
@@ -35,10 +41,15 @@ export async function POST(request: Request) {
         });
 
     } catch (error: any) {
-        console.error('Check Status Error:', error);
+        logger.error('Check Status Error:', error);
         return NextResponse.json(
             { error: error.message || 'Internal Server Error' },
             { status: 500 }
         );
     }
+});
+
+// Cache counters for this instance: how many status checks never reached MP
+export async function GET() {
+    return NextResponse.json({ cache: paymentStatusCache.stats() });
 }
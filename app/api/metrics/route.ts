@@ -0,0 +1,36 @@
+import { timingSafeEqual } from 'crypto';
+import { renderMetrics } from '@/lib/metrics';
+import { donationQueueStats } from '@/lib/donationQueue';
+
+// Prometheus scrape endpoint for this instance. The scraper must send
+// "Authorization: Bearer <METRICS_TOKEN>"; without METRICS_TOKEN the endpoint
+// is only open outside production.
+function authorized(request: Request) {
+    const expected = process.env.METRICS_TOKEN;
+    if (!expected) return process.env.NODE_ENV !== 'production';
+    const received = Buffer.from(request.headers.get('authorization')?.replace(/^Bearer\s+/i, '') || '');
+    const wanted = Buffer.from(expected);
+    return received.length === wanted.length && timingSafeEqual(received, wanted);
+}
+
+export async function GET(request: Request) {
+    if (!authorized(request)) {
+        return new Response('Não autorizado', { status: 401 });
+    }
+
+    const queue = donationQueueStats();
+    const body = renderMetrics([
+        { name: 'chamachurch_donation_queue_inserted_total', help: 'Donation rows stored by the write-behind queue', value: queue.rowsInserted },
+        { name: 'chamachurch_donation_queue_quarantined_total', help: 'Donation rows the database rejected, moved to the queue dead/ directory', value: queue.rowsQuarantined },
+        { name: 'chamachurch_donation_queue_unsaved_total', help: 'Donation rows neither the queue disk nor the database accepted at request time', value: queue.rowsUnsaved },
+        { name: 'chamachurch_donation_queue_memory_rows', help: 'Donation rows held in memory until the next flush', value: queue.rowsInMemory },
+        { name: 'chamachurch_donation_queue_failures', help: 'Consecutive failed queue flushes (0 = healthy)', value: queue.consecutiveFailures }
+    ]);
+
+    return new Response(body, {
+        headers: {
+            'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+            'Cache-Control': 'no-store'
+        }
+    });
+}
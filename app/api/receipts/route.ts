@@ -0,0 +1,75 @@
+import { NextResponse } from 'next/server';
+import { supabase } from '@/lib/supabase';
+import { getOrCreateReceipt } from '@/lib/receipts';
+import { findQueuedDonation } from '@/lib/donationQueue';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+// POST { donationId } or { paymentId } (the Mercado Pago id the wizard knows)
+// -> { shortId, downloadUrl }; the short link is /c/<shortId> on the app's origin
+export const POST = instrumented('/api/receipts', async (request: Request) => {
+    try {
+        const { donationId, paymentId } = await request.json();
+
+        if (!donationId && !paymentId) {
+            return NextResponse.json({ error: 'ID da doação é obrigatório' }, { status: 400 });
+        }
+
+        // Right after a payment the row may still be in the write-behind queue;
+        // it already holds everything the receipt prints (created_at included)
+        let donation: any = donationId ? null : findQueuedDonation(paymentId.toString());
+
+        if (!donation) {
+            let query = supabase
+                .from('donations')
+                .select('id, created_at, status, church_location, payer_name, payer_cpf, type, amount, pagbank_order_id');
+            query = donationId
+                ? query.eq('id', donationId)
+                : query.eq('pagbank_order_id', paymentId.toString());
+
+            const { data, error } = await query.limit(1).maybeSingle();
+            if (error) throw error;
+            donation = data;
+        }
+        if (!donation) {
+            return NextResponse.json({ error: 'Doação não encontrada' }, { status: 404 });
+        }
+        // A receipt confirms the money arrived: pending, declined and canceled donations get none
+        if (donation.status !== 'paid') {
+            return NextResponse.json(
+                { error: 'O comprovante só fica disponível após a confirmação do pagamento' },
+                { status: 409 }
+            );
+        }
+
+        // Older rows may lack the payer's name: print the member's latest one, as /historico did
+        const memberName = donation.payer_name ? null : await latestDonorName(donation.payer_cpf);
+        const receipt = await getOrCreateReceipt(donation, memberName);
+
+        const date = new Date(donation.created_at).toISOString().split('T')[0];
+        const { data: publicData } = supabase
+            .storage
+            .from('receipts')
+            .getPublicUrl(receipt.storagePath, { download: `recibo_${date}.pdf` });
+
+        return NextResponse.json({
+            shortId: receipt.shortId,
+            downloadUrl: publicData.publicUrl,
+            cached: receipt.cached
+        });
+
+    } catch (error: any) {
+        logger.error('Receipt Error:', error);
+        return NextResponse.json(
+            { error: error.message || 'Internal Server Error' },
+            { status: 500 }
+        );
+    }
+});
+
+async function latestDonorName(cpf: string | null) {
+    const digits = (cpf || '').replace(/\D/g, '');
+    if (!digits) return null;
+    const { data } = await supabase.rpc('lookup_donor', { donor_cpf: digits }).maybeSingle();
+    return (data as any)?.name || null;
+}
@@ -0,0 +1,64 @@
+import { NextResponse } from 'next/server';
+import { cachePaymentStatus, getPayment, mapPaymentStatus, verifyWebhookSignature } from '@/lib/mercadopago';
+import { supabase } from '@/lib/supabase';
+import { instrumented } from '@/lib/metrics';
+import { logger } from '@/lib/logger';
+
+// Mercado Pago payment notifications. The notification body is only a hint:
+// the payment is re-read from MP before donations.status is touched, so a
+// forged or replayed call cannot mark a donation as paid.
+export const POST = instrumented('/api/webhooks/mercadopago', async (request: Request) => {
+    try {
+        const url = new URL(request.url);
+        const body = await request.json().catch(() => ({}));
+
+        // Webhooks send ?type=payment&data.id=..., legacy IPN sends ?topic=payment&id=...
+        const type = body.type || url.searchParams.get('type') || url.searchParams.get('topic');
+        const dataId = url.searchParams.get('data.id') || body.data?.id?.toString() || url.searchParams.get('id');
+
+        if (type !== 'payment' || !dataId) {
+            // Other topics (merchant_order, chargebacks...) are acknowledged and ignored
+            return NextResponse.json({ received: true });
+        }
+
+        const secret = process.env.MP_WEBHOOK_SECRET;
+        if (secret) {
+            const valid = verifyWebhookSignature(
+                request.headers.get('x-signature'),
+                request.headers.get('x-request-id'),
+                dataId,
+                secret
+            );
+            if (!valid) {
+                return NextResponse.json({ error: 'Invalid signature' }, { status: 401 });
+            }
+        } else {
+            logger.warn('MP_WEBHOOK_SECRET not set, accepting unsigned notification');
+        }
+
+        const payment = await getPayment(dataId);
+        const status = mapPaymentStatus(payment.status);
+        // Fresh from MP, so /api/check-status can answer without another call
+        cachePaymentStatus(payment);
+
+        // MP retries and sends several events per payment; only write when the
+        // status actually changes so Realtime subscribers get a single event.
+        const { error } = await supabase
+            .from('donations')
+            .update({ status })
+            .eq('pagbank_order_id', dataId)
+            .neq('status', status);
+
+        if (error) throw error;
+
+        return NextResponse.json({ received: true, status });
+
+    } catch (error: any) {
+        logger.error('MP Webhook Error:', error);
+        // A 5xx makes MP retry the notification later
+        return NextResponse.json(
+            { error: error.message || 'Internal Server Error' },
+            { status: 500 }
+        );
+    }
+});
@@ -1,31 +1,53 @@
 import { NextResponse } from 'next/server';
 import { supabase } from '@/lib/supabase';
+import { TTLCache } from '@/lib/cache';
+import { instrumented } from '@/lib/metrics';
 
-export async function GET(request: Request, props: { params: Promise<{ id: string }> }) {
+// short_id -> storage_path never changes once written, so found ids stay
+// cached until LRU eviction. Unknown ids (null) are remembered briefly so
+// scans and typos don't each hit the database.
+const NOT_FOUND_TTL_MS = 60_000;
+const receiptPaths = new TTLCache<string | null>(10_000, NOT_FOUND_TTL_MS, 'receipt_paths');
+
+export const GET = instrumented('/c/[id]', async (request: Request, props: { params: Promise<{ id: string }> }) => {
     const params = await props.params;
     const id = params.id;
 
     try {
         // Buscar o caminho do arquivo pelo ID curto
-        const { data, error } = await supabase
-            .from('receipts_log')
-            .select('storage_path')
-            .eq('short_id', id)
-            .single();
+        const storagePath = await receiptPaths.getOrLoad(id, async () => {
+            const { data, error } = await supabase
+                .from('receipts_log')
+                .select('storage_path')
+                .eq('short_id', id)
+                // Legacy ids can collide; flagged rows lose to the first one
+                .order('duplicate', { ascending: true })
+                .limit(1)
+                .maybeSingle();
+            if (error) throw error;
+            return data?.storage_path ?? null;
+        }, path => path === null ? NOT_FOUND_TTL_MS : Infinity);
 
-        if (error || !data) {
-            return new NextResponse('Comprovante não encontrado', { status: 404 });
+        if (!storagePath) {
+            return new NextResponse('Comprovante não encontrado', {
+                status: 404,
+                headers: { 'Cache-Control': 'public, max-age=60' }
+            });
         }
 
         // Gerar URL pública do Storage
         const { data: publicData } = supabase
             .storage
             .from('receipts')
-            .getPublicUrl(data.storage_path);
+            .getPublicUrl(storagePath);
 
-        // Redirecionar para o PDF real
-        return NextResponse.redirect(publicData.publicUrl);
+        // Redirecionar para o PDF real. The mapping is permanent, so browsers
+        // and CDNs may replay the redirect without asking us again.
+        return NextResponse.redirect(publicData.publicUrl, {
+            status: 301,
+            headers: { 'Cache-Control': 'public, max-age=31536000, immutable' }
+        });
     } catch (err) {
         return new NextResponse('Erro interno', { status: 500 });
     }
-}
+});
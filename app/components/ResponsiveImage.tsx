@@ -0,0 +1,64 @@
+/* eslint-disable @next/next/no-img-element */
+import type { CSSProperties } from 'react';
+import manifest from '@/lib/images.manifest.json';
+
+// Variants built by scripts/build-images.mjs (npm run images, runs before dev/build).
+// Before the first run tsconfig resolves this to the committed
+// lib/images.fallback.json, which lists only the original files.
+interface Variant {
+    src: string;
+    width: number;
+}
+
+interface ImageEntry {
+    width: number;
+    height: number;
+    fallback: string;
+    avif: Variant[];
+    webp: Variant[];
+}
+
+const IMAGES = manifest as Record<string, ImageEntry>;
+
+interface Props {
+    name: string;
+    alt: string;
+    // Rendered width for the browser to pick a variant, e.g. "100vw" or "120px"
+    sizes: string;
+    className?: string;
+    style?: CSSProperties;
+    // Above-the-fold images (the hero): fetched early instead of lazily
+    priority?: boolean;
+}
+
+function srcSet(variants: Variant[]) {
+    return variants.map(v => `${v.src} ${v.width}w`).join(', ');
+}
+
+// <picture> with AVIF and WebP sources at several widths; the original file
+// is the <img> fallback. width/height reserve the space before it loads.
+export default function ResponsiveImage({ name, alt, sizes, className, style, priority = false }: Props) {
+    const image = IMAGES[name];
+    if (!image) {
+        // A name missing from scripts/build-images.mjs: leave the image out instead of failing the page
+        if (process.env.NODE_ENV !== 'production') console.warn(`ResponsiveImage: unknown image "${name}"`);
+        return null;
+    }
+    return (
+        <picture>
+            {image.avif.length > 0 && <source type="image/avif" srcSet={srcSet(image.avif)} sizes={sizes} />}
+            {image.webp.length > 0 && <source type="image/webp" srcSet={srcSet(image.webp)} sizes={sizes} />}
+            <img
+                src={image.fallback}
+                alt={alt}
+                width={image.width}
+                height={image.height}
+                className={className}
+                style={style}
+                loading={priority ? 'eager' : 'lazy'}
+                fetchPriority={priority ? 'high' : 'auto'}
+                decoding="async"
+            />
+        </picture>
+    );
+}
@@ -2,29 +2,67 @@
 
 import { useEffect, useState } from 'react';
 import styles from './splash.module.css';
+import ResponsiveImage from '@/app/components/ResponsiveImage';
+
+const SEEN_KEY = 'chamachurch:splash-seen';
+// Never cover the page longer than this, even if the hero image is slow
+const MAX_SPLASH_MS = 1500;
+const FADE_MS = 300;
+
+// Runs while the HTML is parsed, before first paint: later visits in the
+// same session get html[data-splash="seen"], which hides the splash in CSS
+const SKIP_SCRIPT = `try{if(sessionStorage.getItem('${SEEN_KEY}'))document.documentElement.dataset.splash='seen'}catch(e){}`;
 
 export default function SplashScreen() {
-    const [show, setShow] = useState(true);
-    const [animate, setAnimate] = useState(false);
+    const [phase, setPhase] = useState<'visible' | 'fading' | 'gone'>('visible');
 
     useEffect(() => {
-        // Start exit animation slightly before removing
-        const timer1 = setTimeout(() => setAnimate(true), 2000);
-        const timer2 = setTimeout(() => setShow(false), 2500);
+        if (document.documentElement.dataset.splash === 'seen') {
+            setPhase('gone');
+            return;
+        }
+
+        // Effects run after hydration, so the page is interactive; wait for
+        // the above-the-fold (priority) images to decode so the first frame
+        // after the splash is complete, but no longer than MAX_SPLASH_MS
+        const images = Array.from(document.querySelectorAll<HTMLImageElement>('img[fetchpriority="high"]'))
+            .filter(img => !img.closest('[data-splash]'));
+        const decoded = Promise.all(images.map(img => img.decode().catch(() => undefined)));
+
+        let cancelled = false;
+        let capTimer: ReturnType<typeof setTimeout> | undefined;
+        let fadeTimer: ReturnType<typeof setTimeout> | undefined;
+        const capped = new Promise(resolve => { capTimer = setTimeout(resolve, MAX_SPLASH_MS); });
+
+        Promise.race([decoded, capped]).then(() => {
+            if (cancelled) return;
+            try {
+                sessionStorage.setItem(SEEN_KEY, '1');
+            } catch {
+                // Private mode: the splash simply shows on every full load
+            }
+            setPhase('fading');
+            fadeTimer = setTimeout(() => setPhase('gone'), FADE_MS);
+        });
 
         return () => {
-            clearTimeout(timer1);
-            clearTimeout(timer2);
+            cancelled = true;
+            clearTimeout(capTimer);
+            clearTimeout(fadeTimer);
         };
     }, []);
 
-    if (!show) return null;
+    if (phase === 'gone') return null;
 
     return (
-        <div className={`${styles.container} ${animate ? styles.fadeOut : ''}`}>
+        <div
+            className={`${styles.container} ${phase === 'fading' ? styles.fadeOut : ''}`}
+            data-splash
+            data-testid="splash-screen"
+        >
+            <script dangerouslySetInnerHTML={{ __html: SKIP_SCRIPT }} />
             <div className={styles.logoWrapper}>
-                {/* eslint-disable-next-line @next/next/no-img-element */}
-                <img src="/logo-black.png" alt="Chama Church" className={styles.logo} />
+                <ResponsiveImage name="logo-black" alt="Chama Church" sizes="150px" className={styles.logo} priority />
             </div>
         </div>
     );
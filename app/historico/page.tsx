@@ -3,9 +3,9 @@
 import { useState } from 'react';
 import Link from 'next/link';
 import { supabase } from '@/lib/supabase';
-import { jsPDF } from 'jspdf';
 import styles from './page.module.css';
 import CustomDatePicker from '@/app/components/CustomDatePicker';
+import ResponsiveImage from '@/app/components/ResponsiveImage';
 
 const LOCATIONS = [
     { id: 'central', label: 'Chama Church - Manaus' },
@@ -14,6 +14,9 @@ const LOCATIONS = [
     { id: 'online', label: 'Chama Church On-line' },
 ];
 
+// Ids per /api/check-status/batch request (the endpoint's MAX_IDS)
+const MAX_IDS = 100;
+
 export default function HistoryPage() {
     const [cpf, setCpf] = useState('');
     const [searched, setSearched] = useState(false);
@@ -33,26 +36,30 @@ export default function HistoryPage() {
 
         const updates: Record<string, any> = {};
 
-        await Promise.all(pendingItems.map(async (item) => {
+        // One request per MAX_IDS pending rows; the server checks MP with
+        // bounded concurrency and bulk-updates Supabase
+        const chunks: any[][] = [];
+        for (let i = 0; i < pendingItems.length; i += MAX_IDS) {
+            chunks.push(pendingItems.slice(i, i + MAX_IDS));
+        }
+
+        await Promise.all(chunks.map(async chunk => {
             try {
-                const res = await fetch('/api/check-status', {
+                const res = await fetch('/api/check-status/batch', {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ id: item.pagbank_order_id })
+                    body: JSON.stringify({ ids: chunk.map(item => item.pagbank_order_id) })
                 });
-                const data = await res.json();
+                const { results = {} } = await res.json();
 
-                // Map MP status to our internal status
-                let newStatus = 'pending';
-                if (data.status === 'approved') newStatus = 'paid';
-                else if (data.status === 'rejected') newStatus = 'declined';
-                else if (data.status === 'cancelled') newStatus = 'canceled';
-
-                if (newStatus !== 'pending') {
-                    updates[item.id] = newStatus;
+                for (const item of chunk) {
+                    const newStatus = results[item.pagbank_order_id]?.donation_status;
+                    if (newStatus && newStatus !== 'pending') {
+                        updates[item.id] = newStatus;
+                    }
                 }
             } catch (e) {
-                console.error(`Failed to check status for ${item.id}`, e);
+                console.error('Failed to check pending statuses', e);
             }
         }));
 
@@ -130,48 +137,23 @@ export default function HistoryPage() {
         await fetchHistory(cpf, startDate, endDate);
     };
 
-    const generateReceipt = (item: any) => {
+    // Receipts are rendered once on the server and stored by content hash;
+    // both buttons reuse the same stored PDF
+    const requestReceipt = async (item: any) => {
+        const res = await fetch('/api/receipts', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ donationId: item.id })
+        });
+        const data = await res.json();
+        if (!res.ok) throw new Error(data.error);
+        return data as { shortId: string, downloadUrl: string };
+    };
+
+    const generateReceipt = async (item: any) => {
         try {
-            const doc = new jsPDF();
-
-            // Header
-            doc.setFontSize(22);
-            doc.setFont('helvetica', 'bold');
-            doc.text("CHAMA CHURCH", 105, 20, { align: "center" });
-
-            doc.setFontSize(16);
-            doc.setFont('helvetica', 'normal');
-            doc.text("Comprovante de Contribuição", 105, 30, { align: "center" });
-
-            // Divider
-            doc.setLineWidth(0.5);
-            doc.line(20, 35, 190, 35);
-
-            // Content
-            doc.setFontSize(12);
-            const date = new Date(item.created_at);
-            doc.text(`Data: ${date.toLocaleDateString('pt-BR')} às ${date.toLocaleTimeString('pt-BR')}`, 20, 50);
-            const locationLabel = LOCATIONS.find(l => l.id === item.church_location)?.label || item.church_location || 'Online';
-            doc.text(`Igreja: ${locationLabel}`, 20, 60);
-            doc.text(`Doador: ${item.payer_name || memberName}`, 20, 70);
-            doc.text(`Tipo: ${item.type}`, 20, 80);
-            doc.text(`ID da Transação: ${item.id}`, 20, 90);
-
-            // Amount Box
-            doc.setFillColor(240, 240, 240);
-            doc.rect(20, 100, 170, 20, 'F');
-            doc.setFontSize(14);
-            doc.setFont('helvetica', 'bold');
-            doc.text(`Valor: R$ ${parseFloat(item.amount).toFixed(2).replace('.', ',')}`, 105, 113, { align: "center" });
-
-            // Footer
-            doc.setFontSize(10);
-            doc.setFont('helvetica', 'italic');
-            doc.text("Obrigado por sua generosidade!", 105, 130, { align: "center" });
-            doc.text("Deus abençoe sua vida.", 105, 135, { align: "center" });
-
-            // Save
-            doc.save(`recibo_${date.toISOString().split('T')[0]}.pdf`);
+            const { downloadUrl } = await requestReceipt(item);
+            window.location.href = downloadUrl;
         } catch (error) {
             console.error("Error generating receipt:", error);
             alert("Erro ao baixar comprovante.");
@@ -188,60 +170,7 @@ export default function HistoryPage() {
         }
 
         try {
-            const doc = new jsPDF();
-
-            // Header
-            doc.setFontSize(22);
-            doc.setFont('helvetica', 'bold');
-            doc.text("CHAMA CHURCH", 105, 20, { align: "center" });
-
-            doc.setFontSize(16);
-            doc.setFont('helvetica', 'normal');
-            doc.text("Comprovante de Contribuição", 105, 30, { align: "center" });
-
-            // Divider
-            doc.setLineWidth(0.5);
-            doc.line(20, 35, 190, 35);
-
-            // Content
-            doc.setFontSize(12);
-            const date = new Date(item.created_at);
-            doc.text(`Data: ${date.toLocaleDateString('pt-BR')} às ${date.toLocaleTimeString('pt-BR')}`, 20, 50);
-            const locationLabel = LOCATIONS.find(l => l.id === item.church_location)?.label || item.church_location || 'Online';
-            doc.text(`Igreja: ${locationLabel}`, 20, 60);
-            doc.text(`Doador: ${item.payer_name || memberName}`, 20, 70);
-            doc.text(`Tipo: ${item.type}`, 20, 80);
-            doc.text(`ID da Transação: ${item.id}`, 20, 90);
-
-            // Amount Box
-            doc.setFillColor(240, 240, 240);
-            doc.rect(20, 100, 170, 20, 'F');
-            doc.setFontSize(14);
-            doc.setFont('helvetica', 'bold');
-            doc.text(`Valor: R$ ${parseFloat(item.amount).toFixed(2).replace('.', ',')}`, 105, 113, { align: "center" });
-
-            // Footer
-            doc.setFontSize(10);
-            doc.setFont('helvetica', 'italic');
-            doc.text("Obrigado por sua generosidade!", 105, 130, { align: "center" });
-            doc.text("Deus abençoe sua vida.", 105, 135, { align: "center" });
-
-            // Generate Blob
-            const pdfBlob = doc.output('blob');
-            const fileName = `recibo_${item.id}_${Date.now()}.pdf`;
-
-            // Upload to Supabase
-            const { error } = await supabase.storage
-                .from('receipts')
-                .upload(fileName, pdfBlob, {
-                    contentType: 'application/pdf'
-                });
-
-            if (error) throw error;
-
-            // Short Link
-            const shortId = Math.random().toString(36).substring(2, 8);
-            await supabase.from('receipts_log').insert({ short_id: shortId, storage_path: fileName });
+            const { shortId } = await requestReceipt(item);
 
             const shortLink = `${window.location.origin}/c/${shortId}`;
             const message = `Olá, paz do Senhor! Segue meu comprovante de doação: ${shortLink}`;
@@ -266,8 +195,7 @@ export default function HistoryPage() {
             <header className={styles.header}>
                 <div className={`container ${styles.headerContent}`}>
                     <Link href="/">
-                        {/* eslint-disable-next-line @next/next/no-img-element */}
-                        <img src="/logo.png" alt="Chama Church" className={styles.logoImage} />
+                        <ResponsiveImage name="logo" alt="Chama Church" sizes="120px" className={styles.logoImage} priority />
                     </Link>
                     <Link href="/" className={styles.backLink}>
                         <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
@@ -305,8 +233,9 @@ export default function HistoryPage() {
                                         }
                                         setCpf(value);
                                     }}
+                                    data-testid="history-cpf-input"
                                 />
-                                <button type="submit" className={styles.searchButton} disabled={loading}>
+                                <button type="submit" className={styles.searchButton} disabled={loading} data-testid="history-search">
                                     {loading ? 'Consultando...' : 'Consultar'}
                                 </button>
                             </div>
@@ -318,7 +247,7 @@ export default function HistoryPage() {
                                     <>
                                         <div className={styles.memberInfo}>
                                             <span className={styles.welcomeText}>Olá,</span>
-                                            <h2 className={styles.memberName}>{memberName}</h2>
+                                            <h2 className={styles.memberName} data-testid="history-member-name">{memberName}</h2>
                                         </div>
 
                                         <div style={{ marginBottom: '1.5rem', background: '#f9fafb', padding: '1rem', borderRadius: '0.5rem', border: '1px solid #e5e7eb' }}>
@@ -343,6 +272,7 @@ export default function HistoryPage() {
                                                 <div style={{ display: 'flex', alignItems: 'flex-end', flex: 1 }}>
                                                     <button
                                                         onClick={handleFilter}
+                                                        data-testid="history-filter"
                                                         disabled={loading}
                                                         className={styles.searchButton}
                                                         style={{ height: '42px', padding: '0 1.5rem' }}
@@ -356,6 +286,7 @@ export default function HistoryPage() {
                                                     type="button"
                                                     onClick={() => { setStartDate(''); setEndDate(''); fetchHistory(cpf, '', ''); }}
                                                     className={styles.clearFilters}
+                                                    data-testid="history-clear-filters"
                                                 >
                                                     Limpar filtros
                                                 </button>
@@ -363,7 +294,7 @@ export default function HistoryPage() {
                                         </div>
                                         <div className={styles.historyList}>
                                             {history.map((item) => (
-                                                <div key={item.id} className={styles.historyItem}>
+                                                <div key={item.id} className={styles.historyItem} data-testid="history-item" data-status={item.status}>
                                                     <div className={styles.itemLeft}>
                                                         <span className={styles.itemType}>{item.type || 'Contribuição'}</span>
                                                         <span style={{ fontSize: '0.85rem', color: '#666', marginTop: '0.2rem' }}>
@@ -384,6 +315,7 @@ export default function HistoryPage() {
                                                                     onClick={() => generateReceipt(item)}
                                                                     className={styles.downloadButton}
                                                                     title="Baixar PDF"
+                                                                    data-testid="history-download"
                                                                 >
                                                                     <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round">
                                                                         <path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4" />
@@ -395,6 +327,7 @@ export default function HistoryPage() {
                                                                     onClick={() => shareReceipt(item)}
                                                                     className={styles.downloadButton}
                                                                     title="Enviar por WhatsApp"
+                                                                    data-testid="history-share"
                                                                     disabled={sharingId === item.id}
                                                                 >
                                                                     {sharingId === item.id ? (
@@ -414,7 +347,7 @@ export default function HistoryPage() {
                                         </div>
                                     </>
                                 ) : (
-                                    <div style={{ textAlign: 'center', padding: '2rem 1rem', color: '#666' }}>
+                                    <div style={{ textAlign: 'center', padding: '2rem 1rem', color: '#666' }} data-testid="history-empty">
                                         <div style={{ marginBottom: '1rem', color: '#9ca3af' }}>
                                             <svg xmlns="http://www.w3.org/2000/svg" width="48" height="48" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="1" strokeLinecap="round" strokeLinejoin="round">
                                                 <circle cx="12" cy="12" r="10" />
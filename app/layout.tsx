@@ -24,10 +24,8 @@ export default function RootLayout({
   children: React.ReactNode
 }) {
   return (
-    <html lang="pt-BR">
-      <head>
-        <script src="https://sdk.mercadopago.com/js/v2" async></script>
-      </head>
+    // SplashScreen's inline script may set data-splash before hydration
+    <html lang="pt-BR" suppressHydrationWarning>
       <body className={`${inter.variable} ${outfit.variable} ${wondra.variable}`}>
         <SplashScreen />
         {children}
@@ -1,11 +1,12 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import Link from 'next/link';
 import styles from './page.module.css';
-import { jsPDF } from 'jspdf';
 import { supabase } from '@/lib/supabase';
-import { isValidCPF } from '@/lib/validation';
+import ResponsiveImage from '@/app/components/ResponsiveImage';
+import { isValidCPF, validateAmount, validateCustomer } from '@/lib/validation';
+import { loadMercadoPagoSdk } from '@/lib/mercadopagoSdk';
 
 // SVG Icons
 const Icons = {
@@ -64,6 +65,15 @@ const LOCATIONS = [
     { id: 'online', label: 'Chama Church On-line' },
 ];
 
+// Idempotency-Key for /api/donate; randomUUID needs a secure context
+function newIdempotencyKey() {
+    if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') return crypto.randomUUID();
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`;
+}
+
+// Wait for typing/pasting to settle before looking up a CPF
+const CPF_CHECK_DEBOUNCE_MS = 300;
+
 export default function Home() {
     const [step, setStep] = useState(1);
     const [amount, setAmount] = useState('');
@@ -92,6 +102,10 @@ export default function Home() {
     const [cardCvv, setCardCvv] = useState('');
     const [errorMsg, setErrorMsg] = useState('');
 
+    // One key per donation attempt: double taps and retries of the same
+    // attempt get the original result from /api/donate instead of a new charge
+    const idempotencyKey = useRef<string | null>(null);
+
     // CPF Search State
     const [isCheckingCpf, setIsCheckingCpf] = useState(false);
     const [showFullForm, setShowFullForm] = useState(false);
@@ -101,36 +115,110 @@ export default function Home() {
     const [successData, setSuccessData] = useState<any>(null);
     const [sendingReceipt, setSendingReceipt] = useState(false);
 
-    // Polling for Pix Status
+    // Pix confirmation: /api/webhooks/mercadopago marks the donation as paid and
+    // Supabase Realtime pushes the row change here. /api/check-status is only
+    // called once after subscribing (payment may have landed before that), as
+    // a slow safety net for missed webhooks, or every 5s if Realtime fails.
     useEffect(() => {
-        let interval: NodeJS.Timeout;
-
-        if (step === 3 && pixData && successData?.id) {
-            interval = setInterval(async () => {
-                try {
-                    const res = await fetch('/api/check-status', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ id: successData.id })
-                    });
-                    const data = await res.json();
-
-                    if (data.status === 'approved') {
-                        clearInterval(interval);
-                        setStep(4);
-                    }
-                } catch (e) {
-                    console.error("Polling error", e);
+        if (step !== 3 || !pixData || !successData?.id) return;
+
+        const paymentId = successData.id.toString();
+        let interval: NodeJS.Timeout | undefined;
+        let done = false;
+
+        const confirm = () => {
+            if (done) return;
+            done = true;
+            if (interval) clearInterval(interval);
+            setStep(4);
+        };
+
+        const checkStatus = async () => {
+            try {
+                const res = await fetch('/api/check-status', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ id: paymentId })
+                });
+                const data = await res.json();
+                if (data.status === 'approved') confirm();
+            } catch (e) {
+                console.error("Status check error", e);
+            }
+        };
+
+        const poll = (ms: number) => {
+            if (interval) clearInterval(interval);
+            interval = setInterval(checkStatus, ms);
+        };
+
+        const channel = supabase
+            .channel(`donation-${paymentId}`)
+            .on(
+                'postgres_changes',
+                { event: 'UPDATE', schema: 'public', table: 'donations', filter: `pagbank_order_id=eq.${paymentId}` },
+                (payload: any) => {
+                    if (payload.new?.status === 'paid') confirm();
                 }
-            }, 5000); // Check every 5 seconds
-        }
+            )
+            .subscribe((status) => {
+                if (status === 'SUBSCRIBED') {
+                    checkStatus();
+                    poll(30000);
+                } else if (status === 'CHANNEL_ERROR' || status === 'TIMED_OUT') {
+                    console.warn('Realtime unavailable, falling back to polling:', status);
+                    poll(5000);
+                }
+            });
 
         return () => {
+            done = true;
             if (interval) clearInterval(interval);
+            supabase.removeChannel(channel);
         };
     }, [step, pixData, successData]);
 
 
+    // CPF autofill: lookups are debounced while typing, a newer CPF aborts the
+    // request still in flight (so a late response can't overwrite it), and
+    // answers are memoized for the session, so retyping a CPF costs nothing.
+    const cpfLookups = useRef(new Map<string, any>());
+    const cpfRequest = useRef<AbortController | null>(null);
+    const cpfDebounce = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+    useEffect(() => () => {
+        if (cpfDebounce.current) clearTimeout(cpfDebounce.current);
+        cpfRequest.current?.abort();
+    }, []);
+
+    const applyDonorLookup = (data: any) => {
+        if (data.exists && data.donor) {
+            setName(data.donor.name || '');
+            setEmail(data.donor.email || '');
+            setWhatsapp(data.donor.phone || '');
+            setStep(3); // Auto advance to payment
+        } else {
+            setName('');
+            setEmail('');
+            setWhatsapp('');
+            setShowFullForm(true);
+        }
+    };
+
+    const cancelCpfCheck = () => {
+        if (cpfDebounce.current) clearTimeout(cpfDebounce.current);
+        cpfDebounce.current = null;
+        cpfRequest.current?.abort();
+        cpfRequest.current = null;
+        setIsCheckingCpf(false);
+    };
+
+    const scheduleCpfCheck = (rawCpf: string) => {
+        cancelCpfCheck();
+        if (rawCpf.length !== 11) return;
+        cpfDebounce.current = setTimeout(() => checkCpf(rawCpf), CPF_CHECK_DEBOUNCE_MS);
+    };
+
     const checkCpf = async (inputCpf: string) => {
         const clean = inputCpf.replace(/\D/g, '');
         if (clean.length !== 11) return;
@@ -142,40 +230,69 @@ export default function Home() {
         }
         setCpfError(''); // Clear error if valid
 
+        const known = cpfLookups.current.get(clean);
+        if (known) {
+            applyDonorLookup(known);
+            return;
+        }
+
+        cpfRequest.current?.abort();
+        const controller = new AbortController();
+        cpfRequest.current = controller;
+
         setIsCheckingCpf(true);
         try {
             const res = await fetch('/api/check-donor', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ cpf: clean })
+                body: JSON.stringify({ cpf: clean }),
+                signal: controller.signal
             });
             const data = await res.json();
+            if (!res.ok) throw new Error(data.error);
 
-            if (data.exists && data.donor) {
-                setName(data.donor.name || '');
-                setEmail(data.donor.email || '');
-                setWhatsapp(data.donor.phone || '');
-                setStep(3); // Auto advance to payment
-            } else {
-                setName('');
-                setEmail('');
-                setWhatsapp('');
-                setShowFullForm(true);
-            }
-        } catch (err) {
+            cpfLookups.current.set(clean, data);
+            if (!controller.signal.aborted) applyDonorLookup(data);
+        } catch (err: any) {
+            if (err.name === 'AbortError') return; // superseded by a newer CPF
             console.error(err);
             setShowFullForm(true);
         } finally {
-            setIsCheckingCpf(false);
+            if (cpfRequest.current === controller) {
+                cpfRequest.current = null;
+                setIsCheckingCpf(false);
+            }
         }
     };
 
+    // Fetch the card SDK as soon as the card form is on screen, so it is
+    // ready by the time the donor submits
+    useEffect(() => {
+        if (step === 3 && paymentMethod === 'credit_card') {
+            loadMercadoPagoSdk().catch(err => console.warn(err));
+        }
+    }, [step, paymentMethod]);
+
+    // A different donation is a new attempt (the server refuses a key reused for other data)
+    useEffect(() => {
+        idempotencyKey.current = null;
+    }, [amount, selectedType, selectedLocation, paymentMethod, cpf, name, email, whatsapp]);
+
     const handlePayment = async () => {
         setLoading(true);
         setErrorMsg('');
         try {
             const cleanPhone = whatsapp.replace(/\D/g, '');
             const cleanCpf = cpf.replace(/\D/g, '');
+
+            // Same checks /api/donate runs, before tokenizing the card or calling the API
+            const invalid = validateAmount(amount) || validateCustomer({
+                name,
+                email: email || 'comprador@chamachurch.com',
+                cpf: cleanCpf,
+                phone: cleanPhone
+            });
+            if (invalid) throw new Error(invalid.message);
             let token = undefined;
             let paymentMethodId = undefined;
             let issuerId = undefined;
@@ -185,8 +302,11 @@ export default function Home() {
                 const mpKey = process.env.NEXT_PUBLIC_MP_PUBLIC_KEY;
                 console.log('Using MP Key:', mpKey?.substring(0, 8));
 
-                // Initialize MP
-                const mp = new (window as any).MercadoPago(mpKey);
+                // Initialize MP (already loaded when the card step opened)
+                const MercadoPago = await loadMercadoPagoSdk().catch(() => {
+                    throw new Error('Não foi possível carregar o pagamento com cartão. Verifique sua conexão e tente novamente.');
+                });
+                const mp = new MercadoPago(mpKey);
 
                 // 1. Get Payment Method (BIN)
                 const cleanCardNumber = cardNumber.replace(/\s/g, '');
@@ -218,9 +338,14 @@ export default function Home() {
                 token = tokenRes.id;
             }
 
+            if (!idempotencyKey.current) idempotencyKey.current = newIdempotencyKey();
+
             const res = await fetch('/api/donate', {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Idempotency-Key': idempotencyKey.current
+                },
                 body: JSON.stringify({
                     amount: parseFloat(amount),
                     description: `Doação - ${currentTypeLabel}`,
@@ -243,6 +368,9 @@ export default function Home() {
             const data = await res.json();
 
             if (!res.ok) {
+                // Rejected input: fixing it is a new attempt. Network errors and
+                // 5xx keep the key so retrying cannot charge twice.
+                if (res.status < 500) idempotencyKey.current = null;
                 throw new Error(data.error || 'Erro ao processar');
             }
 
@@ -277,6 +405,7 @@ export default function Home() {
                 setStep(4);
                 // Optionally show a "Em processamento" warning, but usually we treat as received
             } else if (data.status === 'rejected') {
+                idempotencyKey.current = null; // next try (e.g. another card) is a new payment
                 const errorMap: Record<string, string> = {
                     'cc_rejected_bad_filled_card_number': 'Número do cartão inválido.',
                     'cc_rejected_bad_filled_date': 'Data de validade inválida.',
@@ -311,68 +440,15 @@ export default function Home() {
         setSendingReceipt(true);
 
         try {
-            const doc = new jsPDF();
-
-            // Header
-            doc.setFontSize(22);
-            doc.setFont('helvetica', 'bold');
-            doc.text("CHAMA CHURCH", 105, 20, { align: "center" });
-
-            doc.setFontSize(16);
-            doc.setFont('helvetica', 'normal');
-            doc.text("Comprovante de Contribuição", 105, 30, { align: "center" });
-
-            // Divider
-            doc.setLineWidth(0.5);
-            doc.line(20, 35, 190, 35);
-
-            // Content
-            doc.setFontSize(12);
-            doc.text(`Data: ${successData.date} às ${successData.time}`, 20, 50);
-            doc.text(`Igreja: ${successData.churchLocation || 'Online'}`, 20, 60);
-            doc.text(`Doador: ${successData.payer}`, 20, 70);
-            doc.text(`Tipo: ${successData.type}`, 20, 80);
-            doc.text(`ID da Transação: ${successData.id}`, 20, 90);
-
-            // Amount Box
-            doc.setFillColor(240, 240, 240);
-            doc.rect(20, 100, 170, 20, 'F');
-            doc.setFontSize(14);
-            doc.setFont('helvetica', 'bold');
-            doc.text(`Valor: R$ ${parseFloat(successData.amount).toFixed(2).replace('.', ',')}`, 105, 113, { align: "center" });
-
-            // Footer
-            doc.setFontSize(10);
-            doc.setFont('helvetica', 'italic');
-            doc.text("Obrigado por sua generosidade!", 105, 130, { align: "center" });
-            doc.text("Deus abençoe sua vida.", 105, 135, { align: "center" });
-
-            // Generate Blob
-            const pdfBlob = doc.output('blob');
-            const fileName = `recibo_${Date.now()}.pdf`;
-
-            // Upload to Supabase
-            const { error } = await supabase
-                .storage
-                .from('receipts')
-                .upload(fileName, pdfBlob, {
-                    contentType: 'application/pdf'
-                });
-
-            if (error) throw error;
-
-            // Generate Short Code
-            const shortId = Math.random().toString(36).substring(2, 8);
-
-            // Save mapping to DB
-            const { error: dbError } = await supabase
-                .from('receipts_log')
-                .insert({
-                    short_id: shortId,
-                    storage_path: fileName
-                });
-
-            if (dbError) throw dbError;
+            // Rendered and stored server-side; repeat clicks reuse the same PDF
+            const res = await fetch('/api/receipts', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ paymentId: successData.id })
+            });
+            const data = await res.json();
+            if (!res.ok) throw new Error(data.error);
+            const shortId = data.shortId;
 
             // Create Short Link
             const shortLink = `${window.location.origin}/c/${shortId}`;
@@ -400,7 +476,10 @@ export default function Home() {
         }
         else if (step === 2) {
             if (!showFullForm) {
-                if (cpf.replace(/\D/g, '').length === 11) checkCpf(cpf);
+                if (cpf.replace(/\D/g, '').length === 11) {
+                    cancelCpfCheck();
+                    checkCpf(cpf);
+                }
                 return;
             }
             if (name && whatsapp && cpf) setStep(3);
@@ -408,6 +487,7 @@ export default function Home() {
     };
 
     const resetForm = () => {
+        cancelCpfCheck();
         setStep(1);
         setAmount('');
         // Reset card data
@@ -435,11 +515,10 @@ export default function Home() {
             <header className={styles.header}>
                 <div className={`container ${styles.headerContent}`}>
                     <div className={styles.logoWrapper}>
-                        {/* eslint-disable-next-line @next/next/no-img-element */}
-                        <img src="/logo.png" alt="Chama Church" className={styles.logoImage} />
+                        <ResponsiveImage name="logo" alt="Chama Church" sizes="120px" className={styles.logoImage} priority />
                     </div>
 
-                    <Link href="/historico" className={styles.historyButton}>
+                    <Link href="/historico" className={styles.historyButton} data-testid="history-link">
                         <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" strokeWidth={1.5} stroke="currentColor" width="20" height="20">
                             <path strokeLinecap="round" strokeLinejoin="round" d="M12 6v6h4.5m4.5 0a9 9 0 1 1-18 0 9 9 0 0 1 18 0Z" />
                         </svg>
@@ -451,9 +530,9 @@ export default function Home() {
             {/* Type Selection Modal */}
             {showTypeModal && (
                 <div className={styles.modalOverlay} onClick={() => setShowTypeModal(false)}>
-                    <div className={styles.modalContent} onClick={e => e.stopPropagation()}>
+                    <div className={styles.modalContent} onClick={e => e.stopPropagation()} data-testid="type-modal">
                         <div className={styles.modalHeader}>
-                            <button className={styles.closeButton} onClick={() => setShowTypeModal(false)}>×</button>
+                            <button className={styles.closeButton} onClick={() => setShowTypeModal(false)} data-testid="type-modal-close">×</button>
                             <h3 className={styles.modalTitle}>Fundo</h3>
                             <div style={{ width: 24 }}></div> {/* Spacer for alignment */}
                         </div>
@@ -466,6 +545,7 @@ export default function Home() {
                                         key={type.id}
                                         className={`${styles.modalItem} ${selectedType === type.id ? styles.selectedType : ''}`}
                                         onClick={() => setSelectedType(type.id)}
+                                        data-testid={`type-option-${type.id}`}
                                     >
                                         <div className={styles.iconWrapper}>
                                             <Icon />
@@ -489,6 +569,7 @@ export default function Home() {
                                         key={type.id}
                                         className={`${styles.modalItem} ${selectedType === type.id ? styles.selectedType : ''}`}
                                         onClick={() => setSelectedType(type.id)}
+                                        data-testid={`type-option-${type.id}`}
                                     >
                                         <div className={styles.iconWrapper}>
                                             <Icon />
@@ -503,7 +584,7 @@ export default function Home() {
                             })}
 
                             <div className={styles.modalFooter}>
-                                <button className={styles.doneButton} onClick={() => setShowTypeModal(false)}>
+                                <button className={styles.doneButton} onClick={() => setShowTypeModal(false)} data-testid="type-done">
                                     Feito
                                 </button>
                             </div>
@@ -518,9 +599,9 @@ export default function Home() {
             {
                 showLocationModal && (
                     <div className={styles.modalOverlay} onClick={() => setShowLocationModal(false)}>
-                        <div className={styles.modalContent} onClick={e => e.stopPropagation()}>
+                        <div className={styles.modalContent} onClick={e => e.stopPropagation()} data-testid="location-modal">
                             <div className={styles.modalHeader}>
-                                <button className={styles.closeButton} onClick={() => setShowLocationModal(false)}>×</button>
+                                <button className={styles.closeButton} onClick={() => setShowLocationModal(false)} data-testid="location-modal-close">×</button>
                                 <h3 className={styles.modalTitle}>Selecione a Localização</h3>
                                 <div style={{ width: 24 }}></div>
                             </div>
@@ -533,10 +614,10 @@ export default function Home() {
                                             setSelectedLocation(loc.id);
                                             setShowLocationModal(false);
                                         }}
+                                        data-testid={`location-option-${loc.id}`}
                                     >
                                         <div className={styles.itemContent} style={{ display: 'flex', alignItems: 'center' }}>
-                                            {/* eslint-disable-next-line @next/next/no-img-element */}
-                                            <img src="/logo-black.png" alt="Logo" className={styles.locationLogo} />
+                                            <ResponsiveImage name="logo-black" alt="Logo" sizes="60px" className={styles.locationLogo} />
                                             <span className={styles.itemLabel}>{loc.label}</span>
                                         </div>
                                         <div className={`${styles.radioButton} ${selectedLocation === loc.id ? styles.radioSelected : ''}`}></div>
@@ -550,6 +631,7 @@ export default function Home() {
 
             {/* Hero Section */}
             <div className={styles.heroSection}>
+                <ResponsiveImage name="hero-bg" alt="" sizes="100vw" className={styles.heroBackground} priority />
                 <div className={`container ${styles.heroContainer}`}>
                     {/* Hero Text */}
                     <div className={styles.heroContent}>
@@ -578,17 +660,17 @@ export default function Home() {
 
                     {/* Donation Widget */}
                     <div className={styles.donationWidget}>
-                        <div className={styles.card}>
+                        <div className={styles.card} data-testid="donation-card" data-step={step}>
                             {/* Step 4: Success */}
                             {step === 4 ? (
-                                <div className="animate-fade-in" style={{ textAlign: 'center', padding: '2rem 1rem' }}>
+                                <div className="animate-fade-in" style={{ textAlign: 'center', padding: '2rem 1rem' }} data-testid="donation-success">
                                     <div style={{ marginBottom: '1.5rem', color: '#10b981', display: 'flex', justifyContent: 'center' }}>
                                         <svg width="64" height="64" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
                                             <path d="M12 22C17.5 22 22 17.5 22 12C22 6.5 17.5 2 12 2C6.5 2 2 6.5 2 12C2 17.5 6.5 22 12 22Z" stroke="currentColor" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round" />
                                             <path d="M7.75 12.75L10.25 15.25L16.25 9.25" stroke="currentColor" strokeWidth="1.5" strokeLinecap="round" strokeLinejoin="round" />
                                         </svg>
                                     </div>
-                                    <h2 className={styles.heading} style={{ marginBottom: '0.5rem' }}>Obrigado!</h2>
+                                    <h2 className={styles.heading} style={{ marginBottom: '0.5rem' }} data-testid="wizard-heading">Obrigado!</h2>
                                     <p className={styles.subtext} style={{ fontSize: '1.1rem', color: '#333' }}>
                                         Sua contribuição foi recebida com sucesso.
                                     </p>
@@ -603,6 +685,7 @@ export default function Home() {
                                         className={styles.outlineButton}
                                         onClick={handleSendReceipt}
                                         disabled={sendingReceipt}
+                                        data-testid="send-receipt"
                                         style={{ marginTop: '2rem', width: '100%', marginBottom: '1rem' }}
                                     >
                                         {sendingReceipt ? 'Gerando Link...' : 'Enviar comprovante'}
@@ -610,6 +693,7 @@ export default function Home() {
                                     <button
                                         className={styles.primaryButton}
                                         onClick={resetForm}
+                                        data-testid="new-donation"
                                         style={{ marginTop: '2rem' }}
                                     >
                                         Fazer nova doação
@@ -624,6 +708,7 @@ export default function Home() {
                                         <button
                                             className={styles.selectTrigger}
                                             onClick={() => setShowLocationModal(true)}
+                                            data-testid="location-trigger"
                                             style={{ width: '100%', justifyContent: 'space-between' }}
                                         >
                                             <span style={{ color: selectedLocation ? 'inherit' : '#666' }}>
@@ -635,7 +720,7 @@ export default function Home() {
                                         </button>
                                     </div>
 
-                                    <h2 className={styles.heading}>Faça sua contribuição</h2>
+                                    <h2 className={styles.heading} data-testid="wizard-heading">Faça sua contribuição</h2>
                                     <p className={styles.subtext}>Escolha o valor e o destino da sua contribuição.</p>
 
                                     <div className={styles.amountContainer}>
@@ -647,17 +732,18 @@ export default function Home() {
                                                 placeholder="0"
                                                 value={amount}
                                                 onChange={handleAmountChange}
+                                                data-testid="amount-input"
                                                 autoFocus
                                             />
                                         </div>
 
-                                        <button className={styles.selectTrigger} onClick={() => setShowTypeModal(true)}>
+                                        <button className={styles.selectTrigger} onClick={() => setShowTypeModal(true)} data-testid="type-trigger">
                                             {currentTypeLabel}
                                             <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round"><path d="m6 9 6 6 6-6" /></svg>
                                         </button>
                                     </div>
 
-                                    <button className={styles.primaryButton} onClick={handleNext}>
+                                    <button className={styles.primaryButton} onClick={handleNext} data-testid="step1-continue">
                                         Continuar
                                     </button>
                                 </div>
@@ -666,10 +752,10 @@ export default function Home() {
                             {/* Step 2: Identification */}
                             {step === 2 && (
                                 <div className="animate-fade-in">
-                                    <button className={styles.backButton} onClick={() => setStep(1)}>
+                                    <button className={styles.backButton} onClick={() => setStep(1)} data-testid="back-button">
                                         <Icons.ChevronLeft /> Voltar
                                     </button>
-                                    <h2 className={styles.heading}>Seus Dados</h2>
+                                    <h2 className={styles.heading} data-testid="wizard-heading">Seus Dados</h2>
                                     <p className={styles.subtext}>
                                         {showFullForm
                                             ? "Complete seus dados para continuar."
@@ -701,13 +787,12 @@ export default function Home() {
                                                     }
                                                     setCpf(value);
 
-                                                    // Auto check when full (11 digits)
-                                                    if (rawValue.length === 11) {
-                                                        checkCpf(rawValue);
-                                                    }
+                                                    // Auto check once 11 digits stop changing;
+                                                    // any edit cancels the pending check
+                                                    scheduleCpfCheck(rawValue);
                                                 }}
-                                                disabled={isCheckingCpf}
                                                 autoFocus
+                                                data-testid="cpf-input"
                                             />
                                             {isCheckingCpf && (
                                                 <div style={{ position: 'absolute', right: 10, top: 10, fontSize: '1.2rem' }}>
@@ -716,7 +801,7 @@ export default function Home() {
                                             )}
                                         </div>
                                         {cpfError && (
-                                            <div className="animate-fade-in" style={{ color: '#ef4444', fontSize: '0.875rem', marginTop: '0.25rem' }}>
+                                            <div className="animate-fade-in" style={{ color: '#ef4444', fontSize: '0.875rem', marginTop: '0.25rem' }} data-testid="cpf-error">
                                                 {cpfError}
                                             </div>
                                         )}
@@ -732,6 +817,7 @@ export default function Home() {
                                                     placeholder="Seu nome"
                                                     value={name}
                                                     onChange={(e) => setName(e.target.value)}
+                                                    data-testid="name-input"
                                                 />
                                             </div>
 
@@ -753,6 +839,7 @@ export default function Home() {
                                                         }
                                                         setWhatsapp(value);
                                                     }}
+                                                    data-testid="whatsapp-input"
                                                 />
                                             </div>
 
@@ -764,6 +851,7 @@ export default function Home() {
                                                     placeholder="seu@email.com"
                                                     value={email}
                                                     onChange={(e) => setEmail(e.target.value)}
+                                                    data-testid="email-input"
                                                 />
                                             </div>
                                         </div>
@@ -773,6 +861,7 @@ export default function Home() {
                                         className={styles.primaryButton}
                                         onClick={handleNext}
                                         disabled={isCheckingCpf || (showFullForm && (!name || !whatsapp))}
+                                        data-testid="step2-continue"
                                     >
                                         {isCheckingCpf ? 'Verificando...' : (showFullForm ? 'Ir para Pagamento' : 'Continuar')}
                                     </button>
@@ -782,10 +871,10 @@ export default function Home() {
                             {/* Step 3: Transparent Checkout */}
                             {step === 3 && (
                                 <div className="animate-fade-in">
-                                    <button className={styles.backButton} onClick={() => pixData ? setPixData(null) : setStep(2)}>
+                                    <button className={styles.backButton} onClick={() => pixData ? setPixData(null) : setStep(2)} data-testid="back-button">
                                         <Icons.ChevronLeft /> Voltar
                                     </button>
-                                    <h2 className={styles.heading}>Pagamento Seguro</h2>
+                                    <h2 className={styles.heading} data-testid="wizard-heading">Pagamento Seguro</h2>
 
                                     <div className={styles.summary}>
                                         <div className={styles.summaryRow}>
@@ -806,7 +895,7 @@ export default function Home() {
                                     {pixData ? (
                                         <div className={styles.pixResult} style={{ textAlign: 'center', margin: '2rem 0' }}>
                                             <p style={{ marginBottom: '1rem', fontWeight: 600 }}>Escaneie o QR Code abaixo:</p>
-                                            <img src={pixData.qrCode} alt="QR Code Pix" style={{ width: 200, height: 200, margin: '0 auto', display: 'block' }} />
+                                            <img src={pixData.qrCode} alt="QR Code Pix" style={{ width: 200, height: 200, margin: '0 auto', display: 'block' }} data-testid="pix-qr-image" />
 
                                             <div style={{ marginTop: '1.5rem' }}>
                                                 <p style={{ fontSize: '0.9rem', marginBottom: '0.5rem' }}>Ou copie o código:</p>
@@ -817,11 +906,12 @@ export default function Home() {
                                                     fontSize: '0.8rem',
                                                     wordBreak: 'break-all',
                                                     border: '1px solid #e4e4e7'
-                                                }}>
+                                                }} data-testid="pix-code">
                                                     {pixData.text}
                                                 </div>
                                                 <button
                                                     onClick={() => navigator.clipboard.writeText(pixData.text)}
+                                                    data-testid="pix-copy"
                                                     style={{
                                                         marginTop: '0.5rem',
                                                         color: '#000',
@@ -843,12 +933,14 @@ export default function Home() {
                                                 <button
                                                     className={`${styles.paymentTab} ${paymentMethod === 'credit_card' ? styles.activeTab : ''}`}
                                                     onClick={() => setPaymentMethod('credit_card')}
+                                                    data-testid="payment-tab-credit_card"
                                                 >
                                                     Cartão de Crédito
                                                 </button>
                                                 <button
                                                     className={`${styles.paymentTab} ${paymentMethod === 'pix' ? styles.activeTab : ''}`}
                                                     onClick={() => setPaymentMethod('pix')}
+                                                    data-testid="payment-tab-pix"
                                                 >
                                                     PIX
                                                 </button>
@@ -869,6 +961,7 @@ export default function Home() {
                                                                 if (v.length > 16) v = v.slice(0, 16);
                                                                 setCardNumber(v.replace(/(\d{4})/g, '$1 ').trim());
                                                             }}
+                                                            data-testid="card-number-input"
                                                         />
                                                     </div>
 
@@ -887,6 +980,7 @@ export default function Home() {
                                                                     if (v.length > 2) v = v.replace(/^(\d{2})/, '$1/');
                                                                     setCardExp(v);
                                                                 }}
+                                                                data-testid="card-exp-input"
                                                             />
                                                         </div>
                                                         <div className={styles.inputGroup}>
@@ -898,6 +992,7 @@ export default function Home() {
                                                                 value={cardCvv}
                                                                 maxLength={4}
                                                                 onChange={(e) => setCardCvv(e.target.value.replace(/\D/g, ''))}
+                                                                data-testid="card-cvv-input"
                                                             />
                                                         </div>
                                                     </div>
@@ -910,14 +1005,14 @@ export default function Home() {
                                                             placeholder="Como está no cartão"
                                                             value={cardName}
                                                             onChange={(e) => setCardName(e.target.value.toUpperCase())}
+                                                            data-testid="card-name-input"
                                                         />
                                                     </div>
                                                 </div>
                                             ) : (
                                                 <div className={styles.paymentForm} style={{ textAlign: 'center', padding: '1rem' }}>
                                                     <div style={{ marginBottom: '1rem', display: 'flex', justifyContent: 'center' }}>
-                                                        {/* eslint-disable-next-line @next/next/no-img-element */}
-                                                        <img src="/pix-logo.png" alt="Pix" style={{ height: '48px', width: 'auto' }} />
+                                                        <ResponsiveImage name="pix-logo" alt="Pix" sizes="135px" style={{ height: '48px', width: 'auto' }} />
                                                     </div>
                                                     <p style={{ marginTop: '1rem' }}>O QR Code será gerado na próxima tela.</p>
                                                 </div>
@@ -927,6 +1022,7 @@ export default function Home() {
                                                 className={styles.primaryButton}
                                                 onClick={handlePayment}
                                                 disabled={loading}
+                                                data-testid="submit-payment"
                                             >
                                                 {loading ? 'Processando...' : 'Finalizar Doação'}
                                             </button>
@@ -941,7 +1037,7 @@ export default function Home() {
                                                     color: '#b91c1c',
                                                     fontSize: '0.875rem',
                                                     textAlign: 'center'
-                                                }}>
+                                                }} data-testid="payment-error">
                                                     {errorMsg}
                                                 </div>
                                             )}
@@ -0,0 +1,7 @@
+// Runs once when a server instance starts. Rows a previous process queued
+// (crash, redeploy) are flushed now instead of waiting for the next donation.
+export async function register() {
+    if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+    const { flushDonationQueue } = await import('@/lib/donationQueue');
+    flushDonationQueue();
+}
@@ -0,0 +1,87 @@
+// In-process TTL cache with LRU eviction and request coalescing.
+// Lives for the lifetime of the server instance (per lambda on serverless),
+// so it only saves work, it is never the source of truth.
+
+export interface CacheStats {
+    hits: number;
+    misses: number;
+    coalesced: number;
+    evictions: number;
+    size: number;
+}
+
+interface Entry<V> {
+    value: V;
+    expiresAt: number;
+}
+
+// Named caches, reported by /api/metrics
+export const namedCaches = new Map<string, TTLCache<any>>();
+
+export class TTLCache<V> {
+    private entries = new Map<string, Entry<V>>();
+    private inFlight = new Map<string, Promise<V>>();
+    private counters = { hits: 0, misses: 0, coalesced: 0, evictions: 0 };
+
+    constructor(private maxEntries: number, private defaultTtlMs: number, name?: string) {
+        if (name) namedCaches.set(name, this);
+    }
+
+    get(key: string): V | undefined {
+        const entry = this.entries.get(key);
+        if (!entry) return undefined;
+        if (entry.expiresAt <= Date.now()) {
+            this.entries.delete(key);
+            return undefined;
+        }
+        // Map keeps insertion order: re-inserting marks the key as most recently used
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        return entry.value;
+    }
+
+    // ttlMs = Infinity keeps the value until it is evicted by LRU
+    set(key: string, value: V, ttlMs: number = this.defaultTtlMs) {
+        this.entries.delete(key);
+        this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+        while (this.entries.size > this.maxEntries) {
+            const oldest = this.entries.keys().next().value as string;
+            this.entries.delete(oldest);
+            this.counters.evictions++;
+        }
+    }
+
+    delete(key: string) {
+        this.entries.delete(key);
+    }
+
+    // Returns the cached value or runs loader once, sharing the pending
+    // promise with every concurrent caller for the same key. Failures are not cached.
+    async getOrLoad(key: string, loader: () => Promise<V>, ttlFor?: (value: V) => number): Promise<V> {
+        const cached = this.get(key);
+        if (cached !== undefined) {
+            this.counters.hits++;
+            return cached;
+        }
+
+        const pending = this.inFlight.get(key);
+        if (pending) {
+            this.counters.coalesced++;
+            return pending;
+        }
+
+        this.counters.misses++;
+        const promise = loader()
+            .then(value => {
+                this.set(key, value, ttlFor ? ttlFor(value) : this.defaultTtlMs);
+                return value;
+            })
+            .finally(() => this.inFlight.delete(key));
+        this.inFlight.set(key, promise);
+        return promise;
+    }
+
+    stats(): CacheStats {
+        return { ...this.counters, size: this.entries.size };
+    }
+}
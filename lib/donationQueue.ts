@@ -0,0 +1,293 @@
+// Durable write-behind queue for donations rows. /api/donate answers as
+// soon as the payment exists at Mercado Pago; the row is first appended
+// (and fsynced) to a local JSONL segment, then inserted into Supabase in
+// batches after the response. Segments are deleted only after their rows
+// are stored, so a stalled database or a crash delays rows, never loses them.
+// Rows the database refuses (constraint or type errors, or a segment that
+// keeps failing with a 500) are moved to dead/ so they cannot block the
+// rows behind them; only transport and 5xx failures are retried in order.
+//
+// Once Mercado Pago has created the payment the donor always gets their
+// answer: if neither the disk nor the database takes the row it is logged,
+// counted and kept in memory for the next flush.
+//
+// One queue directory per server instance: DONATION_QUEUE_DIR, by default
+// .donation-queue in the app's working directory. Point it at a persistent
+// volume on container hosts. It holds donor CPF, email and phone, so it is
+// created 0700 with 0600 files. Segments left by a previous process are
+// flushed at startup (instrumentation.ts).
+import { promises as fs } from 'fs';
+import path from 'path';
+import { supabase } from '@/lib/supabase';
+import { mapPaymentStatus, paymentStatusCache } from '@/lib/mercadopago';
+import { logger } from '@/lib/logger';
+
+const QUEUE_DIR = process.env.DONATION_QUEUE_DIR || path.join(process.cwd(), '.donation-queue');
+const BATCH_SIZE = 100;
+const MAX_RETRY_DELAY_MS = 60000;
+const SEGMENT_PATTERN = /^\d{13}-\d+-\d+\.jsonl$/;
+const DEAD_DIR = path.join(QUEUE_DIR, 'dead');
+// 500 answers for the same segment before its rows are tried one by one
+const MAX_SEGMENT_ATTEMPTS = 8;
+
+let segmentCounter = 0;
+let segment = newSegmentName();
+let segmentHasRows = false;
+const pendingWrites = new Map<string, Set<Promise<void>>>();
+
+let flushing: Promise<void> | null = null;
+let flushAgain = false;
+let retryTimer: NodeJS.Timeout | null = null;
+let consecutiveFailures = 0;
+let lastError: string | null = null;
+let rowsInserted = 0;
+let rowsQuarantined = 0;
+let rowsUnsaved = 0;
+// Rows neither the disk nor the database accepted, retried on every flush
+let memoryRows: any[] = [];
+const segmentAttempts = new Map<string, number>();
+// Rows this instance queued that are not in Supabase yet, by payment id
+const queuedRows = new Map<string, Record<string, any>>();
+
+function newSegmentName() {
+    return `${Date.now()}-${process.pid}-${segmentCounter++}.jsonl`;
+}
+
+async function appendDurably(file: string, line: string) {
+    await fs.mkdir(path.dirname(file), { recursive: true, mode: 0o700 });
+    const handle = await fs.open(file, 'a', 0o600);
+    try {
+        await handle.write(line);
+        await handle.datasync();
+    } finally {
+        await handle.close();
+    }
+}
+
+// Stores the row durably; it reaches Supabase on the next flush. If the disk
+// fails the row is inserted directly instead. Never throws: the payment
+// already exists, so the donor must get the response whatever happens here.
+export async function enqueueDonation(row: Record<string, any>) {
+    const file = segment;
+    const write = appendDurably(path.join(QUEUE_DIR, file), JSON.stringify(row) + '\n');
+
+    let writes = pendingWrites.get(file);
+    if (!writes) pendingWrites.set(file, writes = new Set());
+    writes.add(write);
+    segmentHasRows = true;
+
+    try {
+        await write;
+        if (row.pagbank_order_id) queuedRows.set(row.pagbank_order_id, row);
+    } catch (error) {
+        logger.error('Donation queue write failed, inserting directly:', error);
+        const { error: dbError } = await supabase.from('donations').insert(row);
+        if (dbError) {
+            rowsUnsaved++;
+            logger.error(
+                `DONATION QUEUE: payment ${row.pagbank_order_id || '(no id)'} could not be queued or stored ` +
+                `(${dbError.message}); kept in memory until the next flush`
+            );
+            memoryRows.push(row);
+            if (row.pagbank_order_id) queuedRows.set(row.pagbank_order_id, row);
+            scheduleRetry();
+        }
+    } finally {
+        writes.delete(write);
+        if (writes.size === 0) pendingWrites.delete(file);
+    }
+}
+
+// Inserts every queued row. Concurrent calls share one run; rows enqueued
+// while a run is in progress are picked up by a follow-up run, so requests
+// arriving during a slow insert end up in the same batch.
+export function flushDonationQueue(): Promise<void> {
+    if (flushing) {
+        flushAgain = true;
+        return flushing;
+    }
+    flushing = (async () => {
+        do {
+            flushAgain = false;
+            await flushOnce();
+        } while (flushAgain && consecutiveFailures === 0);
+    })().finally(() => {
+        flushing = null;
+    });
+    return flushing;
+}
+
+async function flushOnce() {
+    // Close the current segment: new rows go to a fresh file while this one is stored
+    if (segmentHasRows) {
+        const closed = segment;
+        segment = newSegmentName();
+        segmentHasRows = false;
+        await Promise.allSettled(pendingWrites.get(closed) ?? []);
+    }
+
+    try {
+        const files = (await fs.readdir(QUEUE_DIR).catch(error => {
+            if (error.code === 'ENOENT') return [];
+            throw error;
+        })).filter(f => SEGMENT_PATTERN.test(f) && f !== segment).sort();
+
+        // Oldest first; stop at the first failure so rows keep their order
+        for (const file of files) {
+            const filePath = path.join(QUEUE_DIR, file);
+            await storeSegment(file, parseSegment(file, await fs.readFile(filePath, 'utf8')));
+            await fs.unlink(filePath);
+            segmentAttempts.delete(file);
+        }
+
+        if (memoryRows.length) {
+            const rows = memoryRows;
+            memoryRows = [];
+            try {
+                await storeSegment(`memory-${process.pid}.jsonl`, rows);
+            } catch (error) {
+                memoryRows = rows.concat(memoryRows);
+                throw error;
+            }
+        }
+        consecutiveFailures = 0;
+        lastError = null;
+    } catch (error: any) {
+        consecutiveFailures++;
+        lastError = error.message || String(error);
+        logger.error(`Donation queue flush failed (attempt ${consecutiveFailures}):`, error);
+        scheduleRetry();
+    }
+}
+
+function parseSegment(file: string, contents: string) {
+    const rows: any[] = [];
+    for (const line of contents.split('\n')) {
+        if (!line) continue;
+        try {
+            rows.push(JSON.parse(line));
+        } catch {
+            // Only a write torn by a crash can leave a partial line
+            logger.error(`Donation queue: skipping unreadable line in ${file}:`, line);
+        }
+    }
+    return rows;
+}
+
+function scheduleRetry() {
+    if (retryTimer) return;
+    const delay = Math.min(MAX_RETRY_DELAY_MS, 1000 * 2 ** (consecutiveFailures - 1));
+    retryTimer = setTimeout(() => {
+        retryTimer = null;
+        flushDonationQueue();
+    }, delay);
+    retryTimer.unref();
+}
+
+async function storeSegment(file: string, rows: any[]) {
+    try {
+        await insertRows(await unstoredRows(rows));
+    } catch (error: any) {
+        if (isTransportError(error)) throw error;
+        const attempts = (segmentAttempts.get(file) || 0) + 1;
+        segmentAttempts.set(file, attempts);
+        if (!isRejection(error) && attempts < MAX_SEGMENT_ATTEMPTS) throw error;
+
+        // Find the rows the database refuses; the others are stored in order
+        const exhausted = attempts >= MAX_SEGMENT_ATTEMPTS;
+        for (const row of await unstoredRows(rows)) {
+            try {
+                await insertRows([row]);
+            } catch (rowError: any) {
+                if (isTransportError(rowError) || !(isRejection(rowError) || exhausted)) throw rowError;
+                await quarantine(file, row, rowError);
+            }
+        }
+    }
+}
+
+// A batch may have been stored before a failure was reported (timeout
+// after commit): skip payments that already have a row
+async function unstoredRows(rows: any[]) {
+    const ids = rows.map(row => row.pagbank_order_id).filter(Boolean);
+    if (!ids.length) return rows;
+    const { data, error, status } = await supabase
+        .from('donations')
+        .select('pagbank_order_id')
+        .in('pagbank_order_id', ids);
+    if (error) throw Object.assign(error, { status });
+    const stored = new Set((data || []).map((row: any) => row.pagbank_order_id));
+    stored.forEach(id => queuedRows.delete(id));
+    return rows.filter(row => !row.pagbank_order_id || !stored.has(row.pagbank_order_id));
+}
+
+async function insertRows(rows: any[]) {
+    for (let i = 0; i < rows.length; i += BATCH_SIZE) {
+        const batch = rows.slice(i, i + BATCH_SIZE).map(withLatestStatus);
+        const { error, status } = await supabase.from('donations').insert(batch);
+        if (error) throw Object.assign(error, { status });
+        rowsInserted += batch.length;
+        batch.forEach(row => queuedRows.delete(row.pagbank_order_id));
+    }
+}
+
+// No answer from the database: a failed fetch (supabase-js reports status
+// 0) or the gateway in front of it being down. Never counted against a segment.
+function isTransportError(error: any) {
+    return !error.status || [502, 503, 504].includes(error.status);
+}
+
+// The database answered and will give the same answer again: bad input
+// (22xxx), a constraint (23xxx), a schema mismatch (42xxx, PGRST1xx/2xx)
+// or any other 4xx. Permission errors, timeouts and rate limits are about
+// the deployment, not the row, and would dead-letter every row: retry those.
+function isRejection(error: any) {
+    const code = error.code || '';
+    if (code === '42501' || [401, 403, 408, 429].includes(error.status)) return false;
+    if (/^(22|23|42)/.test(code) || /^PGRST[12]/.test(code)) return true;
+    return error.status >= 400 && error.status < 500;
+}
+
+async function quarantine(file: string, row: any, error: any) {
+    const deadFile = path.join(DEAD_DIR, file);
+    await appendDurably(deadFile, JSON.stringify({
+        row,
+        error: { status: error.status, code: error.code, message: error.message },
+        quarantinedAt: new Date().toISOString()
+    }) + '\n');
+    rowsQuarantined++;
+    queuedRows.delete(row.pagbank_order_id);
+    logger.error(
+        `DONATION QUEUE: payment ${row.pagbank_order_id || '(no id)'} was rejected by the database ` +
+        `(${error.status} ${error.code}: ${error.message}) and moved to ${deadFile}. ` +
+        'Fix the row and insert it by hand.'
+    );
+}
+
+// A webhook or status check may have seen the payment settle while the row
+// was queued (their UPDATE matched nothing); insert the newer status instead
+function withLatestStatus(row: any) {
+    if (row.status !== 'pending' || !row.pagbank_order_id) return row;
+    const latest = paymentStatusCache.get(row.pagbank_order_id);
+    return latest ? { ...row, status: mapPaymentStatus(latest.status) } : row;
+}
+
+// The queued row for a Mercado Pago payment, while it waits for a flush on
+// this instance. Lets /api/receipts answer right after the payment even when
+// Supabase is slow, which is when rows wait longest.
+export function findQueuedDonation(paymentId: string) {
+    const row = queuedRows.get(paymentId);
+    return row ? withLatestStatus(row) : null;
+}
+
+export function donationQueueStats() {
+    return {
+        rowsInserted,
+        rowsQuarantined,
+        rowsUnsaved,
+        rowsInMemory: memoryRows.length,
+        consecutiveFailures,
+        lastError,
+        retryScheduled: retryTimer !== null
+    };
+}
@@ -0,0 +1,75 @@
+// Shared filtering and keyset pagination for the admin donation listings.
+// Rows are ordered newest first by (created_at, id); a cursor is the
+// (created_at, id) of the last row of a page, so every page is an index
+// range scan no matter how deep it is.
+
+export interface DonationFilters {
+    start?: string; // ISO timestamp, inclusive
+    end?: string; // ISO timestamp, inclusive
+    status?: string; // paid | pending | canceled
+    method?: string; // pix | credit_card
+    location?: string; // central | manacapuru | africa | online
+}
+
+export interface DonationCursor {
+    createdAt: string;
+    id: string;
+}
+
+// Everything the table shows as "CANCELADO"
+export const CANCELED_STATUSES = ['canceled', 'cancelled', 'declined', 'refused', 'failed'];
+
+export function parseDonationFilters(searchParams: URLSearchParams): DonationFilters {
+    const filters: DonationFilters = {};
+    for (const key of ['start', 'end', 'status', 'method', 'location'] as const) {
+        const value = searchParams.get(key);
+        if (value) filters[key] = value;
+    }
+    return filters;
+}
+
+export function applyDonationFilters(query: any, filters: DonationFilters) {
+    if (filters.start) query = query.gte('created_at', filters.start);
+    if (filters.end) query = query.lte('created_at', filters.end);
+    if (filters.status === 'canceled') query = query.in('status', CANCELED_STATUSES);
+    else if (filters.status) query = query.eq('status', filters.status);
+    if (filters.method) query = query.eq('payment_method', filters.method);
+    if (filters.location) query = query.eq('church_location', filters.location);
+    return query;
+}
+
+// Rows strictly after the cursor in (created_at desc, id desc) order
+export function applyCursor(query: any, cursor: DonationCursor | null) {
+    if (!cursor) return query;
+    return query.or(
+        `created_at.lt."${cursor.createdAt}",and(created_at.eq."${cursor.createdAt}",id.lt."${cursor.id}")`
+    );
+}
+
+export function orderForKeyset(query: any) {
+    return query.order('created_at', { ascending: false }).order('id', { ascending: false });
+}
+
+export function encodeCursor(row: { created_at: string; id: string | number }): string {
+    return Buffer.from(JSON.stringify([row.created_at, row.id.toString()])).toString('base64url');
+}
+
+// Timestamps as PostgREST renders timestamptz. Kept as sent rather than
+// normalised with toISOString(), which would drop the microseconds
+// Postgres stores and make the cursor skip or repeat rows.
+const CURSOR_TIMESTAMP = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:\d{2})$/;
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+// Both values end up quoted inside the .or() filter string, so anything
+// but a well-formed timestamp and a UUID is rejected
+export function decodeCursor(value: string | null): DonationCursor | null {
+    if (!value) return null;
+    try {
+        const [createdAt, id] = JSON.parse(Buffer.from(value, 'base64url').toString());
+        if (typeof createdAt !== 'string' || !CURSOR_TIMESTAMP.test(createdAt) || isNaN(Date.parse(createdAt))) return null;
+        if (typeof id !== 'string' || !UUID.test(id)) return null;
+        return { createdAt, id };
+    } catch {
+        return null;
+    }
+}
@@ -0,0 +1,43 @@
+// Returning-donor autofill: one primary-key read of the donors projection
+// (see supabase/migrations/*_donors_projection.sql), cached briefly per
+// instance because the wizard asks again whenever the CPF is retyped.
+import { TTLCache } from '@/lib/cache';
+import { supabase } from '@/lib/supabase';
+
+export interface Donor {
+    name: string;
+    email: string;
+    phone: string;
+}
+
+const DONOR_TTL_MS = 60_000;
+// A first-time donor may have a row a moment later
+const NOT_FOUND_TTL_MS = 10_000;
+
+const donorCache = new TTLCache<Donor | null>(20_000, DONOR_TTL_MS, 'donors');
+
+// Legacy PagBank sandbox address, never a real donor's email
+const SANDBOX_EMAIL = 'comprador@sandbox.pagseguro.com.br';
+
+export function lookupDonor(cpf: string): Promise<Donor | null> {
+    return donorCache.getOrLoad(cpf, async () => {
+        const { data, error } = await supabase
+            .rpc('lookup_donor', { donor_cpf: cpf })
+            .maybeSingle();
+        if (error) throw error;
+        if (!data) return null;
+
+        const donor = data as any;
+        return {
+            name: donor.name,
+            email: donor.email === SANDBOX_EMAIL ? '' : donor.email,
+            phone: donor.phone
+        };
+    }, donor => donor ? DONOR_TTL_MS : NOT_FOUND_TTL_MS);
+}
+
+// Called when this instance records a donation: the row may still be in
+// the write-behind queue, but the next lookup already sees the new details
+export function rememberDonor(cpf: string, donor: Donor) {
+    donorCache.set(cpf, donor);
+}
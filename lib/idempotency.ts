@@ -0,0 +1,64 @@
+// Idempotency-Key support for POST /api/donate. Donors on slow connections
+// double-tap "Finalizar Doação" and browsers retry; every request carrying
+// the same key must get the first response back instead of a new charge.
+// The key is bound to a hash of the donation it was first used for; reusing
+// it for a different donation is refused rather than answered with the
+// first payment's result.
+// Recent keys are remembered here per instance; the unique
+// donations.idempotency_key column is the cross-instance record.
+import { createHash } from 'crypto';
+import { TTLCache } from '@/lib/cache';
+import { supabase } from '@/lib/supabase';
+import { logger } from '@/lib/logger';
+
+// Mercado Pago also honours X-Idempotency-Key for 24h
+const IDEMPOTENCY_TTL_MS = 24 * 60 * 60 * 1000;
+const KEY_PATTERN = /^[\w-]{8,128}$/;
+
+export interface StoredResponse {
+    requestHash: string | null; // null for donations stored before request_hash existed
+    response: any;
+}
+
+export const donateResponses = new TTLCache<StoredResponse>(10000, IDEMPOTENCY_TTL_MS, 'donate_responses');
+
+// UUIDs and other opaque tokens; anything else is rejected before it reaches MP or the DB
+export function isValidIdempotencyKey(key: string): boolean {
+    return KEY_PATTERN.test(key);
+}
+
+// Hash of what defines the donation, normalised the way the route stores it.
+// The card token is left out: the wizard tokenizes the card again on every try.
+export function donationRequestHash(body: any): string {
+    const customer = body.customer || {};
+    const normalized = {
+        amount: parseFloat(body.amount),
+        description: body.description || null,
+        churchLocation: body.churchLocation || null,
+        paymentMethod: body.paymentMethod || 'pix',
+        name: String(customer.name || '').trim(),
+        email: String(customer.email || '').trim().toLowerCase(),
+        cpf: String(customer.cpf || '').replace(/\D/g, ''),
+        phone: String(customer.phone || '').replace(/\D/g, ''),
+        paymentMethodId: body.paymentMethodId || null,
+        installments: body.installments ? Number(body.installments) : null
+    };
+    return createHash('sha256').update(JSON.stringify(normalized)).digest('hex');
+}
+
+// Response stored with the donation created under this key, if any
+export async function findStoredResponse(key: string): Promise<StoredResponse | null> {
+    const { data, error } = await supabase
+        .from('donations')
+        .select('payment_response, request_hash')
+        .eq('idempotency_key', key)
+        .limit(1)
+        .maybeSingle();
+    if (error) {
+        // The in-process cache and MP's own idempotency still protect the donor
+        logger.error('Idempotency lookup error:', error);
+        return null;
+    }
+    if (!data?.payment_response) return null;
+    return { requestHash: data.request_hash ?? null, response: data.payment_response };
+}
@@ -0,0 +1,27 @@
+// Leveled logging for the API routes. LOG_LEVEL = error | warn | info | debug
+// (default: warn in production, info otherwise). Arguments given as
+// functions are only called when the level is enabled, so expensive
+// serialization such as logger.debug('MP response:', () => JSON.stringify(res))
+// costs nothing in production.
+
+const LEVELS = { error: 0, warn: 1, info: 2, debug: 3 };
+type Level = keyof typeof LEVELS;
+
+const configured = process.env.LOG_LEVEL as Level | undefined;
+const threshold = configured && configured in LEVELS
+    ? LEVELS[configured]
+    : process.env.NODE_ENV === 'production' ? LEVELS.warn : LEVELS.info;
+
+function emit(level: Level, args: unknown[]) {
+    if (LEVELS[level] > threshold) return;
+    const resolved = args.map(arg => typeof arg === 'function' ? arg() : arg);
+    console[level === 'debug' ? 'log' : level](...resolved);
+}
+
+export const logger = {
+    error: (...args: unknown[]) => emit('error', args),
+    warn: (...args: unknown[]) => emit('warn', args),
+    info: (...args: unknown[]) => emit('info', args),
+    debug: (...args: unknown[]) => emit('debug', args),
+    enabled: (level: Level) => LEVELS[level] <= threshold
+};
@@ -1,9 +1,47 @@
+import { createHmac, timingSafeEqual } from 'crypto';
 import { MercadoPagoConfig, Payment } from 'mercadopago';
+import { TTLCache } from '@/lib/cache';
+import { logger } from '@/lib/logger';
+import { timeStage } from '@/lib/metrics';
 
 // Initialize Client
 const client = new MercadoPagoConfig({ accessToken: process.env.MP_ACCESS_TOKEN!, options: { timeout: 5000 } });
 const payment = new Payment(client);
 
+// The SDK hardcodes https://api.mercadopago.com. When MP_API_BASE_URL is set
+// (e.g. the local fake in testsprite_tests/fakes/mercadopago.py) the same
+// REST calls go to that host instead, for hermetic and load tests.
+const apiBaseUrl = process.env.MP_API_BASE_URL?.replace(/\/$/, '');
+
+async function mpFetch(path: string, init: RequestInit = {}): Promise<any> {
+    const res = await fetch(`${apiBaseUrl}${path}`, {
+        ...init,
+        headers: {
+            'Authorization': `Bearer ${process.env.MP_ACCESS_TOKEN}`,
+            'Content-Type': 'application/json',
+            ...init.headers
+        },
+        signal: AbortSignal.timeout(5000)
+    });
+    // Proxies and gateways answer with HTML or empty bodies (502, 204),
+    // so the body is only parsed when it is JSON
+    const text = await res.text();
+    let data: any = null;
+    try {
+        data = text ? JSON.parse(text) : null;
+    } catch {
+        data = null;
+    }
+    // Mirror the SDK, which rejects with the parsed API error body
+    if (!res.ok) {
+        throw data ?? { message: `MP API error ${res.status}`, status: res.status, body: text.slice(0, 500) };
+    }
+    if (data === null) {
+        throw { message: `MP API returned a non-JSON response (${res.status})`, status: res.status, body: text.slice(0, 500) };
+    }
+    return data;
+}
+
 interface CreatePaymentParams {
     amount: number;
     description: string;
@@ -19,10 +57,12 @@ interface CreatePaymentParams {
     paymentMethodId?: string; // e.g. "master", "visa"
     installments?: number;
     issuerId?: string;
+    // Forwarded as X-Idempotency-Key: MP returns the original payment on repeats
+    idempotencyKey?: string;
 }
 
 export async function createMPPayment(params: CreatePaymentParams) {
-    const { amount, description, customer, paymentMethod, token, paymentMethodId, installments, issuerId } = params;
+    const { amount, description, customer, paymentMethod, token, paymentMethodId, installments, issuerId, idempotencyKey } = params;
 
     // Environment Check
     const isTestMode = process.env.MP_ACCESS_TOKEN?.startsWith('TEST');
@@ -49,6 +89,11 @@ export async function createMPPayment(params: CreatePaymentParams) {
         external_reference: `REF-${Date.now()}`
     };
 
+    // MP pushes status changes to /api/webhooks/mercadopago (public https URL only)
+    if (process.env.MP_WEBHOOK_URL) {
+        paymentData.notification_url = process.env.MP_WEBHOOK_URL;
+    }
+
     if (paymentMethod === 'pix') {
         paymentData.payment_method_id = 'pix';
     } else if (paymentMethod === 'credit_card') {
@@ -62,23 +107,104 @@ export async function createMPPayment(params: CreatePaymentParams) {
     }
 
     try {
-        const response = await payment.create({ body: paymentData });
-        return response;
+        return await timeStage('mp', 'create_payment', () => apiBaseUrl
+            ? mpFetch('/v1/payments', {
+                method: 'POST',
+                body: JSON.stringify(paymentData),
+                headers: idempotencyKey ? { 'X-Idempotency-Key': idempotencyKey } : undefined
+            })
+            : payment.create({ body: paymentData, requestOptions: idempotencyKey ? { idempotencyKey } : undefined }));
     } catch (error: any) {
-        console.error('MP Payment Error - Full Details:', JSON.stringify(error, null, 2));
-        if (error.cause) {
-            console.error('MP Error Causes:', JSON.stringify(error.cause, null, 2));
-        }
+        logger.error('MP Payment Error:', error?.message || error?.status || error);
+        logger.debug('MP Payment Error - Full Details:', () => JSON.stringify(error, null, 2));
+        if (error?.cause) logger.debug('MP Error Causes:', () => JSON.stringify(error.cause, null, 2));
         throw error;
     }
 }
 
 export async function getPayment(id: number | string) {
     try {
-        const response = await payment.get({ id: id.toString() });
-        return response;
+        return await timeStage('mp', 'get_payment', () => apiBaseUrl
+            ? mpFetch(`/v1/payments/${id}`)
+            : payment.get({ id: id.toString() }));
     } catch (error: any) {
-        console.error('Get Payment Error:', error);
+        logger.error('Get Payment Error:', error);
         throw error;
     }
 }
+
+export interface PaymentStatus {
+    id: number | string;
+    status: string;
+    status_detail: string;
+}
+
+// MP statuses that never change again for a donation
+const FINAL_STATUSES = ['approved', 'rejected', 'cancelled', 'refunded', 'charged_back'];
+// Pending payments are re-read from MP at most this often per instance
+const PENDING_STATUS_TTL_MS = 5000;
+
+export const paymentStatusCache = new TTLCache<PaymentStatus>(5000, PENDING_STATUS_TTL_MS, 'payment_status');
+
+function toPaymentStatus(payment: any): PaymentStatus {
+    return { id: payment.id, status: payment.status, status_detail: payment.status_detail };
+}
+
+// Lets callers that already hold a fresh payment (e.g. the webhook) update the cache
+export function cachePaymentStatus(payment: any) {
+    const summary = toPaymentStatus(payment);
+    paymentStatusCache.set(summary.id.toString(), summary, statusTtl(summary));
+    return summary;
+}
+
+function statusTtl(payment: PaymentStatus) {
+    return FINAL_STATUSES.includes(payment.status) ? Infinity : PENDING_STATUS_TTL_MS;
+}
+
+// Cached getPayment for status checks: final statuses are served from memory,
+// pending ones at most every PENDING_STATUS_TTL_MS, and concurrent lookups of
+// the same id share one MP call. onFetched runs only when MP was actually hit.
+export function getPaymentStatus(id: number | string, onFetched?: (payment: PaymentStatus) => Promise<void>) {
+    return paymentStatusCache.getOrLoad(id.toString(), async () => {
+        const summary = toPaymentStatus(await getPayment(id));
+        if (onFetched) await onFetched(summary);
+        return summary;
+    }, statusTtl);
+}
+
+export type DonationStatus = 'paid' | 'declined' | 'canceled' | 'pending';
+
+// MP statuses: approved, in_process, rejected, cancelled, pending...
+export function mapPaymentStatus(mpStatus?: string): DonationStatus {
+    if (mpStatus === 'approved') return 'paid';
+    if (mpStatus === 'rejected') return 'declined';
+    if (mpStatus === 'cancelled') return 'canceled';
+    return 'pending';
+}
+
+// Validates the x-signature header of a webhook notification
+// ("ts=...,v1=<hmac-sha256 hex>") against MP_WEBHOOK_SECRET.
+// See https://www.mercadopago.com.br/developers/pt/docs/your-integrations/notifications/webhooks
+export function verifyWebhookSignature(
+    signature: string | null,
+    requestId: string | null,
+    dataId: string,
+    secret: string
+): boolean {
+    if (!signature) return false;
+
+    const parts: Record<string, string> = {};
+    for (const part of signature.split(',')) {
+        const [key, value] = part.split('=', 2).map(s => s?.trim());
+        if (key && value) parts[key] = value;
+    }
+    if (!parts.ts || !parts.v1) return false;
+
+    let manifest = `id:${dataId.toLowerCase()};`;
+    if (requestId) manifest += `request-id:${requestId};`;
+    manifest += `ts:${parts.ts};`;
+
+    const expected = createHmac('sha256', secret).update(manifest).digest('hex');
+    const received = Buffer.from(parts.v1, 'hex');
+    return received.length === expected.length / 2 && timingSafeEqual(received, Buffer.from(expected, 'hex'));
+}
@@ -0,0 +1,29 @@
+// Browser-side Mercado Pago SDK (card BIN lookup and tokenization), loaded
+// on demand: only the card payment step needs it, so no other page or step
+// pays for the script. Concurrent callers share one <script> load.
+
+const SDK_URL = 'https://sdk.mercadopago.com/js/v2';
+
+let loading: Promise<any> | null = null;
+
+export function loadMercadoPagoSdk(): Promise<any> {
+    const w = window as any;
+    if (w.MercadoPago) return Promise.resolve(w.MercadoPago);
+    if (loading) return loading;
+
+    loading = new Promise((resolve, reject) => {
+        const script = document.createElement('script');
+        script.src = SDK_URL;
+        script.async = true;
+        script.onload = () => w.MercadoPago ? resolve(w.MercadoPago) : reject(new Error('MercadoPago SDK not initialized'));
+        script.onerror = () => {
+            script.remove();
+            reject(new Error('Falha ao carregar o SDK do Mercado Pago'));
+        };
+        document.head.appendChild(script);
+    }).catch(error => {
+        loading = null; // let the next attempt retry (e.g. after a network blip)
+        throw error;
+    });
+    return loading;
+}
@@ -0,0 +1,171 @@
+// In-process request metrics, rendered in Prometheus text format by
+// /api/metrics. Per instance, like lib/cache: scrape every instance.
+//
+//   chamachurch_http_requests_total{route,method,status}
+//   chamachurch_http_request_duration_seconds{route,method}
+//   chamachurch_stage_duration_seconds{stage,operation,outcome}
+//
+// Stages: validation (input checks), mp (Mercado Pago API), db (every
+// Supabase REST/Storage/Auth call, timed in lib/supabase's fetch).
+import { namedCaches } from '@/lib/cache';
+
+const BUCKETS_SECONDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+type Labels = Record<string, string>;
+
+interface Histogram {
+    labels: Labels;
+    buckets: number[]; // non-cumulative counts, one per bound plus +Inf
+    sum: number;
+    count: number;
+}
+
+interface Counter {
+    labels: Labels;
+    value: number;
+}
+
+const histograms = new Map<string, Map<string, Histogram>>();
+const counters = new Map<string, Map<string, Counter>>();
+
+const HELP: Record<string, string> = {
+    chamachurch_http_requests_total: 'API requests by route, method and response status',
+    chamachurch_http_request_duration_seconds: 'Time until the route handler returned its response',
+    chamachurch_stage_duration_seconds: 'Latency of each stage of a request: validation, mp, db'
+};
+
+function seriesKey(labels: Labels) {
+    return Object.keys(labels).sort().map(key => `${key}=${labels[key]}`).join(',');
+}
+
+function series<T>(families: Map<string, Map<string, T>>, name: string, labels: Labels, create: () => T): T {
+    let family = families.get(name);
+    if (!family) families.set(name, family = new Map());
+    const key = seriesKey(labels);
+    let entry = family.get(key);
+    if (!entry) family.set(key, entry = create());
+    return entry;
+}
+
+export function observe(name: string, labels: Labels, seconds: number) {
+    const histogram = series(histograms, name, labels, () => ({
+        labels, buckets: new Array(BUCKETS_SECONDS.length + 1).fill(0), sum: 0, count: 0
+    }));
+    let i = 0;
+    while (i < BUCKETS_SECONDS.length && seconds > BUCKETS_SECONDS[i]) i++;
+    histogram.buckets[i]++;
+    histogram.sum += seconds;
+    histogram.count++;
+}
+
+export function increment(name: string, labels: Labels, by = 1) {
+    series(counters, name, labels, () => ({ labels, value: 0 })).value += by;
+}
+
+// Records a stage that started at startedAt (performance.now())
+export function observeStage(stage: string, operation: string, startedAt: number, outcome = 'ok') {
+    observe('chamachurch_stage_duration_seconds', { stage, operation, outcome }, (performance.now() - startedAt) / 1000);
+}
+
+// Times an async stage; a rejection is recorded with outcome="error" and rethrown
+export async function timeStage<T>(stage: string, operation: string, run: () => PromiseLike<T>): Promise<T> {
+    const startedAt = performance.now();
+    let outcome = 'error';
+    try {
+        const result = await run();
+        outcome = 'ok';
+        return result;
+    } finally {
+        observeStage(stage, operation, startedAt, outcome);
+    }
+}
+
+// Wraps a route handler: request count by status and total latency.
+// export const POST = instrumented('/api/donate', async (request: Request) => { ... });
+export function instrumented<A extends [Request, ...any[]]>(route: string, handler: (...args: A) => Promise<Response>) {
+    return async (...args: A): Promise<Response> => {
+        const method = args[0].method;
+        const startedAt = performance.now();
+        let status = 500;
+        try {
+            const response = await handler(...args);
+            status = response.status;
+            return response;
+        } finally {
+            observe('chamachurch_http_request_duration_seconds', { route, method }, (performance.now() - startedAt) / 1000);
+            increment('chamachurch_http_requests_total', { route, method, status: status.toString() });
+        }
+    };
+}
+
+function escapeLabel(value: string) {
+    return value.replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+}
+
+function formatLabels(labels: Labels, extra?: Labels) {
+    const all = { ...labels, ...extra };
+    const parts = Object.keys(all).map(key => `${key}="${escapeLabel(all[key])}"`);
+    return parts.length ? `{${parts.join(',')}}` : '';
+}
+
+// A value read at scrape time (cache and queue stats); names ending in
+// _total are typed as counters, everything else as gauges
+export interface Sample {
+    name: string;
+    help: string;
+    labels?: Labels;
+    value: number;
+}
+
+// Prometheus text exposition format (version 0.0.4)
+export function renderMetrics(samples: Sample[] = []): string {
+    const lines: string[] = [];
+
+    for (const [name, family] of counters) {
+        lines.push(`# HELP ${name} ${HELP[name] || name}`, `# TYPE ${name} counter`);
+        for (const counter of family.values()) {
+            lines.push(`${name}${formatLabels(counter.labels)} ${counter.value}`);
+        }
+    }
+
+    for (const [name, family] of histograms) {
+        lines.push(`# HELP ${name} ${HELP[name] || name}`, `# TYPE ${name} histogram`);
+        for (const histogram of family.values()) {
+            let cumulative = 0;
+            BUCKETS_SECONDS.forEach((bound, i) => {
+                cumulative += histogram.buckets[i];
+                lines.push(`${name}_bucket${formatLabels(histogram.labels, { le: bound.toString() })} ${cumulative}`);
+            });
+            lines.push(`${name}_bucket${formatLabels(histogram.labels, { le: '+Inf' })} ${histogram.count}`);
+            lines.push(`${name}_sum${formatLabels(histogram.labels)} ${histogram.sum}`);
+            lines.push(`${name}_count${formatLabels(histogram.labels)} ${histogram.count}`);
+        }
+    }
+
+    const snapshot: Sample[] = [...samples];
+    for (const [cache, instance] of namedCaches) {
+        const stats = instance.stats();
+        for (const [stat, value] of Object.entries(stats)) {
+            snapshot.push({
+                name: stat === 'size' ? 'chamachurch_cache_entries' : `chamachurch_cache_${stat}_total`,
+                help: stat === 'size' ? 'Entries held by each in-process cache' : `Cache ${stat} since the instance started`,
+                labels: { cache },
+                value
+            });
+        }
+    }
+
+    // Each metric family must be contiguous in the output
+    snapshot.sort((a, b) => a.name.localeCompare(b.name));
+    let previous = '';
+    for (const sample of snapshot) {
+        if (sample.name !== previous) {
+            previous = sample.name;
+            const type = sample.name.endsWith('_total') ? 'counter' : 'gauge';
+            lines.push(`# HELP ${sample.name} ${sample.help}`, `# TYPE ${sample.name} ${type}`);
+        }
+        lines.push(`${sample.name}${formatLabels(sample.labels || {})} ${sample.value}`);
+    }
+
+    return lines.join('\n') + '\n';
+}
@@ -0,0 +1,118 @@
+import { createHash } from 'crypto';
+import { jsPDF } from 'jspdf';
+import { supabase } from '@/lib/supabase';
+
+// Bump when the PDF layout changes so new renders get new storage keys
+const RECEIPT_LAYOUT_VERSION = 1;
+const TIMEZONE = 'America/Manaus';
+
+const LOCATION_LABELS: Record<string, string> = {
+    central: 'Chama Church - Manaus',
+    manacapuru: 'Chama Church - Manacapuru',
+    africa: 'Chama Church África',
+    online: 'Chama Church On-line'
+};
+
+export interface ReceiptData {
+    date: string;
+    time: string;
+    church: string;
+    payer: string;
+    type: string;
+    transactionId: string;
+    amount: string;
+}
+
+// Everything printed on the receipt, formatted; the storage key hashes exactly this.
+// memberName stands in for a blank payer_name (the member's name elsewhere in their history).
+export function receiptDataFor(donation: any, memberName?: string | null): ReceiptData {
+    const createdAt = new Date(donation.created_at);
+    return {
+        date: createdAt.toLocaleDateString('pt-BR', { timeZone: TIMEZONE }),
+        time: createdAt.toLocaleTimeString('pt-BR', { timeZone: TIMEZONE }),
+        church: LOCATION_LABELS[donation.church_location] || donation.church_location || 'Online',
+        payer: donation.payer_name || memberName || 'Membro',
+        type: (donation.type || '').replace(/^Doação - /, ''),
+        transactionId: (donation.pagbank_order_id || donation.id).toString(),
+        amount: parseFloat(donation.amount).toFixed(2).replace('.', ',')
+    };
+}
+
+export function receiptStoragePath(data: ReceiptData): string {
+    const hash = createHash('sha256')
+        .update(JSON.stringify({ v: RECEIPT_LAYOUT_VERSION, ...data }))
+        .digest('hex');
+    return `v${RECEIPT_LAYOUT_VERSION}/${hash}.pdf`;
+}
+
+export function renderReceiptPdf(data: ReceiptData): ArrayBuffer {
+    const doc = new jsPDF();
+
+    // Header
+    doc.setFontSize(22);
+    doc.setFont('helvetica', 'bold');
+    doc.text("CHAMA CHURCH", 105, 20, { align: "center" });
+
+    doc.setFontSize(16);
+    doc.setFont('helvetica', 'normal');
+    doc.text("Comprovante de Contribuição", 105, 30, { align: "center" });
+
+    // Divider
+    doc.setLineWidth(0.5);
+    doc.line(20, 35, 190, 35);
+
+    // Content
+    doc.setFontSize(12);
+    doc.text(`Data: ${data.date} às ${data.time}`, 20, 50);
+    doc.text(`Igreja: ${data.church}`, 20, 60);
+    doc.text(`Doador: ${data.payer}`, 20, 70);
+    doc.text(`Tipo: ${data.type}`, 20, 80);
+    doc.text(`ID da Transação: ${data.transactionId}`, 20, 90);
+
+    // Amount Box
+    doc.setFillColor(240, 240, 240);
+    doc.rect(20, 100, 170, 20, 'F');
+    doc.setFontSize(14);
+    doc.setFont('helvetica', 'bold');
+    doc.text(`Valor: R$ ${data.amount}`, 105, 113, { align: "center" });
+
+    // Footer
+    doc.setFontSize(10);
+    doc.setFont('helvetica', 'italic');
+    doc.text("Obrigado por sua generosidade!", 105, 130, { align: "center" });
+    doc.text("Deus abençoe sua vida.", 105, 135, { align: "center" });
+
+    return doc.output('arraybuffer');
+}
+
+// Returns the short id of the stored receipt for this donation, rendering and
+// uploading the PDF only when no receipt with the same contents exists yet.
+export async function getOrCreateReceipt(donation: any, memberName?: string | null) {
+    const data = receiptDataFor(donation, memberName);
+    const storagePath = receiptStoragePath(data);
+
+    const { data: existing, error: lookupError } = await supabase
+        .from('receipts_log')
+        .select('short_id')
+        .eq('storage_path', storagePath)
+        .limit(1)
+        .maybeSingle();
+    if (lookupError) throw lookupError;
+    if (existing) return { shortId: existing.short_id, storagePath, cached: true };
+
+    const { error: uploadError } = await supabase
+        .storage
+        .from('receipts')
+        .upload(storagePath, renderReceiptPdf(data), { contentType: 'application/pdf', upsert: false });
+
+    // Same key means same bytes: a concurrent request already stored it
+    if (uploadError && !/exists|duplicate/i.test(uploadError.message)) throw uploadError;
+
+    // Logs the path (short_id from next_receipt_short_id()) or returns the id
+    // a concurrent request logged first: one short id per PDF
+    const { data: shortId, error: logError } = await supabase
+        .rpc('receipt_short_id', { receipt_path: storagePath });
+    if (logError) throw logError;
+
+    return { shortId: shortId as string, storagePath, cached: false };
+}
@@ -1,6 +1,54 @@
 import { createClient } from '@supabase/supabase-js';
+import { timeStage } from '@/lib/metrics';
 
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!;
 const supabaseKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!;
 
-export const supabase = createClient(supabaseUrl, supabaseKey);
+const REST_VERBS: Record<string, string> = { GET: 'select', HEAD: 'count', POST: 'insert', PATCH: 'update', DELETE: 'delete' };
+
+// Low-cardinality label for a Supabase HTTP call: "donations.select",
+// "rpc.admin_donation_stats", "storage.receipts", "auth.user"
+function supabaseOperation(input: RequestInfo | URL, init?: RequestInit) {
+    const url = new URL(input instanceof Request ? input.url : input.toString());
+    const method = (init?.method || (input instanceof Request ? input.method : 'GET')).toUpperCase();
+    const [service, , resource, name] = url.pathname.split('/').filter(Boolean);
+    if (service === 'rest') {
+        return resource === 'rpc' ? `rpc.${name}` : `${resource}.${REST_VERBS[method] || method.toLowerCase()}`;
+    }
+    if (service === 'storage') return `storage.${resource === 'object' ? name : resource}`;
+    return `${service}.${resource}`;
+}
+
+// Every REST, Storage and Auth request is recorded as the "db" stage in
+// /api/metrics. Only on the server: browsers share this module but not the metrics.
+const timedFetch: typeof fetch = (input, init) =>
+    timeStage('db', supabaseOperation(input, init), () => fetch(input, init));
+
+const instrumentation = typeof window === 'undefined' ? { fetch: timedFetch } : {};
+
+export const supabase = createClient(supabaseUrl, supabaseKey, { global: instrumentation });
+
+// Client that queries as the signed-in user, so RLS sees the admin's JWT
+// instead of the anon role. For API routes that receive the user's token.
+export function createUserClient(accessToken: string) {
+    return createClient(supabaseUrl, supabaseKey, {
+        global: { ...instrumentation, headers: { Authorization: `Bearer ${accessToken}` } },
+        auth: { persistSession: false, autoRefreshToken: false }
+    });
+}
+
+// Resolves the "Authorization: Bearer <jwt>" of an admin API request to a
+// user-scoped client, or null when the token is missing or invalid.
+export async function getAdminClient(request: Request) {
+    const token = request.headers.get('authorization')?.replace(/^Bearer\s+/i, '');
+    return getAdminClientForToken(token);
+}
+
+export async function getAdminClientForToken(token?: string | null) {
+    if (!token) return null;
+
+    const { data, error } = await supabase.auth.getUser(token);
+    if (error || !data.user) return null;
+
+    return createUserClient(token);
+}
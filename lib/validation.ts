@@ -1,15 +1,177 @@
+// Donation input validation shared by the wizard (browser) and the API
+// routes (server). No dependencies and no allocations in the checkers: they
+// walk the string once with charCodeAt instead of replace/split/regex, so
+// they are cheap enough to run on every keystroke and every request.
+
+export interface ValidationError {
+    field: string;
+    message: string;
+}
+
+const DIGIT_0 = 48;
+const DIGIT_9 = 57;
+const AT = 64;
+const DOT = 46;
+
+function isDigit(code: number) {
+    return code >= DIGIT_0 && code <= DIGIT_9;
+}
+
+// Same set as \s in JavaScript regular expressions
+function isWhitespace(code: number) {
+    if (code > 32 && code < 127) return false; // printable ASCII, the common case
+    return (code >= 9 && code <= 13) || code === 32 || code === 0xa0 || code === 0x1680 ||
+        (code >= 0x2000 && code <= 0x200a) || code === 0x2028 || code === 0x2029 ||
+        code === 0x202f || code === 0x205f || code === 0x3000 || code === 0xfeff;
+}
+
+// Number of ASCII digits in value (formatting characters are ignored)
+export function countDigits(value: string): number {
+    let count = 0;
+    for (let i = 0; i < value.length; i++) {
+        if (isDigit(value.charCodeAt(i))) count++;
+    }
+    return count;
+}
+
+// CPF with check digits; punctuation (123.456.789-09) is ignored
 export function isValidCPF(cpf: string): boolean {
     if (typeof cpf !== 'string') return false;
-    cpf = cpf.replace(/[^\d]+/g, '');
 
-    // Check length and repeating digits (e.g. 111.111.111-11)
-    if (cpf.length !== 11 || !!cpf.match(/(\d)\1{10}/)) return false;
+    let count = 0;
+    let first = -1;
+    let allSame = true;
+    let sum1 = 0;
+    let sum2 = 0;
+    let check1 = 0;
+    let check2 = 0;
+
+    for (let i = 0; i < cpf.length; i++) {
+        const code = cpf.charCodeAt(i);
+        if (!isDigit(code)) continue;
+        const digit = code - DIGIT_0;
+
+        if (count === 0) first = digit;
+        else if (digit !== first) allSame = false;
+
+        if (count < 9) {
+            sum1 += digit * (10 - count);
+            sum2 += digit * (11 - count);
+        } else if (count === 9) {
+            check1 = digit;
+            sum2 += digit * 2;
+        } else if (count === 10) {
+            check2 = digit;
+        } else {
+            return false; // more than 11 digits
+        }
+        count++;
+    }
+
+    // Wrong length, or a repeated digit (e.g. 111.111.111-11)
+    if (count !== 11 || allSame) return false;
+
+    return (sum1 * 10) % 11 % 10 === check1 && (sum2 * 10) % 11 % 10 === check2;
+}
+
+// Equivalent to /^[^\s@]+@[^\s@]+\.[^\s@]+$/
+export function isValidEmail(email: string): boolean {
+    if (typeof email !== 'string') return false;
+
+    let at = -1;
+    for (let i = 0; i < email.length; i++) {
+        const code = email.charCodeAt(i);
+        if (isWhitespace(code)) return false;
+        if (code === AT) {
+            if (at !== -1) return false;
+            at = i;
+        }
+    }
+    if (at < 1) return false;
+
+    // A dot with at least one character on each side inside the domain
+    for (let i = at + 2; i < email.length - 1; i++) {
+        if (email.charCodeAt(i) === DOT) return true;
+    }
+    return false;
+}
+
+// Brazilian phone with area code: 10 (landline) or 11 (mobile) digits
+export function isValidPhone(phone: string): boolean {
+    if (typeof phone !== 'string') return false;
+    const digits = countDigits(phone);
+    return digits >= 10 && digits <= 11;
+}
+
+export function isValidAmount(amount: unknown): boolean {
+    const value = typeof amount === 'number' ? amount : parseFloat(amount as string);
+    return Number.isFinite(value) && value > 0;
+}
+
+export const PAYMENT_METHODS = ['pix', 'credit_card', 'pis'];
+
+const MESSAGES = {
+    cpf: 'CPF inválido. Por favor, verifique o número digitado.',
+    email: 'Email inválido. Por favor, verifique o endereço digitado.',
+    phone: 'Telefone inválido. Deve conter 10 ou 11 dígitos.',
+    amount: 'Valor da doação deve ser maior que zero',
+    paymentMethod: 'Método de pagamento inválido',
+    card: 'Dados do cartão são obrigatórios para pagamento via crédito',
+    customer: 'Dados do cliente são obrigatórios'
+};
+
+function missing(field: string): ValidationError {
+    return { field, message: `Campo obrigatório ausente: ${field}` };
+}
+
+export function validateCPF(cpf: string): ValidationError | null {
+    return isValidCPF(cpf) ? null : { field: 'cpf', message: MESSAGES.cpf };
+}
+
+export function validateEmail(email: string): ValidationError | null {
+    return isValidEmail(email) ? null : { field: 'email', message: MESSAGES.email };
+}
+
+export function validatePhone(phone: string): ValidationError | null {
+    return isValidPhone(phone) ? null : { field: 'phone', message: MESSAGES.phone };
+}
+
+export function validateAmount(amount: unknown): ValidationError | null {
+    return isValidAmount(amount) ? null : { field: 'amount', message: MESSAGES.amount };
+}
+
+function missingCustomerField(customer: any): ValidationError | null {
+    if (!customer || typeof customer !== 'object') return { field: 'customer', message: MESSAGES.customer };
+    for (const field of ['name', 'email', 'cpf', 'phone']) {
+        if (!customer[field]) return missing(field);
+    }
+    return null;
+}
+
+// Donor data typed in step 2 of the wizard
+export function validateCustomer(customer: any): ValidationError | null {
+    return missingCustomerField(customer) ||
+        validateCPF(customer.cpf) || validateEmail(customer.email) || validatePhone(customer.phone);
+}
 
-    const values = cpf.split('').map(el => +el);
+// Body of POST /api/donate; returns the first problem, in the order the
+// route has always reported them
+export function validateDonation(body: any): ValidationError | null {
+    if (!body || typeof body !== 'object') return missing('amount');
+    for (const field of ['amount', 'customer', 'churchLocation', 'paymentMethod']) {
+        if (!body[field]) return missing(field);
+    }
 
-    // Validate first digit
-    const rest = (count: number) => (values.slice(0, count - 12)
-        .reduce((s, el, i) => s + el * (count - i), 0) * 10) % 11 % 10;
+    const error = missingCustomerField(body.customer) ||
+        validateAmount(body.amount) ||
+        validateCustomer(body.customer);
+    if (error) return error;
 
-    return rest(10) === values[9] && rest(11) === values[10];
+    if (!PAYMENT_METHODS.includes(body.paymentMethod)) {
+        return { field: 'paymentMethod', message: MESSAGES.paymentMethod };
+    }
+    if (body.paymentMethod === 'credit_card' && (!body.token || !body.paymentMethodId)) {
+        return { field: 'card', message: MESSAGES.card };
+    }
+    return null;
 }
@@ -1,6 +1,19 @@
 /** @type {import('next').NextConfig} */
 const nextConfig = {
     reactStrictMode: true,
+    // Receipts are rendered in API routes; load jsPDF's node build at runtime
+    // instead of bundling it (and its optional browser-only dependencies)
+    serverExternalPackages: ['jspdf'],
+    // scripts/build-images.mjs puts a content hash in every file name under
+    // /img, so a URL always maps to the same bytes
+    async headers() {
+        return [
+            {
+                source: '/img/:path*',
+                headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }]
+            }
+        ];
+    },
 };
 
 module.exports = nextConfig;
@@ -0,0 +1,134 @@
+// Builds the responsive image variants served by app/components/ResponsiveImage.
+//
+// Every source below is resized to each width that is not larger than the
+// original and encoded as AVIF and WebP into public/img/, with a content hash
+// in the file name (next.config.js serves /img/* as immutable). The manifest
+// the component reads is written to lib/images.manifest.json. Both outputs
+// are generated (gitignored); this runs before `next dev` and `next build`.
+// lib/images.fallback.json, the same manifest without variants, is committed:
+// tsconfig resolves the manifest import to it until the first run.
+//
+// Uses sharp, which Next.js installs as an optional dependency for its image
+// optimizer. Without it the manifest lists no variants and the components
+// fall back to the original files, so the site still works.
+import { createHash } from 'crypto';
+import { existsSync } from 'fs';
+import { mkdir, readdir, readFile, rm, writeFile } from 'fs/promises';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+const OUTPUT_DIR = path.join(ROOT, 'public', 'img');
+const MANIFEST = path.join(ROOT, 'lib', 'images.manifest.json');
+const FALLBACK_MANIFEST = path.join(ROOT, 'lib', 'images.fallback.json');
+
+// Widths cover the rendered CSS size at 1x-3x device pixel ratios
+const IMAGES = {
+    'hero-bg': { src: 'public/hero-bg.jpg', widths: [640, 960, 1280, 1920, 2160] },
+    'logo': { src: 'public/logo.png', widths: [120, 240, 360, 480] },
+    'logo-black': { src: 'public/logo-black.png', widths: [60, 150, 300, 450] },
+    'pix-logo': { src: 'public/pix-logo.png', widths: [135, 270, 405] }
+};
+
+const FORMATS = {
+    avif: { quality: 50, effort: 4 },
+    webp: { quality: 75, effort: 4 }
+};
+
+// Bump when encoder settings change so cached outputs are rebuilt
+const PIPELINE_VERSION = 1;
+
+async function loadSharp() {
+    try {
+        return (await import('sharp')).default;
+    } catch {
+        console.warn('build-images: sharp is not installed, serving original images only');
+        return null;
+    }
+}
+
+function hash(data) {
+    return createHash('sha256').update(data).digest('hex').slice(0, 10);
+}
+
+async function readManifest() {
+    try {
+        return JSON.parse(await readFile(MANIFEST, 'utf8'));
+    } catch {
+        return {};
+    }
+}
+
+function imageSize(buffer) {
+    // PNG: IHDR width/height at byte 16
+    if (buffer.readUInt32BE(0) === 0x89504e47) {
+        return { width: buffer.readUInt32BE(16), height: buffer.readUInt32BE(20) };
+    }
+    // JPEG: walk the markers up to the first start-of-frame
+    let offset = 2;
+    while (offset < buffer.length) {
+        const marker = buffer[offset + 1];
+        if (marker >= 0xc0 && marker <= 0xc2) {
+            return { width: buffer.readUInt16BE(offset + 7), height: buffer.readUInt16BE(offset + 5) };
+        }
+        offset += 2 + buffer.readUInt16BE(offset + 2);
+    }
+    throw new Error('unsupported image format');
+}
+
+async function main() {
+    const sharp = await loadSharp();
+    const previous = await readManifest();
+    const manifest = {};
+    const fallback = {};
+    const keep = new Set();
+
+    await mkdir(OUTPUT_DIR, { recursive: true });
+
+    for (const [name, config] of Object.entries(IMAGES)) {
+        const source = await readFile(path.join(ROOT, config.src));
+        const { width, height } = imageSize(source);
+        const sourceHash = hash(JSON.stringify({ v: PIPELINE_VERSION, config, formats: FORMATS }) + hash(source));
+        const entry = { width, height, fallback: '/' + path.relative(path.join(ROOT, 'public'), path.join(ROOT, config.src)), sourceHash, avif: [], webp: [] };
+
+        const cached = previous[name];
+        const upToDate = cached?.sourceHash === sourceHash && cached.avif.length > 0 &&
+            [...cached.avif, ...cached.webp].every(variant => existsSync(path.join(ROOT, 'public', variant.src)));
+
+        if (upToDate) {
+            Object.assign(entry, cached);
+        } else if (sharp) {
+            const widths = config.widths.filter(w => w < width).concat(width).filter((w, i, all) => all.indexOf(w) === i);
+            for (const w of widths) {
+                for (const [format, options] of Object.entries(FORMATS)) {
+                    const output = await sharp(source).resize({ width: w }).toFormat(format, options).toBuffer();
+                    const file = `${name}-${w}.${hash(output)}.${format}`;
+                    await writeFile(path.join(OUTPUT_DIR, file), output);
+                    entry[format].push({ src: `/img/${file}`, width: w, bytes: output.length });
+                }
+            }
+        }
+
+        for (const variant of [...entry.avif, ...entry.webp]) keep.add(path.basename(variant.src));
+        manifest[name] = entry;
+        fallback[name] = { width, height, fallback: entry.fallback, avif: [], webp: [] };
+
+        const largest = entry.avif[entry.avif.length - 1];
+        console.log(`build-images: ${name}${upToDate ? ' (cached)' : ''}: ${source.length} B original` +
+            (largest ? `, ${largest.bytes} B largest AVIF` : ''));
+    }
+
+    // Drop variants of previous builds
+    for (const file of await readdir(OUTPUT_DIR)) {
+        if (!keep.has(file)) await rm(path.join(OUTPUT_DIR, file));
+    }
+
+    await writeFile(MANIFEST, JSON.stringify(manifest, null, 2) + '\n');
+    // Only changes when a source image does; commit it along with the image
+    await writeFile(FALLBACK_MANIFEST, JSON.stringify(fallback, null, 2) + '\n');
+}
+
+main().catch(error => {
+    console.error('build-images failed:', error);
+    process.exit(1);
+});
@@ -0,0 +1,89 @@
+// First-load JavaScript per route, as a browser receives it.
+//
+//   npm run build && npm start            # in another terminal
+//   node scripts/js-size-report.mjs [--base http://localhost:3000] [--budget /=180 ...] [--json out.json]
+//
+// Fetches each route's HTML, collects every <script src> it references
+// (Next.js chunks and any third-party script), downloads them once and
+// reports raw and gzip sizes. Bundler manifests change between Next.js
+// versions and between webpack and Turbopack; the HTML does not.
+// --budget ROUTE=KB fails (exit 1) when that route's gzip total is larger.
+import { gzipSync } from 'zlib';
+import { writeFile } from 'fs/promises';
+
+const ROUTES = ['/', '/historico', '/admin', '/admin/dashboard'];
+
+function parseArgs(argv) {
+    const options = { base: process.env.BASE_URL || 'http://localhost:3000', budgets: {}, json: null };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        if (arg === '--base') options.base = argv[++i];
+        else if (arg === '--json') options.json = argv[++i];
+        else if (arg === '--budget') {
+            const [route, kb] = argv[++i].split('=');
+            options.budgets[route] = Number(kb) * 1024;
+        } else {
+            throw new Error(`unknown argument: ${arg}`);
+        }
+    }
+    options.base = options.base.replace(/\/$/, '');
+    return options;
+}
+
+function scriptUrls(html, base) {
+    const urls = new Set();
+    for (const match of html.matchAll(/<script\b[^>]*\bsrc="([^"]+)"/g)) {
+        urls.add(new URL(match[1].replace(/&amp;/g, '&'), base + '/').href);
+    }
+    return [...urls];
+}
+
+const sizes = new Map();
+
+async function scriptSize(url) {
+    if (!sizes.has(url)) {
+        sizes.set(url, (async () => {
+            const res = await fetch(url);
+            if (!res.ok) throw new Error(`${res.status} ${url}`);
+            const body = Buffer.from(await res.arrayBuffer());
+            return { raw: body.length, gzip: gzipSync(body, { level: 9 }).length };
+        })());
+    }
+    return sizes.get(url);
+}
+
+function kb(bytes) {
+    return (bytes / 1024).toFixed(1).padStart(8);
+}
+
+async function main() {
+    const options = parseArgs(process.argv.slice(2));
+    const report = {};
+    let failed = false;
+
+    for (const route of ROUTES) {
+        const res = await fetch(options.base + route);
+        const urls = scriptUrls(await res.text(), options.base);
+        const scripts = [];
+        for (const url of urls) scripts.push({ url, ...(await scriptSize(url)) });
+
+        const thirdParty = scripts.filter(s => !s.url.startsWith(options.base));
+        const total = scripts.reduce((sum, s) => ({ raw: sum.raw + s.raw, gzip: sum.gzip + s.gzip }), { raw: 0, gzip: 0 });
+        report[route] = { status: res.status, scripts: scripts.length, ...total, thirdParty: thirdParty.map(s => s.url) };
+
+        const budget = options.budgets[route];
+        const over = budget !== undefined && total.gzip > budget;
+        failed ||= over;
+        console.log(`${route.padEnd(20)} ${String(scripts.length).padStart(3)} scripts ${kb(total.raw)} KB raw ${kb(total.gzip)} KB gzip` +
+            (budget !== undefined ? `  budget ${kb(budget)} KB ${over ? 'OVER' : 'ok'}` : ''));
+        for (const url of thirdParty) console.log(`${''.padEnd(20)} third-party: ${url}`);
+    }
+
+    if (options.json) await writeFile(options.json, JSON.stringify(report, null, 2) + '\n');
+    if (failed) process.exit(1);
+}
+
+main().catch(error => {
+    console.error('js-size-report failed:', error);
+    process.exit(1);
+});
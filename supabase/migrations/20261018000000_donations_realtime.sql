@@ -0,0 +1,8 @@
+-- Let the donation wizard subscribe to status changes of its own payment
+-- (postgres_changes filtered by pagbank_order_id) instead of polling
+-- /api/check-status. Realtime applies the table's RLS SELECT policies.
+alter publication supabase_realtime add table public.donations;
+
+-- The webhook and the Realtime filter both look donations up by MP payment id
+create index if not exists donations_pagbank_order_id_idx
+    on public.donations (pagbank_order_id);
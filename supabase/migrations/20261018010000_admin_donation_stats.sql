@@ -0,0 +1,28 @@
+-- Dashboard summary computed in Postgres, so the admin page fetches one
+-- small JSON object instead of every donation. "Today" and "this month" are
+-- passed in by the caller, which keeps them in the admin's local timezone.
+create or replace function public.admin_donation_stats(today_start timestamptz, month_start timestamptz)
+returns json
+language sql
+stable
+security invoker
+as $$
+    select json_build_object(
+        'total', coalesce(sum(amount) filter (where status = 'paid'), 0),
+        'todayTotal', coalesce(sum(amount) filter (where status = 'paid' and created_at >= today_start), 0),
+        'monthTotal', coalesce(sum(amount) filter (where status = 'paid' and created_at >= month_start), 0),
+        'count', count(*),
+        'pix', count(*) filter (where payment_method = 'pix'),
+        'card', count(*) filter (where payment_method = 'credit_card'),
+        'members', count(distinct payer_cpf)
+    )
+    from public.donations;
+$$;
+
+revoke execute on function public.admin_donation_stats(timestamptz, timestamptz) from public, anon;
+grant execute on function public.admin_donation_stats(timestamptz, timestamptz) to authenticated;
+
+-- Covering index so the aggregate can run as an index-only scan
+create index if not exists donations_stats_idx
+    on public.donations (created_at)
+    include (status, amount, payment_method, payer_cpf);
@@ -0,0 +1,4 @@
+-- Keyset pagination of the admin listing: ORDER BY created_at DESC, id DESC
+-- with "(created_at, id) < cursor" walks this index instead of sorting.
+create index if not exists donations_created_at_id_idx
+    on public.donations (created_at desc, id desc);
@@ -0,0 +1,3 @@
+-- /api/receipts looks up an already stored receipt by its content-addressed path
+create index if not exists receipts_log_storage_path_idx
+    on public.receipts_log (storage_path);
@@ -0,0 +1,53 @@
+-- Collision-free short ids for receipt links, allocated by Postgres.
+--
+-- Each id is a sequence value mapped through n -> (n * M + C) mod 62^7 and
+-- written as 7 base62 characters. M is coprime with 62^7, so the mapping is a
+-- bijection: ids never collide, stay dense, and consecutive receipts don't
+-- get consecutive-looking links. Legacy ids (Math.random, at most 6 base36
+-- characters) are shorter, so old and new ids cannot overlap.
+
+create sequence if not exists public.receipts_log_short_id_seq
+    maxvalue 3521614606207 -- 62^7 - 1: fail loudly rather than wrap around
+    no cycle;
+
+create or replace function public.next_receipt_short_id()
+returns text
+language plpgsql
+volatile
+security definer
+set search_path = public
+as $$
+declare
+    alphabet constant text := '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz';
+    n numeric := (nextval('public.receipts_log_short_id_seq')::numeric * 2176477521739 + 1234567890123)
+        % 3521614606208;
+    result text := '';
+begin
+    for i in 1..7 loop
+        result := substr(alphabet, (n % 62)::int + 1, 1) || result;
+        n := floor(n / 62);
+    end loop;
+    return result;
+end;
+$$;
+
+-- Inserts that omit short_id get one allocated in the same statement
+alter table public.receipts_log
+    alter column short_id set default public.next_receipt_short_id();
+
+-- Random legacy ids may already collide. Those links were already sent to
+-- donors, so no row is deleted: all but the first row of each collision are
+-- flagged and left out of the unique index, and /c/<id> prefers the
+-- unflagged row (the one the old .single() lookup could never return anyway).
+alter table public.receipts_log
+    add column if not exists duplicate boolean not null default false;
+
+update public.receipts_log a
+    set duplicate = true
+    from public.receipts_log b
+    where a.short_id = b.short_id
+      and a.ctid > b.ctid;
+
+create unique index if not exists receipts_log_short_id_key
+    on public.receipts_log (short_id)
+    where not duplicate;
@@ -0,0 +1,11 @@
+-- POST /api/donate accepts an Idempotency-Key header. The key and the
+-- response sent to the donor are stored with the donation so a retry on any
+-- instance returns the original PIX QR / card result instead of charging again.
+alter table public.donations
+    add column if not exists idempotency_key text,
+    add column if not exists payment_response jsonb;
+
+-- One donation per key; rows created without a key are not constrained
+create unique index if not exists donations_idempotency_key_idx
+    on public.donations (idempotency_key)
+    where idempotency_key is not null;
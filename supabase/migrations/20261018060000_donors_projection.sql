@@ -0,0 +1,76 @@
+-- Autofill for /api/check-donor: the latest name/email/phone per CPF, kept
+-- up to date by a trigger on donations, so a lookup is one primary-key read
+-- instead of sorting the donor's whole donation history.
+
+create table if not exists public.donors (
+    cpf text primary key,
+    name text,
+    email text,
+    phone text,
+    last_donation_at timestamptz not null
+);
+
+-- Only reachable through lookup_donor(): anon can fetch one CPF it already
+-- knows, but cannot list the table
+alter table public.donors enable row level security;
+
+create or replace function public.upsert_donor_from_donation()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    -- Keyed by digits only, like the lookup (the API accepts 123.456.789-09)
+    donor_cpf text := regexp_replace(coalesce(new.payer_cpf, ''), '\D', '', 'g');
+begin
+    if donor_cpf = '' then
+        return new;
+    end if;
+
+    insert into public.donors as d (cpf, name, email, phone, last_donation_at)
+    values (donor_cpf, new.payer_name, new.payer_email, new.payer_phone, coalesce(new.created_at, now()))
+    on conflict (cpf) do update
+        set name = excluded.name,
+            email = excluded.email,
+            phone = excluded.phone,
+            last_donation_at = excluded.last_donation_at
+        -- Rows can arrive out of order (batched queue flushes): newest wins
+        where d.last_donation_at <= excluded.last_donation_at;
+    return new;
+end;
+$$;
+
+drop trigger if exists donations_upsert_donor on public.donations;
+create trigger donations_upsert_donor
+    after insert on public.donations
+    for each row execute function public.upsert_donor_from_donation();
+
+-- Composite index: latest donation per CPF without a sort, for the backfill
+-- below and for any per-donor history query
+create index if not exists donations_payer_cpf_created_at_idx
+    on public.donations (payer_cpf, created_at desc);
+
+insert into public.donors (cpf, name, email, phone, last_donation_at)
+select distinct on (cpf) cpf, payer_name, payer_email, payer_phone, created_at
+from (
+    select regexp_replace(payer_cpf, '\D', '', 'g') as cpf, payer_name, payer_email, payer_phone, created_at
+    from public.donations
+    where payer_cpf is not null
+) d
+where cpf <> ''
+order by cpf, created_at desc
+on conflict (cpf) do nothing;
+
+create or replace function public.lookup_donor(donor_cpf text)
+returns table (name text, email text, phone text)
+language sql
+stable
+security definer
+set search_path = public
+as $$
+    select name, email, phone from public.donors where cpf = donor_cpf;
+$$;
+
+revoke execute on function public.lookup_donor(text) from public;
+grant execute on function public.lookup_donor(text) to anon, authenticated;
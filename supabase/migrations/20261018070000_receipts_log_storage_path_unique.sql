@@ -0,0 +1,46 @@
+-- One receipts_log row per stored PDF. getOrCreateReceipt used to look the
+-- path up and insert when it was missing, so two concurrent requests for
+-- the same receipt could both miss and log two short ids for one PDF.
+-- receipt_short_id() now inserts and reads back atomically.
+
+-- Rows that race already logged all point at the same PDF and their links
+-- may have been shared: keep them, flagged (the column comes with the short
+-- id allocator), outside the unique index
+update public.receipts_log a
+    set duplicate = true
+    from public.receipts_log b
+    where a.storage_path = b.storage_path
+      and a.ctid > b.ctid
+      and not b.duplicate;
+
+create unique index if not exists receipts_log_storage_path_key
+    on public.receipts_log (storage_path)
+    where not duplicate;
+
+-- The short id of the receipt stored at receipt_path, logging it on first
+-- use. A concurrent insert of the same path waits on the unique index and
+-- then reads the winner's row, so every caller gets the same id.
+create or replace function public.receipt_short_id(receipt_path text)
+returns text
+language plpgsql
+volatile
+set search_path = public
+as $$
+declare
+    result text;
+begin
+    insert into public.receipts_log (storage_path)
+        values (receipt_path)
+        on conflict (storage_path) where not duplicate do nothing
+        returning short_id into result;
+
+    if result is null then
+        select short_id into result
+            from public.receipts_log
+            where storage_path = receipt_path
+              and not duplicate;
+    end if;
+
+    return result;
+end;
+$$;
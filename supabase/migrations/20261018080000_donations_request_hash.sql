@@ -0,0 +1,6 @@
+-- An Idempotency-Key is bound to the donation it was first used for:
+-- /api/donate stores a hash of the normalised request body next to the key
+-- and answers 422 when the same key comes back with a different body.
+-- Rows stored before this column existed (NULL) are replayed unchecked.
+alter table public.donations
+    add column if not exists request_hash text;
@@ -0,0 +1,186 @@
+-- Dashboard stats from running totals instead of an aggregate over every
+-- donation. Triggers on donations keep per-hour totals by status and
+-- payment method, plus the number of donations per donor CPF and how many
+-- CPFs have at least one, so admin_donation_stats() reads a table that
+-- grows with the hours that had donations, not with the donations themselves.
+--
+-- Hourly buckets (UTC) line up with "today" and "this month" in any
+-- whole-hour timezone, which covers the admin's America/Manaus.
+
+create table if not exists public.donation_stats_hourly (
+    hour timestamptz not null,
+    status text not null,
+    payment_method text not null,
+    donations bigint not null default 0,
+    amount numeric not null default 0,
+    primary key (hour, status, payment_method)
+);
+
+-- Keyed by CPF digits, like the donors projection; a row is removed when
+-- its last donation is deleted, so "members" follows the admin cleanup
+create table if not exists public.donation_stats_donors (
+    cpf text primary key,
+    donations bigint not null
+);
+
+create table if not exists public.donation_stats_totals (
+    id boolean primary key default true check (id),
+    members bigint not null default 0
+);
+
+-- Accounts allowed to read the dashboard stats. Every account that exists
+-- today is a dashboard admin (there is no public sign-up); add new admins here.
+create table if not exists public.admin_users (
+    user_id uuid primary key references auth.users (id) on delete cascade,
+    created_at timestamptz not null default now()
+);
+
+insert into public.admin_users (user_id)
+select id from auth.users
+on conflict (user_id) do nothing;
+
+-- Only reachable through admin_donation_stats() (security definer)
+alter table public.donation_stats_hourly enable row level security;
+alter table public.donation_stats_donors enable row level security;
+alter table public.donation_stats_totals enable row level security;
+alter table public.admin_users enable row level security;
+
+create or replace function public.add_donation_stats(
+    created timestamptz, donation_status text, method text, n bigint, total numeric
+)
+returns void
+language sql
+security definer
+set search_path = public
+as $$
+    insert into public.donation_stats_hourly as s (hour, status, payment_method, donations, amount)
+    values (date_trunc('hour', coalesce(created, now())), coalesce(donation_status, ''), coalesce(method, ''),
+            n, coalesce(total, 0))
+    on conflict (hour, status, payment_method) do update
+        set donations = s.donations + excluded.donations,
+            amount = s.amount + excluded.amount;
+$$;
+
+create or replace function public.add_donor_donations(payer_cpf text, n bigint)
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    donor_cpf text := regexp_replace(coalesce(payer_cpf, ''), '\D', '', 'g');
+    remaining bigint;
+begin
+    if donor_cpf = '' then
+        return;
+    end if;
+
+    -- The upsert holds the row lock, so remaining - n is the count before it
+    insert into public.donation_stats_donors as d (cpf, donations)
+    values (donor_cpf, n)
+    on conflict (cpf) do update
+        set donations = d.donations + excluded.donations
+    returning donations into remaining;
+
+    if remaining - n <= 0 and remaining > 0 then
+        update public.donation_stats_totals set members = members + 1;
+    elsif remaining - n > 0 and remaining <= 0 then
+        update public.donation_stats_totals set members = members - 1;
+    end if;
+    if remaining <= 0 then
+        delete from public.donation_stats_donors where cpf = donor_cpf;
+    end if;
+end;
+$$;
+
+create or replace function public.track_donation_stats()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    -- An update moves the row from its old bucket to its new one
+    if tg_op in ('UPDATE', 'DELETE') then
+        perform public.add_donation_stats(old.created_at, old.status, old.payment_method, -1, -old.amount);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') then
+        perform public.add_donation_stats(new.created_at, new.status, new.payment_method, 1, new.amount);
+    end if;
+
+    if tg_op = 'UPDATE' and old.payer_cpf is not distinct from new.payer_cpf then
+        return null;
+    end if;
+    if tg_op in ('UPDATE', 'DELETE') then
+        perform public.add_donor_donations(old.payer_cpf, -1);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') then
+        perform public.add_donor_donations(new.payer_cpf, 1);
+    end if;
+    return null;
+end;
+$$;
+
+-- No donation may slip in between the backfill and the trigger
+lock table public.donations in share row exclusive mode;
+
+truncate public.donation_stats_hourly;
+insert into public.donation_stats_hourly (hour, status, payment_method, donations, amount)
+select date_trunc('hour', created_at), coalesce(status, ''), coalesce(payment_method, ''),
+       count(*), coalesce(sum(amount), 0)
+from public.donations
+group by 1, 2, 3;
+
+truncate public.donation_stats_donors;
+insert into public.donation_stats_donors (cpf, donations)
+select cpf, count(*)
+from (select regexp_replace(payer_cpf, '\D', '', 'g') as cpf from public.donations) d
+where cpf <> ''
+group by cpf;
+
+insert into public.donation_stats_totals (id, members)
+values (true, (select count(*) from public.donation_stats_donors))
+on conflict (id) do update set members = excluded.members;
+
+drop trigger if exists donations_track_stats on public.donations;
+create trigger donations_track_stats
+    after insert or delete or update of created_at, status, payment_method, amount, payer_cpf on public.donations
+    for each row execute function public.track_donation_stats();
+
+-- Same result shape as before. "members" counts donors by CPF digits, so
+-- 123.456.789-09 and 12345678909 are one donor. Security definer so the
+-- rollup tables can stay closed; the admin check replaces RLS on donations.
+create or replace function public.admin_donation_stats(today_start timestamptz, month_start timestamptz)
+returns json
+language plpgsql
+stable
+security definer
+set search_path = public
+as $$
+begin
+    if not exists (select 1 from public.admin_users where user_id = auth.uid()) then
+        raise exception 'permission denied for function admin_donation_stats' using errcode = '42501';
+    end if;
+
+    return (
+        select json_build_object(
+            'total', coalesce(sum(amount) filter (where status = 'paid'), 0),
+            'todayTotal', coalesce(sum(amount) filter (where status = 'paid' and hour >= date_trunc('hour', today_start)), 0),
+            'monthTotal', coalesce(sum(amount) filter (where status = 'paid' and hour >= date_trunc('hour', month_start)), 0),
+            'count', coalesce(sum(donations), 0),
+            'pix', coalesce(sum(donations) filter (where payment_method = 'pix'), 0),
+            'card', coalesce(sum(donations) filter (where payment_method = 'credit_card'), 0),
+            'members', coalesce((select members from public.donation_stats_totals), 0)
+        )
+        from public.donation_stats_hourly
+    );
+end;
+$$;
+
+revoke execute on function public.admin_donation_stats(timestamptz, timestamptz) from public, anon;
+grant execute on function public.admin_donation_stats(timestamptz, timestamptz) to authenticated;
+revoke execute on function public.add_donation_stats(timestamptz, text, text, bigint, numeric) from public, anon, authenticated;
+revoke execute on function public.add_donor_donations(text, bigint) from public, anon, authenticated;
+
+-- Only the old aggregate read this covering index
+drop index if exists public.donations_stats_idx;
@@ -1,158 +1,39 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the 'Dízimos' button to select donation type Tithes
-        frame = context.pages[-1]
-        # Click the 'Dízimos' button to select donation type Tithes
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Feito' button to confirm donation type selection
-        frame = context.pages[-1]
-        # Click the 'Feito' button to confirm donation type selection
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Enter a valid custom donation amount in the amount input field
-        frame = context.pages[-1]
-        # Enter a valid custom donation amount with correct currency formatting
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100.00')
-        
+from support.pages import DonationWizard
 
-        # -> Click the 'Selecione o local...' dropdown to select a church location
-        frame = context.pages[-1]
-        # Click the 'Selecione o local...' dropdown to select a church location
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Select the 'Chama Church - Manaus' location by clicking its radio button
-        frame = context.pages[-1]
-        # Select the 'Chama Church - Manaus' location by clicking its radio button
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def test_tc001_successful_multi_type_donation_workflow_with_pix_payment(page, waits, base_url):
+    wizard = await DonationWizard(page, waits).open(base_url)
 
-        # -> Click the 'Continuar' button to proceed to personal information form
-        frame = context.pages[-1]
-        # Click the 'Continuar' button to proceed to personal information form
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Select the 'Dízimos' donation type and confirm it with 'Feito'
+    await wizard.choose_type("dizimo")
 
-        # -> Enter a valid CPF in the CPF input field
-        frame = context.pages[-1]
-        # Enter a valid CPF in the CPF input field
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123.456.789-09')
-        
+    # -> Enter a valid custom donation amount in the amount input field
+    await wizard.enter_amount('100.00')
 
-        # -> Enter full name, WhatsApp number, and optionally email, then click 'Ir para Pagamento' button
-        frame = context.pages[-1]
-        # Enter full name in 'Nome Completo' field
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('João Silva')
-        
+    # -> Select the 'Chama Church - Manaus' location
+    await wizard.choose_location("central")
 
-        frame = context.pages[-1]
-        # Enter WhatsApp number in 'WhatsApp' field
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('(11) 91234-5678')
-        
+    # -> Click the 'Continuar' button to proceed to personal information form
+    await wizard.continue_to_identification()
 
-        frame = context.pages[-1]
-        # Enter email in 'E-mail (Opcional)' field
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('joao.silva@example.com')
-        
+    # -> Enter a valid CPF in the CPF input field
+    await wizard.enter_cpf('123.456.789-09')
 
-        frame = context.pages[-1]
-        # Click 'Ir para Pagamento' button to proceed to payment
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Enter full name, WhatsApp number, and optionally email, then click 'Ir para Pagamento' button
+    await wizard.fill_personal_info('João Silva', '(11) 91234-5678', 'joao.silva@example.com')
+    await wizard.continue_to_payment()
 
-        # -> Click the 'PIX' button to select PIX payment method
-        frame = context.pages[-1]
-        # Click the 'PIX' button to select PIX payment method
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Select PIX and click 'Finalizar Doação' to proceed to QR code generation and PIX payment details
+    await wizard.choose_payment("pix")
+    await wizard.submit_payment()
 
-        # -> Click the 'Finalizar Doação' button to proceed to QR code generation and PIX payment details
-        frame = context.pages[-1]
-        # Click the 'Finalizar Doação' button to proceed to QR code generation and PIX payment details
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Scroll down to check for payment status update or PDF receipt download link/button
+    await page.mouse.wheel(0, 400)
 
-        # -> Scroll down to check for payment status update or PDF receipt download link/button
-        await page.mouse.wheel(0, 400)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Donation Completed Successfully! Thank you for your generosity.').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The donation process did not complete successfully as expected. The payment confirmation and receipt download steps were not verified.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Donation Completed Successfully! Thank you for your generosity.').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The donation process did not complete successfully as expected. The payment confirmation and receipt download steps were not verified.")
@@ -1,114 +1,27 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 'Selecione o local...' dropdown to start donation form process.
-        frame = context.pages[-1]
-        # Click on 'Selecione o local...' dropdown to start donation form process.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from support.pages import DonationWizard
 
-        # -> Click on 'Chama Church - Manaus' location to proceed.
-        frame = context.pages[-1]
-        # Click on 'Chama Church - Manaus' location to proceed.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Click 'Continuar' button to proceed to personal info section of donation form.
-        frame = context.pages[-1]
-        # Click 'Continuar' button to proceed to personal info section of donation form.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def test_tc005_donor_information_auto_fill_based_on_existing_cpf(page, waits, base_url):
+    wizard = await DonationWizard(page, waits).open(base_url)
 
-        # -> Input a valid donation amount (e.g., 10) in the amount field and then click 'Continuar' to proceed to the personal info section.
-        frame = context.pages[-1]
-        # Input a valid donation amount of 10 in the amount field.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('10')
-        
+    # -> Select 'Chama Church - Manaus' location and click 'Continuar' without an amount
+    await wizard.choose_location("central")
+    await wizard.continue_to_identification(advance=False)
 
-        frame = context.pages[-1]
-        # Click 'Continuar' button to proceed to personal info section after setting amount.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Input a valid donation amount (e.g., 10) and then click 'Continuar' to proceed to the personal info section.
+    await wizard.enter_amount('10')
+    await wizard.continue_to_identification()
 
-        # -> Input a registered CPF into the CPF field to trigger auto-fill of name, email, and phone fields.
-        frame = context.pages[-1]
-        # Input a registered CPF to test auto-fill of personal info fields.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123.456.789-00')
-        
+    # -> Input a registered CPF into the CPF field to trigger auto-fill of name, email, and phone fields.
+    await wizard.enter_cpf('123.456.789-00')
 
-        # -> Verify if the auto-fill triggers on field blur or after a delay, try clicking outside the CPF field or pressing tab to trigger auto-fill. If still no auto-fill, report the issue.
-        frame = context.pages[-1]
-        # Click on the 'Nome Completo' field to trigger any auto-fill or validation after CPF input.
-        elem = frame.locator('xpath=html/body/main/div/div/div[2]/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Leave the CPF field to trigger any auto-fill or validation after CPF input.
+    await wizard.cpf_input.press('Tab')
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Auto-fill Successful').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: The test plan execution failed because the donor's personal information fields did not auto-fill correctly after entering a registered CPF.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Auto-fill Successful').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test failed: The test plan execution failed because the donor's personal information fields did not auto-fill correctly after entering a registered CPF.")
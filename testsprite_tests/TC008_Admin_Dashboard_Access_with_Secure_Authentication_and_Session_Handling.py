@@ -1,127 +1,27 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to admin login page
-        frame = context.pages[-1]
-        # Click on 'Meu Histórico' link to check if it leads to admin login or related page
-        elem = frame.locator('xpath=html/body/main/header/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Look for other navigation elements or links that might lead to admin login page, or consider reporting issue if none found.
-        frame = context.pages[-1]
-        # Click on 'Voltar para Doação' to return to main or previous page to find admin login link
-        elem = frame.locator('xpath=html/body/main/header/div/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll down or explore page further to find any hidden or footer links that might lead to admin login page
-        await page.mouse.wheel(0, 300)
-        
+from support.pages import AdminLoginPage, DonationWizard
 
-        # -> Attempt to access admin login page directly via common URL paths like '/admin' or '/login/admin'
-        await page.goto('http://localhost:3000/admin', timeout=10000)
-        await asyncio.sleep(3)
-        
 
-        # -> Attempt login with invalid credentials to verify access denial and error message
-        frame = context.pages[-1]
-        # Input invalid email for login attempt
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid@user.com')
-        
+async def test_tc008_admin_dashboard_access_with_secure_authentication_and_session_handling(page, waits, base_url):
+    wizard = await DonationWizard(page, waits).open(base_url)
 
-        frame = context.pages[-1]
-        # Input invalid password for login attempt
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
-        
+    # -> Look for navigation elements that might lead to the admin login page.
+    history = await wizard.open_history()
+    await history.back_to_donation()
+    await page.mouse.wheel(0, 300)
 
-        frame = context.pages[-1]
-        # Click 'Entrar' button to submit invalid login credentials
-        elem = frame.locator('xpath=html/body/div[2]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Access the admin login page directly
+    login = await AdminLoginPage(page, waits).open(base_url)
 
-        # -> Log in with valid admin credentials to verify access to admin dashboard and session management
-        frame = context.pages[-1]
-        # Input valid admin email for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@chamachurch.com.br')
-        
+    # -> Attempt login with invalid credentials to verify access denial and error message
+    await login.login('invalid@user.com', 'wrongpassword')
 
-        frame = context.pages[-1]
-        # Input valid admin password for login
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('correctpassword')
-        
+    # -> Log in with valid admin credentials to verify access to admin dashboard and session management
+    await login.login('admin@chamachurch.com.br', 'correctpassword')
 
-        frame = context.pages[-1]
-        # Click 'Entrar' button to submit valid admin credentials
-        elem = frame.locator('xpath=html/body/div[2]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Admin Access Granted').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: The test plan execution failed because the admin login security verification did not pass. Only valid admin users should be able to log in securely, sessions must be properly managed, and unauthorized access must be prevented.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Admin Access Granted').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test failed: The test plan execution failed because the admin login security verification did not pass. Only valid admin users should be able to log in securely, sessions must be properly managed, and unauthorized access must be prevented.")
@@ -1,108 +1,24 @@
-import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000/", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Find and click on admin login or dashboard access link/button to log in as admin and open dashboard.
-        frame = context.pages[-1]
-        # Click on 'Meu Histórico' link to check if it leads to login or dashboard access.
-        elem = frame.locator('xpath=html/body/main/header/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try to find an alternative way to access the admin login or dashboard, such as checking the homepage for other links or trying a direct URL.
-        frame = context.pages[-1]
-        # Click 'Voltar para Doae7e3o' to return to the donation homepage and look for admin login or dashboard access.
-        elem = frame.locator('xpath=html/body/main/header/div/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from support.pages import AdminLoginPage, DonationWizard
 
-        # -> Try to find an alternative way to access the admin dashboard or admin login, such as checking for other links or buttons on the homepage or trying a direct URL.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
 
-        # -> Try to access the admin dashboard by navigating directly to common admin URLs such as '/admin' or '/dashboard'.
-        await page.goto('http://localhost:3000/admin', timeout=10000)
-        await asyncio.sleep(3)
-        
+async def test_tc009_admin_dashboard_donation_metrics_filtering_pagination_and_cleanup(page, waits, base_url):
+    wizard = await DonationWizard(page, waits).open(base_url)
 
-        # -> Input admin email and password, then click 'Entrar' to log in to the admin dashboard.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@chamachurch.com.br')
-        
+    # -> Look for an admin login or dashboard link from the homepage.
+    history = await wizard.open_history()
+    await history.back_to_donation()
+    await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
 
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/div[2]/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin_password')
-        
+    # -> Access the admin login page directly
+    login = await AdminLoginPage(page, waits).open(base_url)
 
-        frame = context.pages[-1]
-        # Click 'Entrar' button to log in
-        elem = frame.locator('xpath=html/body/div[2]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Input admin email and password, then click 'Entrar' to log in to the admin dashboard.
+    await login.login('admin@chamachurch.com.br', 'admin_password')
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Nonexistent Donation Summary').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError('Test case failed: The admin dashboard did not display the expected aggregated donation metrics or failed to load correctly as per the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # --> Assertions to verify final state
+    try:
+        await expect(page.locator('text=Nonexistent Donation Summary').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError('Test case failed: The admin dashboard did not display the expected aggregated donation metrics or failed to load correctly as per the test plan.')
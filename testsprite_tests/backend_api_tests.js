@@ -52,13 +52,14 @@ function logTest(name, passed, message = '') {
 }
 
 // Helper function to make API requests
-async function apiRequest(endpoint, method = 'POST', body = null) {
+async function apiRequest(endpoint, method = 'POST', body = null, headers = {}) {
     const startTime = Date.now();
     try {
         const response = await fetch(`${BASE_URL}${endpoint}`, {
             method,
             headers: {
                 'Content-Type': 'application/json',
+                ...headers
             },
             body: body ? JSON.stringify(body) : null,
         });
@@ -119,6 +120,26 @@ async function testDonateFunctionality() {
         result4.status === 200 || result4.status === 500,
         result4.status === 500 ? 'Expected: Requires SSL/HTTPS' : ''
     );
+
+    // API-TC013: Retried request with the same Idempotency-Key is not charged twice
+    const idempotencyKey = `api-tc013-${Date.now()}`;
+    const [first, retry] = await Promise.all([
+        apiRequest('/api/donate', 'POST', validDonation, { 'Idempotency-Key': idempotencyKey }),
+        apiRequest('/api/donate', 'POST', validDonation, { 'Idempotency-Key': idempotencyKey })
+    ]);
+    const replay = await apiRequest('/api/donate', 'POST', validDonation, { 'Idempotency-Key': idempotencyKey });
+    logTest(
+        'API-TC013: Same Idempotency-Key returns the original payment',
+        first.status === 200 && retry.data?.id === first.data?.id && replay.data?.id === first.data?.id,
+        `Payment ids: ${first.data?.id}, ${retry.data?.id}, ${replay.data?.id}`
+    );
+
+    const badKey = await apiRequest('/api/donate', 'POST', validDonation, { 'Idempotency-Key': 'x' });
+    logTest(
+        'API-TC013: Malformed Idempotency-Key is rejected',
+        badKey.status === 400,
+        `Status: ${badKey.status}`
+    );
 }
 
 // Test Suite 2: POST /api/donate - Validation Tests
@@ -324,6 +345,32 @@ async function testErrorHandling() {
 }
 
 // Main test runner
+// Test Suite 8: GET /api/metrics - Prometheus exposition
+async function testMetrics() {
+    console.log(`\n${colors.cyan}=== Test Suite 8: /api/metrics ===${colors.reset}\n`);
+
+    // API-TC014: Route and stage latencies are exported after traffic
+    try {
+        const response = await fetch(`${BASE_URL}/api/metrics`, {
+            headers: process.env.METRICS_TOKEN ? { Authorization: `Bearer ${process.env.METRICS_TOKEN}` } : {}
+        });
+        const text = await response.text();
+        logTest(
+            'API-TC014: Metrics endpoint serves Prometheus text',
+            response.status === 200 && (response.headers.get('content-type') || '').startsWith('text/plain'),
+            `Status: ${response.status}`
+        );
+        logTest(
+            'API-TC014: Request counters and stage histograms are present',
+            text.includes('chamachurch_http_requests_total{route="/api/donate"') &&
+            text.includes('chamachurch_stage_duration_seconds_bucket{stage="validation"'),
+            'Expected /api/donate counters and validation stage buckets'
+        );
+    } catch (error) {
+        logTest('API-TC014: Metrics endpoint serves Prometheus text', false, error.message);
+    }
+}
+
 async function runAllTests() {
     console.log(`${colors.blue}
 ╔═══════════════════════════════════════════════════════════╗
@@ -340,6 +387,7 @@ ${colors.reset}`);
         await testSecurity();
         await testPerformance();
         await testErrorHandling();
+        await testMetrics();
 
         // Print summary
         console.log(`\n${colors.blue}═══════════════════════════════════════════════════════════${colors.reset}`);
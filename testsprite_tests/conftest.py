@@ -0,0 +1,87 @@
+"""Shared Playwright fixtures for the TestSprite E2E suite.
+
+Each pytest-xdist worker launches Chromium once per session; every scenario
+gets its own BrowserContext (isolated cookies/storage) and page, so the
+twelve scenarios run concurrently instead of paying twelve cold starts.
+"""
+import os
+
+import pytest
+from playwright import async_api
+
+from support.waits import Waits
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000").rstrip("/")
+HEADLESS = os.environ.get("HEADED", "") == ""
+
+# Wait timings reported by every scenario (collected on the xdist controller)
+_wait_timings = {}
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    return BASE_URL
+
+
+@pytest.fixture(scope="session")
+async def playwright():
+    async with async_api.async_playwright() as pw:
+        yield pw
+
+
+@pytest.fixture(scope="session")
+async def browser(playwright):
+    browser = await playwright.chromium.launch(
+        headless=HEADLESS,
+        args=[
+            "--window-size=1280,720",         # Set the browser window size
+            "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+            "--ipc=host",                     # Use host-level IPC for better stability
+        ],
+    )
+    yield browser
+    await browser.close()
+
+
+@pytest.fixture
+async def context(browser):
+    # A new browser context (like an incognito window) per scenario
+    context = await browser.new_context()
+    context.set_default_timeout(5000)
+    yield context
+    await context.close()
+
+
+@pytest.fixture
+async def page(context):
+    return await context.new_page()
+
+
+@pytest.fixture
+def waits(page, request):
+    recorder = Waits(page)
+    yield recorder
+    request.node.user_properties.append(
+        ("waits", [(t.label, round(t.seconds, 3)) for t in recorder.timings])
+    )
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == "waits":
+            _wait_timings[report.nodeid] = value
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _wait_timings:
+        return
+    terminalreporter.section("time spent waiting on the app")
+    for nodeid, timings in sorted(_wait_timings.items()):
+        total = sum(seconds for _, seconds in timings)
+        slowest = max(timings, key=lambda t: t[1], default=("-", 0))
+        terminalreporter.write_line(
+            f"{total:7.2f}s over {len(timings):2d} waits, slowest {slowest[1]:.2f}s "
+            f"({slowest[0]})  {nodeid.split('::')[0]}"
+        )
@@ -0,0 +1,375 @@
+"""Local stand-in for the Mercado Pago payments API.
+
+Implements the two calls lib/mercadopago.ts makes (``POST /v1/payments`` and
+``GET /v1/payments/{id}``) with realistic response bodies, so the donate and
+check-status routes can be exercised, and load-tested, without a network or
+sandbox credentials. Point the app at it with::
+
+    MP_API_BASE_URL=http://127.0.0.1:8090 npm run dev
+    python -m fakes.mercadopago --port 8090 --latency-ms 80 --error-rate 0.01
+
+Behaviour:
+
+* PIX payments start ``pending`` with ``point_of_interaction.transaction_data``
+  and turn ``approved`` after ``--pix-approve-after`` seconds.
+* Card payments follow the sandbox cardholder codes (APRO, CONT, OTHE, CALL,
+  FUND, SECU, EXPI, FORM) found in the token or the payer's first name;
+  anything else is approved. CONT stays ``in_process`` for
+  ``--card-review-after`` seconds, then is approved.
+* ``X-Idempotency-Key`` replays the original payment.
+* When a payment has a ``notification_url`` the fake POSTs a webhook to it
+  on every status change (PIX approval, card review, ``/__admin`` override),
+  signed like MP's ``x-signature`` with ``--webhook-secret``.
+* Latency and error injection are set on the command line or at runtime via
+  ``POST /__admin/config``; ``GET /__admin/stats`` reports request counts.
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from aiohttp import ClientSession, ClientTimeout, web
+
+# 1x1 transparent PNG, enough for the wizard's <img src="data:image/png;base64,...">
+QR_CODE_PNG_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+# Sandbox cardholder codes -> (status, status_detail)
+CARD_OUTCOMES = {
+    "APRO": ("approved", "accredited"),
+    "CONT": ("in_process", "pending_contingency"),
+    "OTHE": ("rejected", "cc_rejected_other_reason"),
+    "CALL": ("rejected", "cc_rejected_call_for_authorize"),
+    "FUND": ("rejected", "cc_rejected_insufficient_amount"),
+    "SECU": ("rejected", "cc_rejected_bad_filled_security_code"),
+    "EXPI": ("rejected", "cc_rejected_bad_filled_date"),
+    "FORM": ("rejected", "cc_rejected_bad_filled_other"),
+}
+
+# Every status a real payment can have; /__admin overrides must use one of them
+PAYMENT_STATUSES = {
+    "pending", "approved", "authorized", "in_process", "in_mediation",
+    "rejected", "cancelled", "refunded", "charged_back",
+}
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    pix_approve_after: float = 30.0
+    card_review_after: float = 10.0
+    webhook_secret: str = ""
+
+
+@dataclass
+class FakePayment:
+    body: dict
+    created: float = field(default_factory=time.monotonic)
+    forced_status: tuple = None
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _card_code(body):
+    candidates = [str(body.get("token") or ""), str(body.get("payer", {}).get("first_name") or "")]
+    for candidate in candidates:
+        for code in CARD_OUTCOMES:
+            if code in candidate.upper():
+                return code
+    return "APRO"
+
+
+def _pix_emv(payment_id, amount):
+    # Shape of a BR Code ("copia e cola"); the CRC is not meant to be valid
+    value = f"{float(amount):.2f}"
+    return (
+        f"00020126580014br.gov.bcb.pix0136{uuid.uuid5(uuid.NAMESPACE_OID, str(payment_id))}"
+        f"52040000530398654{len(value):02d}{value}5802BR5912CHAMA CHURCH6006MANAUS"
+        f"62{len(str(payment_id)) + 4:02d}05{len(str(payment_id)):02d}{payment_id}6304ABCD"
+    )
+
+
+class FakeMercadoPago:
+    def __init__(self, config=None):
+        self.config = config or FakeConfig()
+        self.payments = {}
+        self.idempotency = {}
+        self.stats = {"create": 0, "get": 0, "errors_injected": 0, "not_found": 0, "webhooks": 0}
+        self._ids = itertools.count(int(time.time()) * 1000)
+        self._tasks = set()
+
+    # Status as seen "now": transitions are derived from the payment's age
+    def current_status(self, payment):
+        if payment.forced_status:
+            return payment.forced_status
+        body = payment.body
+        age = time.monotonic() - payment.created
+        if body["payment_method_id"] == "pix":
+            if age >= self.config.pix_approve_after:
+                return "approved", "accredited"
+            return "pending", "pending_waiting_transfer"
+        status, detail = CARD_OUTCOMES[_card_code(body)]
+        if status == "in_process" and age >= self.config.card_review_after:
+            return "approved", "accredited"
+        return status, detail
+
+    def render(self, payment_id):
+        payment = self.payments[payment_id]
+        status, detail = self.current_status(payment)
+        body = dict(payment.body)
+        body.pop("token", None)
+        body.update(
+            status=status,
+            status_detail=detail,
+            date_last_updated=_now_iso(),
+            date_approved=_now_iso() if status == "approved" else None,
+        )
+        return body
+
+    def signature(self, payment_id, request_id, ts):
+        manifest = f"id:{payment_id};request-id:{request_id};ts:{ts};"
+        digest = hmac.new(self.config.webhook_secret.encode(), manifest.encode(), hashlib.sha256).hexdigest()
+        return f"ts={ts},v1={digest}"
+
+    async def notify(self, payment_id, delay=0.0):
+        """POST a ``payment.updated`` webhook to the payment's notification_url."""
+        await asyncio.sleep(delay)
+        url = self.payments[payment_id].body.get("notification_url")
+        if not url:
+            return
+        request_id = str(uuid.uuid4())
+        headers = {"x-request-id": request_id}
+        if self.config.webhook_secret:
+            headers["x-signature"] = self.signature(payment_id, request_id, int(time.time() * 1000))
+        body = {"action": "payment.updated", "type": "payment", "data": {"id": str(payment_id)}}
+        self.stats["webhooks"] += 1
+        try:
+            async with ClientSession(timeout=ClientTimeout(total=5)) as session:
+                await session.post(url, params={"data.id": str(payment_id), "type": "payment"}, json=body, headers=headers)
+        except Exception:
+            # Like MP, a failed delivery is not the payment's problem
+            pass
+
+    def schedule_notification(self, payment_id, delay=0.0):
+        task = asyncio.create_task(self.notify(payment_id, delay))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def simulate_network(self):
+        delay = self.config.latency_ms + random.uniform(0, self.config.latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            self.stats["errors_injected"] += 1
+            raise _error(self.config.error_status, "injected_failure", "Injected by fake Mercado Pago")
+
+    async def create_payment(self, request):
+        self.stats["create"] += 1
+        _require_auth(request)
+        await self.simulate_network()
+
+        key = request.headers.get("X-Idempotency-Key")
+        if key and key in self.idempotency:
+            return web.json_response(self.render(self.idempotency[key]), status=201)
+
+        body = await request.json()
+        if not body.get("transaction_amount") or not body.get("payment_method_id"):
+            raise _error(400, "bad_request", "transaction_amount and payment_method_id are required")
+        if body["payment_method_id"] != "pix" and not body.get("token"):
+            raise _error(400, "bad_request", "card token is required")
+
+        payment_id = next(self._ids)
+        payment = {
+            "id": payment_id,
+            "date_created": _now_iso(),
+            "external_reference": body.get("external_reference"),
+            "description": body.get("description"),
+            "transaction_amount": body["transaction_amount"],
+            "payment_method_id": body["payment_method_id"],
+            "payment_type_id": "bank_transfer" if body["payment_method_id"] == "pix" else "credit_card",
+            "installments": body.get("installments", 1),
+            "issuer_id": body.get("issuer_id"),
+            "token": body.get("token"),
+            "payer": body.get("payer", {}),
+            "notification_url": body.get("notification_url"),
+            "currency_id": "BRL",
+            "live_mode": False,
+        }
+        if body["payment_method_id"] == "pix":
+            payment["point_of_interaction"] = {
+                "type": "OPENPLATFORM",
+                "transaction_data": {
+                    "qr_code": _pix_emv(payment_id, body["transaction_amount"]),
+                    "qr_code_base64": QR_CODE_PNG_BASE64,
+                    "ticket_url": f"https://www.mercadopago.com.br/payments/{payment_id}/ticket",
+                },
+            }
+        self.payments[payment_id] = FakePayment(payment)
+        if key:
+            self.idempotency[key] = payment_id
+        if payment["notification_url"]:
+            status, _ = self.current_status(self.payments[payment_id])
+            if body["payment_method_id"] == "pix":
+                self.schedule_notification(payment_id, self.config.pix_approve_after)
+            elif status == "in_process":
+                self.schedule_notification(payment_id, self.config.card_review_after)
+        return web.json_response(self.render(payment_id), status=201)
+
+    async def get_payment(self, request):
+        self.stats["get"] += 1
+        _require_auth(request)
+        await self.simulate_network()
+        try:
+            payment_id = int(request.match_info["id"])
+        except ValueError:
+            payment_id = None
+        if payment_id not in self.payments:
+            self.stats["not_found"] += 1
+            raise _error(404, "not_found", "Payment not found")
+        return web.json_response(self.render(payment_id))
+
+    async def update_config(self, request):
+        changes = await _json_object(request)
+        # Validate everything first so a bad request changes nothing
+        values = {}
+        for name, value in changes.items():
+            if not hasattr(self.config, name):
+                raise _error(400, "bad_request", f"unknown setting {name}")
+            kind = type(getattr(self.config, name))
+            try:
+                values[name] = kind(value)
+            except (TypeError, ValueError):
+                raise _error(400, "bad_request", f"{name} must be a {kind.__name__}, got {value!r}")
+            if kind is not str and values[name] < 0:
+                raise _error(400, "bad_request", f"{name} must not be negative")
+        if not 0 <= values.get("error_rate", 0) <= 1:
+            raise _error(400, "bad_request", "error_rate must be between 0 and 1")
+        if not 400 <= values.get("error_status", 500) <= 599:
+            raise _error(400, "bad_request", "error_status must be a 4xx or 5xx status")
+        for name, value in values.items():
+            setattr(self.config, name, value)
+        return web.json_response(asdict(self.config))
+
+    async def force_status(self, request):
+        try:
+            payment_id = int(request.match_info["id"])
+        except ValueError:
+            payment_id = None
+        if payment_id not in self.payments:
+            raise _error(404, "not_found", "Payment not found")
+        body = await _json_object(request)
+        status = body.get("status")
+        if status not in PAYMENT_STATUSES:
+            raise _error(400, "bad_request", f"status must be one of {sorted(PAYMENT_STATUSES)}, got {status!r}")
+        detail = body.get("status_detail", status)
+        if not isinstance(detail, str):
+            raise _error(400, "bad_request", "status_detail must be a string")
+        self.payments[payment_id].forced_status = (status, detail)
+        self.schedule_notification(payment_id)
+        return web.json_response(self.render(payment_id))
+
+    async def get_stats(self, request):
+        return web.json_response({**self.stats, "payments": len(self.payments)})
+
+    async def reset(self, request):
+        for task in self._tasks:
+            task.cancel()
+        self.payments.clear()
+        self.idempotency.clear()
+        self.stats = dict.fromkeys(self.stats, 0)
+        return web.json_response({"ok": True})
+
+
+def _error(status, message, description):
+    # Same error body shape the SDK surfaces from the real API
+    return _ERRORS.get(status, web.HTTPInternalServerError)(
+        text=web.json_response({
+            "message": message,
+            "error": message,
+            "status": status,
+            "cause": [{"code": status, "description": description}],
+        }).text,
+        content_type="application/json",
+    )
+
+
+_ERRORS = {
+    400: web.HTTPBadRequest,
+    401: web.HTTPUnauthorized,
+    404: web.HTTPNotFound,
+    429: web.HTTPTooManyRequests,
+    500: web.HTTPInternalServerError,
+    502: web.HTTPBadGateway,
+    503: web.HTTPServiceUnavailable,
+}
+
+
+async def _json_object(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        raise _error(400, "bad_request", "body must be JSON")
+    if not isinstance(body, dict):
+        raise _error(400, "bad_request", "body must be a JSON object")
+    return body
+
+
+def _require_auth(request):
+    if not request.headers.get("Authorization", "").startswith("Bearer "):
+        raise _error(401, "unauthorized", "invalid access token")
+
+
+FAKE = web.AppKey("fake", FakeMercadoPago)
+
+
+def create_app(config=None):
+    fake = FakeMercadoPago(config)
+    app = web.Application()
+    app[FAKE] = fake
+    app.router.add_post("/v1/payments", fake.create_payment)
+    app.router.add_get("/v1/payments/{id}", fake.get_payment)
+    app.router.add_post("/__admin/config", fake.update_config)
+    app.router.add_post("/__admin/payments/{id}/status", fake.force_status)
+    app.router.add_get("/__admin/stats", fake.get_stats)
+    app.router.add_post("/__admin/reset", fake.reset)
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--pix-approve-after", type=float, default=30.0)
+    parser.add_argument("--card-review-after", type=float, default=10.0)
+    parser.add_argument("--webhook-secret", default="", help="same value as the app's MP_WEBHOOK_SECRET")
+    args = parser.parse_args(argv)
+    config = FakeConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        pix_approve_after=args.pix_approve_after,
+        card_review_after=args.card_review_after,
+        webhook_secret=args.webhook_secret,
+    )
+    web.run_app(create_app(config), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""In-memory tables queried with PostgREST's URL grammar, for fakes/supabase.py.
+
+Covers what supabase-js builds from the app's queries: ``select`` of plain
+columns, the ``eq/neq/gt/gte/lt/lte/like/ilike/in/is`` operators (also
+negated with ``not.``), nested ``or=(...)``/``and(...)`` trees, multi-column
+``order`` with nulls placement, ``limit``/``offset``, and Postgres-like
+NULL semantics and type coercion. Errors carry PostgREST's codes and
+messages, so the app's error handling is exercised too.
+"""
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+# Short ids: same bijection as supabase/migrations/*_receipts_short_id_allocator.sql
+SHORT_ID_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+SHORT_ID_SPACE = 62 ** 7
+
+
+class PostgrestError(Exception):
+    def __init__(self, status, code, message, details=None, hint=None):
+        super().__init__(message)
+        self.status = status
+        self.body = {"code": code, "details": details, "hint": hint, "message": message}
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def format_timestamp(value):
+    """Timestamps as PostgREST renders timestamptz: ``2026-10-18T12:00:00.123+00:00``."""
+    return value.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def parse_timestamp(value):
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            raise PostgrestError(400, "22007", f'invalid input syntax for type timestamp with time zone: "{value}"')
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class Table:
+    name: str
+    columns: dict  # column -> type: text | numeric | timestamptz | uuid | jsonb | boolean
+    defaults: dict = field(default_factory=dict)  # column -> callable
+    unique: tuple = ()  # single columns; NULLs never conflict
+    rows: list = field(default_factory=list)
+
+    def coerce(self, column, value):
+        """Value as stored/compared for ``column`` (raises like Postgres on bad input)."""
+        if value is None:
+            return None
+        kind = self.columns[column]
+        if kind == "numeric":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                raise PostgrestError(400, "22P02", f'invalid input syntax for type numeric: "{value}"')
+        if kind == "timestamptz":
+            return parse_timestamp(value)
+        if kind == "boolean":
+            if isinstance(value, bool):
+                return value
+            if str(value).lower() in ("true", "false"):
+                return str(value).lower() == "true"
+            raise PostgrestError(400, "22P02", f'invalid input syntax for type boolean: "{value}"')
+        if kind == "jsonb":
+            return value
+        return str(value)
+
+    def store(self, column, value):
+        value = self.coerce(column, value)
+        return format_timestamp(value) if isinstance(value, datetime) else value
+
+    def check_columns(self, columns):
+        for column in columns:
+            if column not in self.columns:
+                raise PostgrestError(
+                    400, "PGRST204", f"Could not find the '{column}' column of '{self.name}' in the schema cache"
+                )
+
+    def new_row(self, values, columns=None, missing_default=False):
+        """A complete row: ``values`` plus defaults, like INSERT does."""
+        self.check_columns(values)
+        row = {}
+        for column in self.columns:
+            if column in values:
+                row[column] = self.store(column, values[column])
+            elif columns is not None and column in columns and not missing_default:
+                # supabase-js bulk inserts send ?columns=; absent keys become NULL
+                row[column] = None
+            else:
+                default = self.defaults.get(column)
+                row[column] = default() if default else None
+        return row
+
+    def check_unique(self, new_rows, replacing=()):
+        """Raise on a duplicate among the table's rows (except ``replacing``) and ``new_rows``."""
+        replaced = {id(row) for row in replacing}
+        for column in self.unique:
+            seen = {row[column] for row in self.rows if id(row) not in replaced and row[column] is not None}
+            for row in new_rows:
+                value = row[column]
+                if value is None:
+                    continue
+                if value in seen:
+                    raise PostgrestError(
+                        409, "23505", f'duplicate key value violates unique constraint "{self.name}_{column}_key"',
+                        details=f"Key ({column})=({value}) already exists.",
+                    )
+                seen.add(value)
+
+
+def uuid_default():
+    return str(uuid.uuid4())
+
+
+def now_default():
+    return format_timestamp(_now())
+
+
+def short_id_allocator(start=1):
+    counter = iter(range(start, SHORT_ID_SPACE))
+
+    def next_short_id():
+        n = (next(counter) * 2176477521739 + 1234567890123) % SHORT_ID_SPACE
+        digits = []
+        for _ in range(7):
+            n, rest = divmod(n, 62)
+            digits.append(SHORT_ID_ALPHABET[rest])
+        return "".join(reversed(digits))
+
+    return next_short_id
+
+
+# Filter grammar -------------------------------------------------------------
+
+def split_top_level(text):
+    """Split on commas outside parentheses and double quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _like(pattern, case_insensitive):
+    regex = "".join(
+        ".*" if c in "%*" else "." if c == "_" else re.escape(c) for c in pattern
+    )
+    return re.compile(f"^{regex}$", re.DOTALL | (re.IGNORECASE if case_insensitive else 0))
+
+
+OPERATORS = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+}
+
+
+def parse_filter(table, column, expression):
+    """Predicate for ``column=<expression>``, e.g. ``eq.paid`` or ``not.in.(a,b)``."""
+    if column not in table.columns:
+        raise PostgrestError(400, "42703", f"column {table.name}.{column} does not exist")
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    op, _, raw = expression.partition(".")
+
+    if op == "is":
+        wanted = {"null": None, "true": True, "false": False}.get(raw.lower(), ...)
+        if wanted is ...:
+            raise PostgrestError(400, "PGRST100", f"failed to parse filter ({expression})")
+
+        def test(value):
+            return value is wanted
+    elif op in OPERATORS:
+        target = table.coerce(column, _unquote(raw))
+        compare = OPERATORS[op]
+
+        def test(value):
+            return value is not None and compare(table.coerce(column, value), target)
+    elif op == "in":
+        if not (raw.startswith("(") and raw.endswith(")")):
+            raise PostgrestError(400, "PGRST100", f"failed to parse filter ({expression})")
+        targets = {table.coerce(column, _unquote(v)) for v in split_top_level(raw[1:-1])}
+
+        def test(value):
+            return value is not None and table.coerce(column, value) in targets
+    elif op in ("like", "ilike"):
+        regex = _like(_unquote(raw), op == "ilike")
+
+        def test(value):
+            return value is not None and regex.match(str(value)) is not None
+    else:
+        raise PostgrestError(400, "PGRST100", f"failed to parse filter ({expression})")
+
+    if not negate:
+        return lambda row: test(row[column])
+    if op == "is":
+        return lambda row: not test(row[column])
+    # SQL semantics: a comparison with NULL is never true, negated or not
+    return lambda row: row[column] is not None and not test(row[column])
+
+
+def parse_logic(table, text):
+    """Predicate for one item of an ``or``/``and`` tree: ``and(a.eq.1,b.lt.2)`` or ``a.eq.1``."""
+    match = re.fullmatch(r"(not\.)?(and|or)\((.*)\)", text, re.DOTALL)
+    if match:
+        negate, combinator, body = match.groups()
+        predicates = [parse_logic(table, part) for part in split_top_level(body)]
+        join = all if combinator == "and" else any
+        if negate:
+            return lambda row: not join(p(row) for p in predicates)
+        return lambda row: join(p(row) for p in predicates)
+    column, _, expression = text.partition(".")
+    return parse_filter(table, column, expression)
+
+
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "columns", "on_conflict"}
+
+
+def parse_filters(table, params):
+    """Every row filter in the query string, ANDed together."""
+    predicates = []
+    for key, value in params.items():
+        if key in RESERVED_PARAMS:
+            continue
+        if key in ("or", "and", "not.or", "not.and"):
+            if not (value.startswith("(") and value.endswith(")")):
+                raise PostgrestError(400, "PGRST100", f'failed to parse logic tree ({value})')
+            predicates.append(parse_logic(table, f"{key}{value}"))
+        else:
+            predicates.append(parse_filter(table, key, value))
+    return predicates
+
+
+def select_rows(table, params, predicates):
+    rows = [row for row in table.rows if all(p(row) for p in predicates)]
+
+    # Sort by the last key first so earlier keys win (stable sort)
+    for term in reversed([t for t in params.get("order", "").split(",") if t]):
+        column, *modifiers = term.split(".")
+        if column not in table.columns:
+            raise PostgrestError(400, "42703", f"column {table.name}.{column} does not exist")
+        descending = "desc" in modifiers
+        nulls_first = "nullsfirst" in modifiers or (descending and "nullslast" not in modifiers)
+        present = [r for r in rows if r[column] is not None]
+        missing = [r for r in rows if r[column] is None]
+        present.sort(key=lambda r: table.coerce(column, r[column]), reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+def page(rows, params):
+    offset = int(params.get("offset", 0))
+    limit = params.get("limit")
+    return rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+
+
+def project(table, rows, select):
+    if not select or select == "*":
+        return [dict(row) for row in rows]
+    columns = [c.strip() for c in split_top_level(select) if c.strip()]
+    for column in columns:
+        if column not in table.columns:
+            raise PostgrestError(400, "42703", f"column {table.name}.{column} does not exist")
+    return [{column: row[column] for column in columns} for row in rows]
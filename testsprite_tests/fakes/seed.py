@@ -0,0 +1,83 @@
+"""Datasets for fakes/supabase.py, in the body format of ``POST /__admin/seed``.
+
+``demo()`` is deterministic for a given seed: the same donors, amounts and
+payment ids on every run, spread over the last ``days`` days so the
+dashboard's "today" and "this month" cards and the history date filters
+all have rows to show.
+"""
+import random
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+from load.scenarios import DONATION_TYPES, LOCATIONS, valid_cpf
+
+# The account the admin scenarios (TC008/TC009) sign in with
+ADMIN = {"email": "admin@chamachurch.com.br", "password": "admin_password"}
+
+# A donor with history: autofill, /historico and receipts have a known CPF to use
+KNOWN_DONOR = {
+    "cpf": "52998224725",
+    "name": "Maria Souza Teste",
+    "email": "maria.teste@example.com",
+    "phone": "92991234567",
+}
+
+FIRST_NAMES = ["João", "Maria", "Ana", "Pedro", "Lucas", "Júlia", "Marcos", "Raquel", "Tiago", "Débora"]
+LAST_NAMES = ["Silva", "Souza", "Oliveira", "Santos", "Lima", "Pereira", "Costa", "Almeida"]
+STATUSES = {"paid": 70, "pending": 20, "canceled": 10}
+METHODS = {"pix": 65, "credit_card": 35}
+
+
+def _ascii(text):
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+
+
+def _donor(rng):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "cpf": valid_cpf(rng),
+        "name": f"{first} {last}",
+        "email": f"{_ascii(first)}.{_ascii(last)}{rng.randrange(100)}@example.com",
+        "phone": f"929{rng.randrange(10**7, 10**8)}",
+    }
+
+
+def _donation(rng, donor, created_at):
+    return {
+        "amount": rng.choice([10, 20, 50, 100, 150, 200, 500]) + rng.choice([0, 0, 0, 0.5]),
+        "type": f"Doação - {rng.choice(DONATION_TYPES)}",
+        "church_location": rng.choice(LOCATIONS),
+        "payment_method": rng.choices(list(METHODS), list(METHODS.values()))[0],
+        "status": rng.choices(list(STATUSES), list(STATUSES.values()))[0],
+        "payer_name": donor["name"],
+        "payer_email": donor["email"],
+        "payer_cpf": donor["cpf"],
+        "payer_phone": donor["phone"],
+        "pagbank_order_id": str(rng.randrange(10**10, 10**11)),
+        "pagbank_reference_id": f"REF-{rng.randrange(10**8):08d}",
+        "created_at": created_at.isoformat(timespec="milliseconds"),
+    }
+
+
+def demo(seed=1, donors=40, donations=400, days=120, now=None):
+    """Admin user plus ``donations`` rows from ``donors`` donors (KNOWN_DONOR has six)."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    people = [_donor(rng) for _ in range(donors - 1)]
+
+    def when():
+        return now - timedelta(seconds=rng.randrange(days * 86400))
+
+    rows = [_donation(rng, KNOWN_DONOR, when()) for _ in range(5)]
+    # The most recent one is paid by PIX today
+    rows.append({**_donation(rng, KNOWN_DONOR, now - timedelta(minutes=30)), "status": "paid", "payment_method": "pix"})
+    rows += [_donation(rng, rng.choice(people), when()) for _ in range(max(0, donations - len(rows)))]
+    rows.sort(key=lambda row: row["created_at"])
+    return {"users": [ADMIN], "donations": rows}
+
+
+def empty():
+    return {"users": [ADMIN]}
+
+
+DATASETS = {"demo": demo, "empty": empty}
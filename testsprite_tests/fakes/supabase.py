@@ -0,0 +1,682 @@
+"""Local stand-in for the Supabase project (PostgREST, Storage and Auth).
+
+Serves the HTTP calls supabase-js makes for lib/supabase.ts, from the
+browser and from the API routes, out of in-memory tables that are seeded
+on start, so the E2E scenarios and load tests run offline and start from
+the same data every time. Point the app at it with::
+
+    python -m fakes.supabase --port 54321 --seed demo
+    NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321 \\
+    NEXT_PUBLIC_SUPABASE_ANON_KEY=<printed on start> npm run dev
+
+Behaviour:
+
+* ``/rest/v1``: the ``donations``, ``receipts_log`` and ``donors`` tables
+  with the columns, defaults, unique keys and triggers of supabase/migrations
+  (short ids from the same allocator, the donors projection kept by the
+  insert trigger), queried with the filters of fakes/postgrest.py.
+  ``lookup_donor``, ``admin_donation_stats`` and ``receipt_short_id`` are
+  served as RPCs.
+  UPDATE and DELETE need a filter, like Supabase's safeupdate.
+* Roles come from the JWTs: the anon key, or an access token from
+  ``/auth/v1/token``. The row policies below grant what the app relies on;
+  ``admin_donation_stats`` needs a seeded account (admin_users; sign-ups
+  are not admins) and deletes need a signed-in user.
+* ``/storage/v1``: uploads (409 on an existing path unless ``x-upsert``)
+  and public downloads for the ``receipts`` bucket, so getPublicUrl links work.
+* ``/auth/v1``: password and refresh-token grants, signup, user and logout,
+  with HS256 tokens signed with ``--jwt-secret``. With the default secret
+  the anon key is the one ``supabase start`` prints.
+* Realtime is not emulated: the wizard falls back to polling /api/check-status.
+* Latency and error injection are set on the command line or at runtime via
+  ``POST /__admin/config``. ``/__admin`` also seeds rows and users, dumps a
+  table, reports request counts per operation and resets to the start data.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aiohttp import web
+
+from fakes.postgrest import (
+    PostgrestError,
+    Table,
+    now_default,
+    page,
+    parse_filters,
+    parse_timestamp,
+    project,
+    select_rows,
+    short_id_allocator,
+    uuid_default,
+)
+from fakes.seed import DATASETS
+
+# The JWT secret of `supabase start`; only ever used for local tokens
+DEV_JWT_SECRET = "super-secret-jwt-token-with-at-least-32-characters-long"
+ACCESS_TOKEN_TTL = 3600
+
+# Table -> role -> allowed operations. RLS hides what a role may not read or
+# change (empty result, nothing updated); a refused insert is an error.
+POLICIES = {
+    "donations": {
+        "anon": {"select", "insert", "update"},
+        "authenticated": {"select", "insert", "update", "delete"},
+    },
+    "receipts_log": {
+        "anon": {"select", "insert"},
+        "authenticated": {"select", "insert"},
+    },
+    # RLS enabled without policies: only lookup_donor() (security definer) reads it
+    "donors": {},
+}
+
+REST_VERBS = {"GET": "select", "HEAD": "count", "POST": "insert", "PATCH": "update", "DELETE": "delete"}
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    jwt_secret: str = DEV_JWT_SECRET
+
+
+class ServiceError(Exception):
+    """An error response from Storage or Auth, which don't use PostgREST's body."""
+
+    def __init__(self, status, body):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def sign_jwt(claims, secret):
+    header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64(signature)}"
+
+
+def verify_jwt(token, secret):
+    """Claims of a valid, unexpired HS256 token signed with ``secret``, else None."""
+    try:
+        header, payload, signature = token.split(".")
+        expected = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(_b64(expected), signature):
+            return None
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    if claims.get("exp") and claims["exp"] < time.time():
+        return None
+    return claims
+
+
+def create_tables():
+    return {
+        "donations": Table(
+            "donations",
+            {
+                "id": "uuid", "created_at": "timestamptz", "amount": "numeric", "type": "text",
+                "church_location": "text", "payment_method": "text", "status": "text",
+                "payer_name": "text", "payer_email": "text", "payer_cpf": "text", "payer_phone": "text",
+                "pagbank_order_id": "text", "pagbank_reference_id": "text",
+                "idempotency_key": "text", "payment_response": "jsonb", "request_hash": "text",
+            },
+            defaults={"id": uuid_default, "created_at": now_default, "status": lambda: "pending"},
+            unique=("id", "idempotency_key"),
+        ),
+        "receipts_log": Table(
+            "receipts_log",
+            {
+                "id": "uuid", "created_at": "timestamptz", "short_id": "text", "storage_path": "text",
+                "duplicate": "boolean",
+            },
+            defaults={
+                "id": uuid_default, "created_at": now_default, "short_id": short_id_allocator(),
+                "duplicate": lambda: False,
+            },
+            # storage_path is unique only among rows not flagged duplicate; the seeds have none
+            unique=("id", "short_id", "storage_path"),
+        ),
+        "donors": Table(
+            "donors",
+            {"cpf": "text", "name": "text", "email": "text", "phone": "text", "last_donation_at": "timestamptz"},
+            unique=("cpf",),
+        ),
+    }
+
+
+def _prefer(request):
+    prefer = {}
+    for item in request.headers.get("Prefer", "").split(","):
+        key, _, value = item.strip().partition("=")
+        if key:
+            prefer[key] = value
+    return prefer
+
+
+def _bearer(request):
+    value = request.headers.get("Authorization", "")
+    return value[7:].strip() if value.lower().startswith("bearer ") else None
+
+
+class FakeSupabase:
+    def __init__(self, config=None, dataset=None):
+        self.config = config or FakeConfig()
+        self.dataset = dataset or {}
+        self.anon_key = sign_jwt({"iss": "supabase-demo", "role": "anon", "exp": 1983812996}, self.config.jwt_secret)
+        self.service_role_key = sign_jwt(
+            {"iss": "supabase-demo", "role": "service_role", "exp": 1983812996}, self.config.jwt_secret
+        )
+        self.stats = Counter()
+        self.load(self.dataset)
+
+    def load(self, dataset):
+        """Start over from ``dataset`` (see fakes/seed.py)."""
+        self.tables = create_tables()
+        self.users = {}  # email -> user
+        self.admins = set()  # user ids in admin_users: the seeded accounts, not sign-ups
+        self.passwords = {}  # user id -> password
+        self.refresh_tokens = {}  # refresh token -> (user id, session id)
+        self.buckets = {"receipts": {"public": True}}
+        self.objects = {}  # (bucket, path) -> (bytes, content type)
+        self.stats.clear()
+        self.seed(dataset)
+
+    def seed(self, dataset):
+        for user in dataset.get("users", []):
+            self.admins.add(self.create_user(user["email"], user["password"])["id"])
+        for name in ("donations", "receipts_log"):
+            if dataset.get(name):
+                self.insert_rows(self.tables[name], dataset[name])
+
+    # Roles -------------------------------------------------------------------
+
+    def api_key(self, request):
+        """Claims of the request's API key, checked for every service (like Supabase's gateway)."""
+        apikey = request.headers.get("apikey") or request.query.get("apikey")
+        if not apikey:
+            raise ServiceError(401, {
+                "message": "No API key found in request",
+                "hint": "No `apikey` request header or url param was found.",
+            })
+        key_claims = verify_jwt(apikey, self.config.jwt_secret)
+        if key_claims is None:
+            raise ServiceError(401, {"message": "Invalid API key"})
+        return apikey, key_claims
+
+    def claims(self, request):
+        """JWT claims of the request: its access token, else its API key."""
+        apikey, key_claims = self.api_key(request)
+        token = _bearer(request)
+        if not token or token == apikey:
+            return key_claims
+        claims = verify_jwt(token, self.config.jwt_secret)
+        if claims is None:
+            raise PostgrestError(401, "PGRST301", "JWT expired or signature invalid")
+        return claims
+
+    def allowed(self, table, claims, operation):
+        role = claims.get("role")
+        return role == "service_role" or operation in POLICIES[table.name].get(role, ())
+
+    def refuse(self, claims, message):
+        raise PostgrestError(401 if claims.get("role") == "anon" else 403, "42501", message)
+
+    # PostgREST ---------------------------------------------------------------
+
+    def table(self, request):
+        name = request.match_info["table"]
+        if name not in self.tables:
+            raise PostgrestError(404, "PGRST205", f"Could not find the table 'public.{name}' in the schema cache")
+        self.stats[f"{name}.{REST_VERBS.get(request.method, request.method.lower())}"] += 1
+        return self.tables[name]
+
+    def insert_rows(self, table, values, columns=None, missing_default=False):
+        rows = [table.new_row(v, columns, missing_default) for v in values]
+        table.check_unique(rows)
+        table.rows.extend(rows)
+        if table.name == "donations":
+            for row in rows:
+                self.upsert_donor(row)
+        return rows
+
+    def upsert_donor(self, donation):
+        # upsert_donor_from_donation(): keyed by digits, newest donation wins
+        cpf = "".join(c for c in donation["payer_cpf"] or "" if c.isdigit())
+        if not cpf:
+            return
+        donors = self.tables["donors"]
+        donor = {
+            "cpf": cpf, "name": donation["payer_name"], "email": donation["payer_email"],
+            "phone": donation["payer_phone"], "last_donation_at": donation["created_at"] or now_default(),
+        }
+        current = next((row for row in donors.rows if row["cpf"] == cpf), None)
+        if current is None:
+            donors.rows.append(donor)
+        elif parse_timestamp(current["last_donation_at"]) <= parse_timestamp(donor["last_donation_at"]):
+            current.update(donor)
+
+    def respond(self, request, table, rows, status=200, count=None, offset=0):
+        body = project(table, rows, request.query.get("select"))
+        headers = {}
+        if count is not None:
+            end = f"{offset}-{offset + len(body) - 1}" if body else "*"
+            headers["Content-Range"] = f"{end}/{count}"
+        if "application/vnd.pgrst.object+json" in request.headers.get("Accept", ""):
+            if len(body) != 1:
+                raise PostgrestError(
+                    406, "PGRST116", "Cannot coerce the result to a single JSON object",
+                    details=f"The result contains {len(body)} rows",
+                )
+            body = body[0]
+        return web.json_response(body, status=status, headers=headers)
+
+    async def select(self, request):
+        table = self.table(request)
+        claims = self.claims(request)
+        predicates = parse_filters(table, request.query)
+        rows = select_rows(table, request.query, predicates) if self.allowed(table, claims, "select") else []
+        count = len(rows) if "count" in _prefer(request) else None
+        offset = int(request.query.get("offset", 0))
+        return self.respond(request, table, page(rows, request.query), count=count, offset=offset)
+
+    async def insert(self, request):
+        table = self.table(request)
+        claims = self.claims(request)
+        if not self.allowed(table, claims, "insert"):
+            self.refuse(claims, f'new row violates row-level security policy for table "{table.name}"')
+        body = await request.json()
+        columns = request.query.get("columns")
+        if columns:
+            columns = [column.strip().strip('"') for column in columns.split(",")]
+        prefer = _prefer(request)
+        rows = self.insert_rows(
+            table, body if isinstance(body, list) else [body], columns, prefer.get("missing") == "default"
+        )
+        if prefer.get("return") != "representation":
+            return web.Response(status=201)
+        return self.respond(request, table, rows, status=201)
+
+    def matching(self, table, request, claims, operation):
+        predicates = parse_filters(table, request.query)
+        if not predicates:
+            raise PostgrestError(400, "21000", f"{operation.upper()} requires a WHERE clause")
+        if not self.allowed(table, claims, operation):
+            return []
+        return select_rows(table, request.query, predicates)
+
+    async def update(self, request):
+        table = self.table(request)
+        claims = self.claims(request)
+        changes = await request.json()
+        table.check_columns(changes)
+        rows = self.matching(table, request, claims, "update")
+        updated = [{**row, **{c: table.store(c, v) for c, v in changes.items()}} for row in rows]
+        table.check_unique(updated, replacing=rows)
+        for row, new in zip(rows, updated):
+            row.update(new)
+        if _prefer(request).get("return") != "representation":
+            return web.Response(status=204)
+        return self.respond(request, table, rows)
+
+    async def delete(self, request):
+        table = self.table(request)
+        claims = self.claims(request)
+        rows = self.matching(table, request, claims, "delete")
+        deleted = {id(row) for row in rows}
+        table.rows = [row for row in table.rows if id(row) not in deleted]
+        if _prefer(request).get("return") != "representation":
+            return web.Response(status=204)
+        return self.respond(request, table, rows)
+
+    async def rpc(self, request):
+        name = request.match_info["name"]
+        self.stats[f"rpc.{name}"] += 1
+        claims = self.claims(request)
+        functions = {
+            "lookup_donor": (self.lookup_donor, {"anon", "authenticated"}),
+            "admin_donation_stats": (self.admin_donation_stats, {"authenticated"}),
+            "receipt_short_id": (self.receipt_short_id, {"anon", "authenticated"}),
+        }
+        if name not in functions:
+            raise PostgrestError(404, "PGRST202", f"Could not find the function public.{name} in the schema cache")
+        function, roles = functions[name]
+        if claims.get("role") not in roles | {"service_role"}:
+            self.refuse(claims, f"permission denied for function {name}")
+        if name == "admin_donation_stats" and claims.get("role") != "service_role" and claims.get("sub") not in self.admins:
+            self.refuse(claims, f"permission denied for function {name}")
+        args = await request.json() if request.can_read_body else {}
+        result = function(**args)
+        if isinstance(result, (dict, str)):
+            return web.json_response(result)
+        return self.respond(request, self.tables["donors"], result)
+
+    def lookup_donor(self, donor_cpf):
+        return [
+            {"name": row["name"], "email": row["email"], "phone": row["phone"]}
+            for row in self.tables["donors"].rows if row["cpf"] == donor_cpf
+        ]
+
+    def receipt_short_id(self, receipt_path):
+        table = self.tables["receipts_log"]
+        for row in table.rows:
+            if row["storage_path"] == receipt_path and not row["duplicate"]:
+                return row["short_id"]
+        [row] = self.insert_rows(table, [{"storage_path": receipt_path}])
+        return row["short_id"]
+
+    def admin_donation_stats(self, today_start, month_start):
+        today, month = parse_timestamp(today_start), parse_timestamp(month_start)
+        rows = self.tables["donations"].rows
+        paid = [(parse_timestamp(r["created_at"]), r["amount"] or 0) for r in rows if r["status"] == "paid"]
+        return {
+            "total": sum(amount for _, amount in paid),
+            "todayTotal": sum(amount for created, amount in paid if created >= today),
+            "monthTotal": sum(amount for created, amount in paid if created >= month),
+            "count": len(rows),
+            "pix": sum(1 for r in rows if r["payment_method"] == "pix"),
+            "card": sum(1 for r in rows if r["payment_method"] == "credit_card"),
+            # donation_stats_donors: CPFs by digits with at least one donation
+            "members": len({"".join(c for c in r["payer_cpf"] if c.isdigit()) for r in rows if r["payer_cpf"]} - {""}),
+        }
+
+    # Storage -----------------------------------------------------------------
+
+    def bucket(self, request):
+        name = request.match_info["bucket"]
+        self.stats[f"storage.{name}"] += 1
+        if name not in self.buckets:
+            raise ServiceError(404, {"statusCode": "404", "error": "Bucket not found", "message": "Bucket not found"})
+        return name
+
+    async def upload(self, request):
+        self.claims(request)
+        bucket, path = self.bucket(request), request.match_info["path"]
+        if request.content_type.startswith("multipart/"):
+            # Browser uploads: a form with the file under an empty field name
+            reader = await request.multipart()
+            data, content_type = b"", "application/octet-stream"
+            async for part in reader:
+                if part.filename is not None or part.name == "":
+                    data = await part.read()
+                    content_type = part.headers.get("Content-Type", content_type)
+        else:
+            data, content_type = await request.read(), request.content_type
+        upsert = request.method == "PUT" or request.headers.get("x-upsert") == "true"
+        if (bucket, path) in self.objects and not upsert:
+            raise ServiceError(400, {"statusCode": "409", "error": "Duplicate", "message": "The resource already exists"})
+        self.objects[(bucket, path)] = (data, content_type)
+        return web.json_response({"Key": f"{bucket}/{path}", "Id": str(uuid.uuid4())})
+
+    def object_response(self, request, bucket):
+        path = request.match_info["path"]
+        if (bucket, path) not in self.objects:
+            raise ServiceError(404, {"statusCode": "404", "error": "not_found", "message": "Object not found"})
+        data, content_type = self.objects[(bucket, path)]
+        headers = {"Cache-Control": "max-age=3600"}
+        if "download" in request.query:
+            filename = request.query["download"] or path.rsplit("/", 1)[-1]
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return web.Response(body=data, content_type=content_type, headers=headers)
+
+    async def public_download(self, request):
+        bucket = self.bucket(request)
+        if not self.buckets[bucket]["public"]:
+            raise ServiceError(400, {"statusCode": "400", "error": "Bucket not public", "message": "Bucket not found"})
+        return self.object_response(request, bucket)
+
+    async def download(self, request):
+        self.claims(request)
+        return self.object_response(request, self.bucket(request))
+
+    # Auth --------------------------------------------------------------------
+
+    def create_user(self, email, password):
+        now = now_default()
+        user = {
+            "id": str(uuid.uuid4()), "aud": "authenticated", "role": "authenticated", "email": email,
+            "email_confirmed_at": now, "confirmed_at": now, "last_sign_in_at": None, "phone": "",
+            "app_metadata": {"provider": "email", "providers": ["email"]}, "user_metadata": {},
+            "identities": [], "created_at": now, "updated_at": now, "is_anonymous": False,
+        }
+        self.users[email.lower()] = user
+        self.passwords[user["id"]] = password
+        return user
+
+    def session(self, request, user, session_id=None):
+        now = int(time.time())
+        session_id = session_id or str(uuid.uuid4())
+        user["last_sign_in_at"] = now_default()
+        claims = {
+            "iss": f"{request.scheme}://{request.host}/auth/v1", "sub": user["id"], "aud": "authenticated",
+            "exp": now + ACCESS_TOKEN_TTL, "iat": now, "email": user["email"], "phone": "",
+            "app_metadata": user["app_metadata"], "user_metadata": user["user_metadata"],
+            "role": "authenticated", "aal": "aal1", "amr": [{"method": "password", "timestamp": now}],
+            "session_id": session_id, "is_anonymous": False,
+        }
+        refresh_token = secrets.token_urlsafe(12)
+        self.refresh_tokens[refresh_token] = (user["id"], session_id)
+        return {
+            "access_token": sign_jwt(claims, self.config.jwt_secret), "token_type": "bearer",
+            "expires_in": ACCESS_TOKEN_TTL, "expires_at": now + ACCESS_TOKEN_TTL,
+            "refresh_token": refresh_token, "user": user,
+        }
+
+    def user_by_id(self, user_id):
+        return next((user for user in self.users.values() if user["id"] == user_id), None)
+
+    async def token(self, request):
+        self.stats["auth.token"] += 1
+        self.api_key(request)
+        body = await request.json()
+        grant = request.query.get("grant_type")
+        if grant == "password":
+            user = self.users.get((body.get("email") or "").lower())
+            if user is None or self.passwords[user["id"]] != body.get("password"):
+                raise ServiceError(400, {"code": 400, "error_code": "invalid_credentials", "msg": "Invalid login credentials"})
+            return web.json_response(self.session(request, user))
+        if grant == "refresh_token":
+            user_id, session_id = self.refresh_tokens.pop(body.get("refresh_token"), (None, None))
+            user = self.user_by_id(user_id)
+            if user is None:
+                raise ServiceError(400, {
+                    "code": 400, "error_code": "refresh_token_not_found",
+                    "msg": "Invalid Refresh Token: Refresh Token Not Found",
+                })
+            return web.json_response(self.session(request, user, session_id))
+        raise ServiceError(400, {"code": 400, "error_code": "validation_failed", "msg": "Unsupported grant type"})
+
+    async def signup(self, request):
+        self.stats["auth.signup"] += 1
+        self.api_key(request)
+        body = await request.json()
+        email, password = (body.get("email") or "").lower(), body.get("password") or ""
+        if email in self.users:
+            raise ServiceError(422, {"code": 422, "error_code": "user_already_exists", "msg": "User already registered"})
+        if len(password) < 6:
+            raise ServiceError(422, {
+                "code": 422, "error_code": "weak_password", "msg": "Password should be at least 6 characters.",
+            })
+        return web.json_response(self.session(request, self.create_user(email, password)))
+
+    def signed_in_user(self, request):
+        claims = verify_jwt(_bearer(request) or "", self.config.jwt_secret)
+        user = self.user_by_id(claims.get("sub")) if claims else None
+        if user is None:
+            raise ServiceError(403, {
+                "code": 403, "error_code": "bad_jwt",
+                "msg": "invalid JWT: unable to parse or verify signature, token is expired or invalid",
+            })
+        return user, claims
+
+    async def get_user(self, request):
+        self.stats["auth.user"] += 1
+        self.api_key(request)
+        user, _ = self.signed_in_user(request)
+        return web.json_response(user)
+
+    async def logout(self, request):
+        self.stats["auth.logout"] += 1
+        self.api_key(request)
+        user, claims = self.signed_in_user(request)
+        scope = request.query.get("scope", "global")
+
+        def revoked(owner):
+            user_id, session_id = owner
+            if user_id != user["id"]:
+                return False
+            if scope == "local":
+                return session_id == claims["session_id"]
+            if scope == "others":
+                return session_id != claims["session_id"]
+            return True
+
+        self.refresh_tokens = {token: owner for token, owner in self.refresh_tokens.items() if not revoked(owner)}
+        return web.Response(status=204)
+
+    # Admin -------------------------------------------------------------------
+
+    async def simulate_network(self):
+        delay = self.config.latency_ms + random.uniform(0, self.config.latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            self.stats["errors_injected"] += 1
+            raise ServiceError(self.config.error_status, {"message": "Injected by fake Supabase"})
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        try:
+            if not request.path.startswith("/__admin"):
+                await self.simulate_network()
+            return await handler(request)
+        except (PostgrestError, ServiceError) as error:
+            return web.json_response(error.body, status=error.status)
+
+    async def update_config(self, request):
+        changes = await request.json()
+        for name, value in changes.items():
+            if not hasattr(self.config, name) or name == "jwt_secret":
+                raise ServiceError(400, {"message": f"unknown setting {name}"})
+            setattr(self.config, name, type(getattr(self.config, name))(value))
+        return web.json_response(asdict(self.config))
+
+    async def admin_seed(self, request):
+        self.seed(await request.json())
+        return web.json_response({name: len(table.rows) for name, table in self.tables.items()})
+
+    async def admin_table(self, request):
+        table = self.tables.get(request.match_info["table"])
+        if table is None:
+            raise ServiceError(404, {"message": "unknown table"})
+        return web.json_response(table.rows)
+
+    async def get_stats(self, request):
+        return web.json_response({
+            "requests": dict(self.stats),
+            "rows": {name: len(table.rows) for name, table in self.tables.items()},
+            "users": len(self.users),
+            "objects": len(self.objects),
+        })
+
+    async def reset(self, request):
+        self.load(self.dataset)
+        return web.json_response({"ok": True})
+
+
+@web.middleware
+async def cors(request, handler):
+    # The browser pages call Supabase directly, from the app's origin
+    if request.method == "OPTIONS":
+        response = web.Response(status=204, headers={
+            "Access-Control-Allow-Methods": "GET, HEAD, POST, PUT, PATCH, DELETE, OPTIONS",
+            "Access-Control-Allow-Headers": request.headers.get("Access-Control-Request-Headers", "*"),
+            "Access-Control-Max-Age": "600",
+        })
+    else:
+        try:
+            response = await handler(request)
+        except web.HTTPException as error:
+            response = web.json_response({"message": error.reason}, status=error.status)
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    response.headers["Access-Control-Expose-Headers"] = "Content-Range, Content-Location, Content-Disposition"
+    return response
+
+
+FAKE = web.AppKey("fake", FakeSupabase)
+
+
+def create_app(config=None, dataset=None):
+    fake = FakeSupabase(config, dataset)
+    app = web.Application(middlewares=[cors, fake.middleware], client_max_size=20 * 1024 * 1024)
+    app[FAKE] = fake
+    app.router.add_post("/rest/v1/rpc/{name}", fake.rpc)
+    app.router.add_get("/rest/v1/{table}", fake.select)
+    app.router.add_post("/rest/v1/{table}", fake.insert)
+    app.router.add_patch("/rest/v1/{table}", fake.update)
+    app.router.add_delete("/rest/v1/{table}", fake.delete)
+    app.router.add_get("/storage/v1/object/public/{bucket}/{path:.+}", fake.public_download)
+    app.router.add_get("/storage/v1/object/{bucket}/{path:.+}", fake.download)
+    app.router.add_post("/storage/v1/object/{bucket}/{path:.+}", fake.upload)
+    app.router.add_put("/storage/v1/object/{bucket}/{path:.+}", fake.upload)
+    app.router.add_post("/auth/v1/token", fake.token)
+    app.router.add_post("/auth/v1/signup", fake.signup)
+    app.router.add_get("/auth/v1/user", fake.get_user)
+    app.router.add_post("/auth/v1/logout", fake.logout)
+    app.router.add_post("/__admin/config", fake.update_config)
+    app.router.add_post("/__admin/seed", fake.admin_seed)
+    app.router.add_get("/__admin/tables/{table}", fake.admin_table)
+    app.router.add_get("/__admin/stats", fake.get_stats)
+    app.router.add_post("/__admin/reset", fake.reset)
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--seed", choices=sorted(DATASETS), default="demo", help="start data, see fakes/seed.py")
+    parser.add_argument("--seed-file", type=Path, help="JSON in the format of POST /__admin/seed, loaded after --seed")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--jwt-secret", default=DEV_JWT_SECRET)
+    args = parser.parse_args(argv)
+    config = FakeConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        jwt_secret=args.jwt_secret,
+    )
+    dataset = DATASETS[args.seed]()
+    if args.seed_file:
+        extra = json.loads(args.seed_file.read_text())
+        dataset = {key: dataset.get(key, []) + extra.get(key, []) for key in {*dataset, *extra}}
+    app = create_app(config, dataset)
+    print(f"NEXT_PUBLIC_SUPABASE_URL=http://{args.host}:{args.port}")
+    print(f"NEXT_PUBLIC_SUPABASE_ANON_KEY={app[FAKE].anon_key}", flush=True)
+    web.run_app(app, host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Open-loop load generator for the donation API routes.
+
+Requests are scheduled at the target rate whatever the app's response times,
+and each latency is measured from the moment the request was *due*, so a
+saturated server shows up as growing latency instead of a quietly lower
+request rate. Run from testsprite_tests/ against a running app (ideally with
+the Mercado Pago and Supabase stand-ins, fakes/mercadopago.py and
+fakes/supabase.py, so the run is offline and starts from the same data)::
+
+    python -m load --mix sunday-offering --profile ramp --rps 200 --duration 60
+    python -m load --mix donate --rps 50 --update-baseline
+
+The report is written to load_test_results.json, next to
+backend_test_results.json. When load_test_baseline.json exists the run is
+compared against it and exits non-zero if p50/p95/p99 latency or the error
+rate regressed beyond the tolerance.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+
+from load.scenarios import MIXES, SCENARIOS, State
+
+HERE = Path(__file__).resolve().parent.parent
+RESULTS_PATH = HERE / "load_test_results.json"
+BASELINE_PATH = HERE / "load_test_baseline.json"
+
+PERCENTILES = (50, 95, 99)
+
+
+# Profiles map elapsed seconds -> requests per second
+def constant(target, duration, ramp):
+    return lambda t: target
+
+
+def ramp_up(target, duration, ramp):
+    """Linear climb to ``target`` over ``ramp`` seconds, then hold."""
+    ramp = ramp or duration / 3
+    return lambda t: max(1.0, target * min(1.0, t / ramp))
+
+
+def steps(target, duration, ramp):
+    """25%, 50%, 75% and 100% of ``target``, a quarter of the run each."""
+    return lambda t: target * min(4, int(4 * t / duration) + 1) / 4
+
+
+def spike(target, duration, ramp):
+    """10% of ``target`` with the full rate in the middle third (the offering moment)."""
+    return lambda t: target if duration / 3 <= t < 2 * duration / 3 else max(1.0, target / 10)
+
+
+PROFILES = {"constant": constant, "ramp": ramp_up, "steps": steps, "spike": spike}
+
+
+@dataclass
+class Sample:
+    scenario: str
+    latency_ms: float
+    status: int
+    ok: bool
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(s.latency_ms for s in samples)
+    errors = sum(not s.ok for s in samples)
+    summary = {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "achieved_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "status_codes": dict(sorted(Counter(str(s.status) for s in samples).items())),
+        "latency_ms": {f"p{q}": _round(percentile(latencies, q)) for q in PERCENTILES},
+    }
+    summary["latency_ms"]["mean"] = _round(sum(latencies) / len(latencies)) if latencies else None
+    summary["latency_ms"]["max"] = _round(latencies[-1]) if latencies else None
+    return summary
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+def build_report(samples, elapsed, settings):
+    by_scenario = defaultdict(list)
+    for sample in samples:
+        by_scenario[sample.scenario].append(sample)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "settings": settings,
+        "duration_s": round(elapsed, 2),
+        "total": summarize(samples, elapsed),
+        "scenarios": {name: summarize(group, elapsed) for name, group in sorted(by_scenario.items())},
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance=0.2, slack_ms=5.0, error_slack=0.01):
+    """List the regressions of ``report`` against ``baseline`` (empty when none).
+
+    A latency percentile regresses when it exceeds the baseline by more than
+    ``tolerance`` (relative) plus ``slack_ms``, which keeps sub-10ms routes
+    from failing on scheduler noise. The error rate may grow by ``error_slack``.
+    """
+    regressions = []
+    for name, base in baseline.get("scenarios", {}).items():
+        current = report["scenarios"].get(name)
+        if current is None:
+            regressions.append(f"{name}: no requests in this run")
+            continue
+        for key in (f"p{q}" for q in PERCENTILES):
+            was, now = base["latency_ms"].get(key), current["latency_ms"].get(key)
+            if was is None or now is None:
+                continue
+            limit = was * (1 + tolerance) + slack_ms
+            if now > limit:
+                regressions.append(f"{name}: {key} {now:.1f}ms > {limit:.1f}ms (baseline {was:.1f}ms)")
+        limit = base["error_rate"] + error_slack
+        if current["error_rate"] > limit:
+            regressions.append(
+                f"{name}: error rate {current['error_rate']:.2%} > {limit:.2%} "
+                f"(baseline {base['error_rate']:.2%})"
+            )
+    return regressions
+
+
+async def _send(session, base_url, scenario, state, rng, due, semaphore, timeout):
+    payload = scenario.payload(state, rng)
+    async with semaphore:
+        try:
+            async with session.post(f"{base_url}{scenario.path}", json=payload, timeout=timeout) as response:
+                status = response.status
+                try:
+                    body = await response.json(content_type=None)
+                except ValueError:
+                    body = None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            status, body = 0, None
+    latency_ms = (time.perf_counter() - due) * 1000
+    scenario.on_response(state, payload, status, body)
+    return Sample(scenario.name, latency_ms, status, status in scenario.expected_status)
+
+
+async def run(base_url, mix, profile, target_rps, duration, ramp=0.0, max_in_flight=256,
+              timeout_s=10.0, seed=None):
+    """Drive ``mix`` at ``profile``'s rate for ``duration`` seconds; returns (samples, elapsed)."""
+    if target_rps <= 0:
+        raise ValueError(f"target_rps must be positive, got {target_rps}")
+    rng = random.Random(seed)
+    rate = PROFILES[profile](target_rps, duration, ramp)
+    names, weights = zip(*MIXES[mix].items())
+    if sum(weights) <= 0:
+        raise ValueError(f"mix {mix!r} has no scenario with a positive weight")
+    state = State()
+    semaphore = asyncio.Semaphore(max_in_flight)
+    timeout = aiohttp.ClientTimeout(total=timeout_s)
+    connector = aiohttp.TCPConnector(limit=max_in_flight)
+    tasks = []
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        offset = 0.0
+        while offset < duration:
+            due = start + offset
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            scenario = SCENARIOS[rng.choices(names, weights)[0]]
+            tasks.append(asyncio.create_task(
+                _send(session, base_url, scenario, state, rng, due, semaphore, timeout)
+            ))
+            rps = rate(offset)
+            if rps <= 0:
+                raise ValueError(f"profile {profile!r} gives {rps} rps at {offset:.1f}s")
+            offset += 1 / rps
+        samples = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+    return list(samples), elapsed
+
+
+def _print_report(report):
+    print(f"\n{'scenario':<14}{'reqs':>7}{'rps':>8}{'err%':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+    rows = list(report["scenarios"].items()) + [("total", report["total"])]
+    for name, s in rows:
+        lat = s["latency_ms"]
+        print(
+            f"{name:<14}{s['requests']:>7}{s['achieved_rps']:>8.1f}{s['error_rate'] * 100:>7.2f}%"
+            + "".join(f"{(lat[k] or 0):>7.1f}ms" for k in ("p50", "p95", "p99"))
+        )
+
+
+def positive_float(value):
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the donation API routes.")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="sunday-offering")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="ramp")
+    parser.add_argument("--rps", type=positive_float, default=50.0, help="target requests per second")
+    parser.add_argument("--duration", type=positive_float, default=30.0, help="seconds")
+    parser.add_argument("--ramp", type=float, default=0.0, help="ramp-up seconds (ramp profile)")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    samples, elapsed = asyncio.run(run(
+        args.base_url.rstrip("/"), args.mix, args.profile, args.rps, args.duration,
+        ramp=args.ramp, max_in_flight=args.max_in_flight, timeout_s=args.timeout, seed=args.seed,
+    ))
+    settings = {k: v for k, v in vars(args).items() if k in ("base_url", "mix", "profile", "rps", "duration", "ramp")}
+    report = build_report(samples, elapsed, settings)
+    _print_report(report)
+
+    regressions = []
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        print(f"\nBaseline updated: {args.baseline}")
+    elif args.baseline.exists():
+        regressions = compare_to_baseline(report, json.loads(args.baseline.read_text()), args.tolerance)
+    report["regressions"] = regressions
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    print(f"Report written to {args.output}")
+
+    if regressions:
+        print("\nLatency regressions against baseline:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
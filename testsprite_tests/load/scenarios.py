@@ -0,0 +1,102 @@
+"""Request scenarios for the API load tests, modeled on ``validDonation``
+from backend_api_tests.js."""
+import random
+from dataclasses import dataclass, field
+
+LOCATIONS = ["central", "manacapuru", "africa", "online"]
+DONATION_TYPES = ["Dízimos", "Ofertas", "Construção", "Chama Social", "Missões África"]
+
+
+def valid_cpf(rng=random):
+    """Random CPF with correct check digits (the fixture's 12345678900 is rejected)."""
+    digits = [rng.randrange(10) for _ in range(9)]
+    while len(set(digits)) == 1:
+        digits = [rng.randrange(10) for _ in range(9)]
+    for size in (9, 10):
+        total = sum(d * (size + 1 - i) for i, d in enumerate(digits[:size]))
+        digits.append((total * 10) % 11 % 10)
+    return "".join(map(str, digits))
+
+
+def valid_donation(rng=random, payment_method="pix"):
+    return {
+        "amount": round(rng.uniform(10, 500), 2),
+        "description": f"Doação - {rng.choice(DONATION_TYPES)}",
+        "churchLocation": rng.choice(LOCATIONS),
+        "paymentMethod": payment_method,
+        "customer": {
+            "name": "João Silva Test",
+            "email": "joao.test@example.com",
+            "cpf": valid_cpf(rng),
+            "phone": f"929{rng.randrange(10**7, 10**8)}",
+        },
+    }
+
+
+@dataclass
+class State:
+    """Shared between scenarios: ids created by donate feed check-status."""
+    payment_ids: list = field(default_factory=list)
+    cpfs: list = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: str
+    expected_status: frozenset = frozenset({200})
+
+    def payload(self, state, rng):
+        raise NotImplementedError
+
+    def on_response(self, state, payload, status, body):
+        pass
+
+
+class Donate(Scenario):
+    def payload(self, state, rng):
+        return valid_donation(rng)
+
+    def on_response(self, state, payload, status, body):
+        if status == 200 and isinstance(body, dict) and body.get("id"):
+            state.payment_ids.append(body["id"])
+            state.cpfs.append(payload["customer"]["cpf"])
+
+
+class CheckDonor(Scenario):
+    def payload(self, state, rng):
+        # Mostly returning members (autofill hits), some first-time donors
+        if state.cpfs and rng.random() < 0.7:
+            return {"cpf": rng.choice(state.cpfs)}
+        return {"cpf": valid_cpf(rng)}
+
+
+class CheckStatus(Scenario):
+    def payload(self, state, rng):
+        return {"id": rng.choice(state.payment_ids) if state.payment_ids else "123456789"}
+
+
+class CheckStatusBatch(Scenario):
+    """A /historico visit: every pending donation of one member at once."""
+
+    def payload(self, state, rng):
+        ids = state.payment_ids[-200:] or ["123456789"]
+        return {"ids": rng.sample(ids, min(len(ids), rng.randint(1, 30)))}
+
+
+SCENARIOS = {
+    "donate": Donate("donate", "/api/donate"),
+    "check-donor": CheckDonor("check-donor", "/api/check-donor"),
+    "check-status": CheckStatus("check-status", "/api/check-status"),
+    "check-status-batch": CheckStatusBatch("check-status-batch", "/api/check-status/batch"),
+}
+
+# Weighted request mixes selectable with --mix
+MIXES = {
+    "donate": {"donate": 1},
+    "check-donor": {"check-donor": 1},
+    "check-status": {"check-status": 1},
+    "check-status-batch": {"check-status-batch": 1},
+    # Sunday offering spike: members look up their CPF, give, then the QR screen polls
+    "sunday-offering": {"check-donor": 0.4, "donate": 0.3, "check-status": 0.3},
+}
@@ -0,0 +1,202 @@
+"""Page objects for the donation wizard, /historico and the admin area.
+
+Every element is located through the ``data-testid`` attributes rendered by
+the components, so lookups are a single attribute match instead of an
+absolute XPath resolved from the document root, and they survive layout
+changes. The objects only need a Playwright page, which lets the same flows
+drive both the E2E scenarios and load-testing clients.
+"""
+from support.waits import Waits
+
+
+class BasePage:
+    path = "/"
+
+    def __init__(self, page, waits=None):
+        self.page = page
+        self.waits = waits or Waits(page)
+
+    def by(self, test_id):
+        return self.page.get_by_test_id(test_id)
+
+    async def open(self, base_url):
+        await self.waits.goto(f"{base_url}{self.path}")
+        return self
+
+
+class DonationWizard(BasePage):
+    """The four-step donation card on ``/`` (app/page.tsx)."""
+
+    path = "/"
+
+    @property
+    def card(self):
+        return self.by("donation-card")
+
+    @property
+    def heading(self):
+        return self.by("wizard-heading")
+
+    async def step(self):
+        return int(await self.card.get_attribute("data-step"))
+
+    async def open_history(self):
+        await self.waits.click(self.by("history-link"), "history link")
+        await self.page.wait_for_url("**/historico")
+        return HistoryPage(self.page, self.waits)
+
+    # Step 1: type, amount and location
+    async def choose_type(self, type_id="dizimo"):
+        await self.waits.click(self.by("type-trigger"), "type trigger")
+        await self.waits.click(self.by(f"type-option-{type_id}"), f"type {type_id}")
+        await self.waits.click(self.by("type-done"), "type done")
+
+    async def enter_amount(self, value):
+        await self.waits.fill(self.by("amount-input"), value, "amount")
+
+    async def open_locations(self):
+        await self.waits.click(self.by("location-trigger"), "location trigger")
+
+    async def close_locations(self):
+        await self.waits.click(self.by("location-modal-close"), "location close")
+
+    async def choose_location(self, location_id="central"):
+        await self.open_locations()
+        await self.waits.click(self.by(f"location-option-{location_id}"), f"location {location_id}")
+
+    async def continue_to_identification(self, advance=True):
+        await self.waits.click(self.by("step1-continue"), "step 1 continue", until_step_change=advance)
+
+    # Step 2: CPF and personal info
+    @property
+    def cpf_input(self):
+        return self.by("cpf-input")
+
+    @property
+    def cpf_error(self):
+        return self.by("cpf-error")
+
+    async def enter_cpf(self, cpf):
+        await self.waits.fill(self.cpf_input, cpf, "cpf")
+
+    async def fill_personal_info(self, name, whatsapp, email=None):
+        await self.waits.fill(self.by("name-input"), name, "name")
+        await self.waits.fill(self.by("whatsapp-input"), whatsapp, "whatsapp")
+        if email is not None:
+            await self.waits.fill(self.by("email-input"), email, "email")
+
+    async def continue_to_payment(self, advance=True):
+        await self.waits.click(self.by("step2-continue"), "step 2 continue", until_step_change=advance)
+
+    # Step 3: payment
+    async def choose_payment(self, method):
+        await self.waits.click(self.by(f"payment-tab-{method}"), f"payment {method}")
+
+    async def fill_card(self, number, expiration, cvv, name):
+        await self.waits.fill(self.by("card-number-input"), number, "card number")
+        await self.waits.fill(self.by("card-exp-input"), expiration, "card expiration")
+        await self.waits.fill(self.by("card-cvv-input"), cvv, "card cvv")
+        await self.waits.fill(self.by("card-name-input"), name, "card name")
+
+    async def submit_payment(self, wait_for_api=True):
+        await self.waits.click(
+            self.by("submit-payment"),
+            "finalizar doação",
+            until_response="/api/donate" if wait_for_api else None,
+        )
+
+    @property
+    def payment_error(self):
+        return self.by("payment-error")
+
+    # PIX QR result
+    @property
+    def pix_qr_image(self):
+        return self.by("pix-qr-image")
+
+    @property
+    def pix_code(self):
+        return self.by("pix-code")
+
+    # Step 4: success
+    @property
+    def success(self):
+        return self.by("donation-success")
+
+
+class HistoryPage(BasePage):
+    """Donation history lookup by CPF (app/historico/page.tsx)."""
+
+    path = "/historico"
+
+    async def search(self, cpf):
+        await self.waits.fill(self.by("history-cpf-input"), cpf, "history cpf")
+        await self.waits.click(self.by("history-search"), "history search")
+
+    async def back_to_donation(self):
+        await self.waits.click(self.page.locator("header a[href='/']").last, "back to donation")
+        await self.page.wait_for_url(lambda url: not url.endswith("/historico"))
+        return DonationWizard(self.page, self.waits)
+
+    @property
+    def member_name(self):
+        return self.by("history-member-name")
+
+    @property
+    def items(self):
+        return self.by("history-item")
+
+    @property
+    def empty_state(self):
+        return self.by("history-empty")
+
+
+class AdminLoginPage(BasePage):
+    path = "/admin"
+
+    async def login(self, email, password):
+        await self.waits.fill(self.by("admin-email"), email, "admin email")
+        await self.waits.fill(self.by("admin-password"), password, "admin password")
+        await self.waits.click(self.by("admin-login"), "admin login", until_response="/auth/v1/token")
+        return AdminDashboard(self.page, self.waits)
+
+    @property
+    def error(self):
+        return self.by("admin-login-error")
+
+
+class AdminDashboard(BasePage):
+    path = "/admin/dashboard"
+
+    STATS = ("total", "today", "month", "count", "pix", "card", "members")
+
+    def stat(self, name):
+        return self.by(f"stat-{name}")
+
+    @property
+    def rows(self):
+        return self.by("donation-row")
+
+    async def filter(self, name, value):
+        """Apply a server-side table filter: ``status``, ``method`` or ``location``."""
+        select = self.by(f"filter-{name}")
+        await self.waits.ready(select, f"filter {name}")
+        await self.waits.response("/api/admin/donations", lambda: select.select_option(value))
+
+    async def next_page(self):
+        await self.waits.click(self.by("page-next"), "next page")
+
+    async def previous_page(self):
+        await self.waits.click(self.by("page-prev"), "previous page")
+
+    async def refresh(self):
+        await self.waits.click(self.by("refresh"), "refresh")
+
+    async def cleanup(self, status):
+        """Delete every donation with ``status`` ('pending' or 'canceled'), accepting the confirm()."""
+        self.page.once("dialog", lambda dialog: dialog.accept())
+        await self.waits.click(self.by("cleanup-menu").locator("summary"), "cleanup menu")
+        await self.waits.click(self.by(f"cleanup-{status}"), f"cleanup {status}")
+
+    async def logout(self):
+        await self.waits.click(self.by("logout"), "logout")
@@ -0,0 +1,82 @@
+// Runs lib/validation (transpiled to JS, path in argv[2]) and the legacy
+// checkers it replaced over the inputs in argv[3] (JSON: {cpf, email, phone}
+// arrays). Prints {results, mismatches, timings} as JSON for the pytest side.
+import { readFileSync } from 'node:fs';
+import { pathToFileURL } from 'node:url';
+
+const validation = await import(pathToFileURL(process.argv[2]).href);
+const inputs = JSON.parse(readFileSync(process.argv[3], 'utf8'));
+
+// Verbatim from app/api/donate/route.ts before the shared module
+function legacyValidateCPF(cpf) {
+    cpf = cpf.replace(/[^\d]/g, '');
+    if (cpf.length !== 11) return false;
+    if (/^(\d)\1{10}$/.test(cpf)) return false;
+    let sum = 0;
+    for (let i = 0; i < 9; i++) sum += parseInt(cpf.charAt(i)) * (10 - i);
+    let digit = 11 - (sum % 11);
+    if (digit >= 10) digit = 0;
+    if (digit !== parseInt(cpf.charAt(9))) return false;
+    sum = 0;
+    for (let i = 0; i < 10; i++) sum += parseInt(cpf.charAt(i)) * (11 - i);
+    digit = 11 - (sum % 11);
+    if (digit >= 10) digit = 0;
+    if (digit !== parseInt(cpf.charAt(10))) return false;
+    return true;
+}
+
+// Verbatim from lib/validation.ts before the rewrite
+function legacyIsValidCPF(cpf) {
+    if (typeof cpf !== 'string') return false;
+    cpf = cpf.replace(/[^\d]+/g, '');
+    if (cpf.length !== 11 || !!cpf.match(/(\d)\1{10}/)) return false;
+    const values = cpf.split('').map(el => +el);
+    const rest = (count) => (values.slice(0, count - 12)
+        .reduce((s, el, i) => s + el * (count - i), 0) * 10) % 11 % 10;
+    return rest(10) === values[9] && rest(11) === values[10];
+}
+
+function legacyValidateEmail(email) {
+    return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);
+}
+
+function legacyValidatePhone(phone) {
+    const phoneDigits = phone.replace(/[^\d]/g, '');
+    return phoneDigits.length >= 10 && phoneDigits.length <= 11;
+}
+
+const checks = {
+    cpf: [validation.isValidCPF, [legacyValidateCPF, legacyIsValidCPF]],
+    email: [validation.isValidEmail, [legacyValidateEmail]],
+    phone: [validation.isValidPhone, [legacyValidatePhone]]
+};
+
+function time(fn, values) {
+    // Warm up the JIT, then measure
+    for (let i = 0; i < Math.min(values.length, 20000); i++) fn(values[i]);
+    const start = process.hrtime.bigint();
+    let accepted = 0;
+    for (const value of values) if (fn(value)) accepted++;
+    const ns = Number(process.hrtime.bigint() - start);
+    return { ns_per_call: ns / values.length, accepted };
+}
+
+const output = { results: {}, mismatches: {}, timings: {} };
+for (const [name, [current, legacies]] of Object.entries(checks)) {
+    const values = inputs[name];
+    const results = values.map(value => current(value) ? 1 : 0);
+    output.results[name] = results.join('');
+    output.mismatches[name] = [];
+    for (const legacy of legacies) {
+        values.forEach((value, i) => {
+            if ((legacy(value) ? 1 : 0) !== results[i] && output.mismatches[name].length < 20) {
+                output.mismatches[name].push({ value, legacy: legacy.name, expected: !results[i] });
+            }
+        });
+    }
+    output.timings[name] = {
+        current: time(current, values),
+        ...Object.fromEntries(legacies.map(legacy => [legacy.name, time(legacy, values)]))
+    };
+}
+process.stdout.write(JSON.stringify(output));
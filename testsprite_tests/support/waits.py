@@ -0,0 +1,82 @@
+"""Event-driven waits for the E2E scenarios.
+
+Replaces the fixed ``wait_for_timeout(3000)`` padding: every helper waits on
+an actual readiness signal (locator visible/enabled, a response from an API
+route, the wizard heading changing) and records how long that took, so the
+suite's wall time reflects the app's latency rather than hardcoded sleeps.
+"""
+import time
+from dataclasses import dataclass, field
+
+from playwright.async_api import expect
+
+DEFAULT_TIMEOUT = 5000
+API_TIMEOUT = 15000
+
+# The donation wizard renders one step heading at a time inside the card
+STEP_HEADING = '[data-testid="wizard-heading"]'
+
+
+@dataclass
+class WaitTiming:
+    label: str
+    seconds: float
+
+
+@dataclass
+class Waits:
+    page: object
+    timings: list = field(default_factory=list)
+
+    def _record(self, label, started):
+        self.timings.append(WaitTiming(label, time.perf_counter() - started))
+
+    async def ready(self, locator, label=None, timeout=DEFAULT_TIMEOUT, editable=False):
+        """Wait until ``locator`` is visible and enabled (or editable)."""
+        started = time.perf_counter()
+        await expect(locator).to_be_visible(timeout=timeout)
+        if editable:
+            await expect(locator).to_be_editable(timeout=timeout)
+        else:
+            await expect(locator).to_be_enabled(timeout=timeout)
+        self._record(label or f"ready {locator}", started)
+
+    async def click(self, locator, label=None, timeout=DEFAULT_TIMEOUT,
+                    until_response=None, until_step_change=False):
+        """Click once ready; optionally block until an API response or a new wizard step."""
+        await self.ready(locator, label, timeout)
+        if until_response:
+            await self.response(until_response, lambda: locator.click(timeout=timeout))
+        elif until_step_change:
+            await self.step_change(lambda: locator.click(timeout=timeout))
+        else:
+            await locator.click(timeout=timeout)
+
+    async def fill(self, locator, value, label=None, timeout=DEFAULT_TIMEOUT):
+        await self.ready(locator, label, timeout, editable=True)
+        await locator.fill(value)
+
+    async def goto(self, url, timeout=10000):
+        """Navigate and wait for DOMContentLoaded on the page and its frames."""
+        started = time.perf_counter()
+        await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        for frame in self.page.frames:
+            await frame.wait_for_load_state("domcontentloaded", timeout=timeout)
+        self._record(f"goto {url}", started)
+
+    async def response(self, url_part, action, timeout=API_TIMEOUT):
+        """Run ``action`` and wait for the matching API response, then for network idle."""
+        started = time.perf_counter()
+        async with self.page.expect_response(lambda r: url_part in r.url, timeout=timeout):
+            await action()
+        await self.page.wait_for_load_state("networkidle", timeout=timeout)
+        self._record(f"response {url_part}", started)
+
+    async def step_change(self, action, timeout=10000):
+        """Run ``action`` and wait for the wizard's step heading to change."""
+        heading = self.page.locator(STEP_HEADING).first
+        before = await heading.text_content(timeout=timeout)
+        started = time.perf_counter()
+        await action()
+        await expect(heading).not_to_have_text(before or "", timeout=timeout)
+        self._record(f"step change from {before!r}", started)
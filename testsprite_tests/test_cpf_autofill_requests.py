@@ -0,0 +1,93 @@
+"""Network-call benchmark for the CPF autofill in the donation wizard.
+
+/api/check-donor is intercepted (hermetic, answers after a delay so requests
+overlap as on a slow connection) and every call the page makes is counted
+while a donor types, corrects, retypes and pastes CPFs. The wizard debounces
+lookups, aborts superseded ones and memoizes answers per session, so each
+distinct CPF settles with exactly one request.
+"""
+import asyncio
+import json
+import random
+
+from playwright.async_api import expect
+
+from load.scenarios import valid_cpf
+from support.pages import DonationWizard
+from support.waits import API_TIMEOUT
+
+LOOKUP_DELAY = 0.4  # seconds; longer than the 300ms debounce
+
+
+def formatted(cpf):
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+def lookup_of(cpf):
+    """Matches the /api/check-donor request (or its response) for ``cpf``."""
+    def matches(event):
+        request = getattr(event, "request", event)
+        return "/api/check-donor" in request.url and json.loads(request.post_data)["cpf"] == cpf
+    return matches
+
+
+async def test_cpf_autofill_makes_one_request_per_distinct_cpf(page, waits, base_url):
+    rng = random.Random(20)
+    first, second = valid_cpf(rng), valid_cpf(rng)
+    lookups = []
+
+    async def check_donor(route):
+        lookups.append(json.loads(route.request.post_data)["cpf"])
+        await asyncio.sleep(LOOKUP_DELAY)
+        try:
+            await route.fulfill(json={"exists": False})
+        except Exception:
+            pass  # aborted by the page: a newer CPF superseded it
+
+    await page.route("**/api/check-donor", check_donor)
+
+    wizard = await DonationWizard(page, waits).open(base_url)
+    await wizard.choose_location("central")
+    await wizard.enter_amount("10")
+    await wizard.continue_to_identification()
+
+    async def answered(cpf, action):
+        async with page.expect_response(lookup_of(cpf), timeout=API_TIMEOUT):
+            await action()
+
+    async def typed_with_typo():
+        await cpf_input.press_sequentially(first[:10] + str((int(first[10]) + 1) % 10), delay=40)
+        await cpf_input.press("Backspace")
+        await cpf_input.press_sequentially(first[10], delay=40)
+
+    # Typed digit by digit, a typo in the last digit fixed right away
+    cpf_input = wizard.cpf_input
+    await waits.ready(cpf_input, "cpf", editable=True)
+    await answered(first, typed_with_typo)
+    name_input = wizard.by("name-input")
+    await expect(name_input).to_be_visible()
+    assert lookups == [first]
+
+    # Another CPF pasted, then the first one again: answered from the memo.
+    # Applying an answer clears the name field, so a typed name going blank
+    # marks each answer as applied, including one that made no request.
+    for cpf in (second, first):
+        await name_input.fill("Nome")
+        if cpf in lookups:
+            await cpf_input.fill(formatted(cpf))
+        else:
+            await answered(cpf, lambda: cpf_input.fill(formatted(cpf)))
+        await expect(name_input).to_have_value("")
+    assert lookups == [first, second]
+
+    # Correcting a CPF while its lookup is in flight: one aborted, one answered
+    third, fourth = valid_cpf(rng), valid_cpf(rng)
+    async with page.expect_request(lookup_of(third), timeout=API_TIMEOUT):
+        await cpf_input.fill(third)
+    await answered(fourth, lambda: cpf_input.fill(fourth))
+    assert lookups == [first, second, third, fourth]
+
+    requests_per_cpf = len(lookups) / 4
+    print(f"\n/api/check-donor: {len(lookups)} requests for 4 distinct CPFs "
+          f"over 6 entries ({requests_per_cpf:.2f} per CPF)")
+    assert requests_per_cpf == 1
@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import hmac
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from fakes.mercadopago import FakeConfig, create_app
+
+AUTH = {"Authorization": "Bearer TEST-token"}
+
+PIX_PAYMENT = {
+    "transaction_amount": 100.0,
+    "description": "Doação - Dízimos",
+    "payment_method_id": "pix",
+    "external_reference": "REF-1",
+    "payer": {"email": "joao@example.com", "first_name": "João"},
+}
+
+
+@pytest.fixture
+async def mp():
+    client = TestClient(TestServer(create_app(FakeConfig(pix_approve_after=0.2, card_review_after=0.2))))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+async def test_pix_payment_has_qr_code_and_is_approved_later(mp):
+    res = await mp.post("/v1/payments", json=PIX_PAYMENT, headers=AUTH)
+    assert res.status == 201
+    created = await res.json()
+    assert created["status"] == "pending"
+    transaction_data = created["point_of_interaction"]["transaction_data"]
+    assert transaction_data["qr_code"].startswith("000201")
+    assert transaction_data["qr_code_base64"]
+
+    await asyncio.sleep(0.25)
+    res = await mp.get(f"/v1/payments/{created['id']}", headers=AUTH)
+    assert (await res.json())["status"] == "approved"
+
+
+@pytest.mark.parametrize("token,status,detail", [
+    ("tok-APRO", "approved", "accredited"),
+    ("tok-FUND", "rejected", "cc_rejected_insufficient_amount"),
+    ("tok-CONT", "in_process", "pending_contingency"),
+])
+async def test_card_outcome_follows_sandbox_codes(mp, token, status, detail):
+    body = {**PIX_PAYMENT, "payment_method_id": "visa", "token": token, "installments": 1}
+    created = await (await mp.post("/v1/payments", json=body, headers=AUTH)).json()
+    assert (created["status"], created["status_detail"]) == (status, detail)
+    assert "token" not in created
+
+
+async def test_idempotency_key_replays_payment(mp):
+    headers = {**AUTH, "X-Idempotency-Key": "abc"}
+    first = await (await mp.post("/v1/payments", json=PIX_PAYMENT, headers=headers)).json()
+    second = await (await mp.post("/v1/payments", json=PIX_PAYMENT, headers=headers)).json()
+    assert first["id"] == second["id"]
+    stats = await (await mp.get("/__admin/stats")).json()
+    assert stats["payments"] == 1
+
+
+async def test_error_injection_and_auth(mp):
+    assert (await mp.post("/v1/payments", json=PIX_PAYMENT)).status == 401
+    await mp.post("/__admin/config", json={"error_rate": 1, "error_status": 429})
+    res = await mp.post("/v1/payments", json=PIX_PAYMENT, headers=AUTH)
+    assert res.status == 429
+    assert (await res.json())["cause"][0]["code"] == 429
+
+
+async def test_admin_overrides_reject_bad_values(mp):
+    for change in ({"latency_ms": "slow"}, {"error_rate": 2}, {"error_status": 200}, {"nope": 1}):
+        res = await mp.post("/__admin/config", json=change)
+        assert res.status == 400, change
+    config = await (await mp.post("/__admin/config", json={"latency_ms": "5"})).json()
+    assert config["latency_ms"] == 5.0 and config["error_rate"] == 0
+
+    created = await (await mp.post("/v1/payments", json=PIX_PAYMENT, headers=AUTH)).json()
+    path = f"/__admin/payments/{created['id']}/status"
+    assert (await mp.post(path, json={"status": "paid"})).status == 400
+    assert (await mp.post(path, data="approved")).status == 400
+    assert (await mp.post("/__admin/payments/x/status", json={"status": "approved"})).status == 404
+    forced = await (await mp.post(path, json={"status": "approved"})).json()
+    assert forced["status"] == "approved"
+
+
+async def test_unknown_payment_is_404(mp):
+    assert (await mp.get("/v1/payments/1", headers=AUTH)).status == 404
+
+
+async def test_status_change_sends_signed_webhook():
+    received = asyncio.Queue()
+
+    async def webhook(request):
+        await received.put((request, await request.json()))
+        return web.json_response({"received": True})
+
+    app = web.Application()
+    app.router.add_post("/api/webhooks/mercadopago", webhook)
+    async with TestServer(app) as receiver:
+        config = FakeConfig(pix_approve_after=0.1, webhook_secret="s3cret")
+        async with TestClient(TestServer(create_app(config))) as mp:
+            body = {**PIX_PAYMENT, "notification_url": str(receiver.make_url("/api/webhooks/mercadopago"))}
+            created = await (await mp.post("/v1/payments", json=body, headers=AUTH)).json()
+            request, payload = await asyncio.wait_for(received.get(), 2)
+
+    payment_id = str(created["id"])
+    assert payload["data"]["id"] == payment_id
+    assert request.query["data.id"] == payment_id
+    ts, v1 = (part.split("=", 1)[1] for part in request.headers["x-signature"].split(","))
+    manifest = f"id:{payment_id};request-id:{request.headers['x-request-id']};ts:{ts};"
+    assert v1 == hmac.new(b"s3cret", manifest.encode(), hashlib.sha256).hexdigest()
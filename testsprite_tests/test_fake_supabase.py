@@ -0,0 +1,193 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from fakes.postgrest import split_top_level
+from fakes.seed import ADMIN, KNOWN_DONOR, demo
+from fakes.supabase import FAKE, create_app
+
+
+@pytest.fixture
+async def sb():
+    client = TestClient(TestServer(create_app(dataset=demo(donations=60))))
+    await client.start_server()
+    key = client.app[FAKE].anon_key
+    client.anon = {"apikey": key, "Authorization": f"Bearer {key}"}
+    yield client
+    await client.close()
+
+
+async def _sign_in(sb):
+    res = await sb.post("/auth/v1/token", params={"grant_type": "password"}, json=ADMIN, headers=sb.anon)
+    assert res.status == 200
+    session = await res.json()
+    return {"apikey": sb.anon["apikey"], "Authorization": f"Bearer {session['access_token']}"}
+
+
+def _donation(cpf, created_at, **extra):
+    return {
+        "amount": 50, "type": "Doação - Dízimos", "church_location": "central", "payment_method": "pix",
+        "status": "pending", "payer_name": "Novo Doador", "payer_email": "novo@example.com",
+        "payer_cpf": cpf, "payer_phone": "92988887777", "pagbank_order_id": "900",
+        "created_at": created_at, **extra,
+    }
+
+
+def test_logic_trees_split_on_top_level_commas_only():
+    parts = split_top_level('created_at.lt."2026-10-18T00:00:00,1",and(created_at.eq.x,id.lt.y)')
+    assert parts == ['created_at.lt."2026-10-18T00:00:00,1"', "and(created_at.eq.x,id.lt.y)"]
+
+
+async def test_requests_need_an_api_key_and_preflight_is_allowed(sb):
+    res = await sb.get("/rest/v1/donations")
+    assert res.status == 401
+    assert res.headers["Access-Control-Allow-Origin"] == "*"
+    res = await sb.options("/rest/v1/donations", headers={"Access-Control-Request-Headers": "apikey,prefer"})
+    assert res.status == 204
+    assert res.headers["Access-Control-Allow-Headers"] == "apikey,prefer"
+
+
+async def test_history_query_filters_orders_and_counts(sb):
+    res = await sb.get("/rest/v1/donations", headers={**sb.anon, "Prefer": "count=exact"}, params=[
+        ("select", "id,created_at,status"),
+        ("payer_cpf", f"eq.{KNOWN_DONOR['cpf']}"),
+        ("created_at", "gte.2000-01-01T00:00:00.000Z"),
+        ("created_at", "lte.2100-01-01T00:00:00.000Z"),
+        ("order", "created_at.desc"),
+        ("limit", "4"),
+    ])
+    rows = await res.json()
+    assert res.headers["Content-Range"] == "0-3/6"
+    assert list(rows[0]) == ["id", "created_at", "status"]
+    assert [r["created_at"] for r in rows] == sorted((r["created_at"] for r in rows), reverse=True)
+
+    res = await sb.get("/rest/v1/donations", headers=sb.anon, params={"nope": "eq.1"})
+    assert res.status == 400 and (await res.json())["code"] == "42703"
+
+
+async def test_keyset_cursor_pages_through_every_row_once(sb):
+    headers = await _sign_in(sb)
+    seen, cursor = [], None
+    while True:
+        params = {"select": "id,created_at", "order": "created_at.desc,id.desc", "limit": "25"}
+        if cursor:
+            params["or"] = (f'(created_at.lt."{cursor["created_at"]}",'
+                            f'and(created_at.eq."{cursor["created_at"]}",id.lt."{cursor["id"]}"))')
+        rows = await (await sb.get("/rest/v1/donations", headers=headers, params=params)).json()
+        seen += [row["id"] for row in rows]
+        if len(rows) < 25:
+            break
+        cursor = rows[-1]
+    assert len(seen) == len(set(seen)) == 60
+
+
+async def test_maybe_single_returns_406_for_no_rows(sb):
+    headers = {**sb.anon, "Accept": "application/vnd.pgrst.object+json"}
+    res = await sb.get("/rest/v1/receipts_log", headers=headers, params={"short_id": "eq.nope", "limit": "1"})
+    assert res.status == 406
+    assert "0 rows" in (await res.json())["details"]
+
+
+async def test_donation_inserts_keep_the_donors_projection_newest_first(sb):
+    now = datetime.now(timezone.utc)
+    newer = _donation("111.444.777-35", now.isoformat(), payer_name="Nome Novo")
+    older = _donation("11144477735", (now - timedelta(days=1)).isoformat(), payer_name="Nome Antigo")
+    # A queue flush: bulk insert with ?columns= and rows out of order
+    res = await sb.post("/rest/v1/donations", json=[newer, older], headers=sb.anon,
+                        params={"columns": ",".join(f'"{c}"' for c in newer)})
+    assert res.status == 201
+
+    headers = {**sb.anon, "Accept": "application/vnd.pgrst.object+json"}
+    donor = await (await sb.post("/rest/v1/rpc/lookup_donor", json={"donor_cpf": "11144477735"}, headers=headers)).json()
+    assert donor["name"] == "Nome Novo"
+    # Only reachable through the function
+    assert await (await sb.get("/rest/v1/donors", headers=sb.anon)).json() == []
+
+
+async def test_unique_keys_and_short_id_defaults(sb):
+    row = _donation(KNOWN_DONOR["cpf"], datetime.now(timezone.utc).isoformat(), idempotency_key="key-1")
+    assert (await sb.post("/rest/v1/donations", json=row, headers=sb.anon)).status == 201
+    res = await sb.post("/rest/v1/donations", json=row, headers=sb.anon)
+    assert res.status == 409 and (await res.json())["code"] == "23505"
+
+    headers = {**sb.anon, "Prefer": "return=representation", "Accept": "application/vnd.pgrst.object+json"}
+    ids = [
+        (await (await sb.post("/rest/v1/receipts_log", json={"storage_path": f"v1/{i}.pdf"},
+                              headers=headers, params={"select": "short_id"})).json())["short_id"]
+        for i in range(3)
+    ]
+    assert len(set(ids)) == 3 and all(len(short_id) == 7 for short_id in ids)
+
+    # receipt_short_id() returns the logged id for a known path instead of a new one
+    res = await sb.post("/rest/v1/rpc/receipt_short_id", json={"receipt_path": "v1/0.pdf"}, headers=sb.anon)
+    assert await res.json() == ids[0]
+    res = await sb.post("/rest/v1/rpc/receipt_short_id", json={"receipt_path": "v1/new.pdf"}, headers=sb.anon)
+    assert len(await res.json()) == 7
+
+
+async def test_updates_and_deletes_need_a_filter_and_a_signed_in_admin(sb):
+    assert (await sb.delete("/rest/v1/donations", headers=sb.anon)).status == 400
+    res = await sb.patch("/rest/v1/donations", json={"status": "paid"}, headers=sb.anon,
+                         params={"status": "eq.pending", "payment_method": "eq.pix"})
+    assert res.status == 204
+
+    # RLS: the anon key deletes nothing, the admin deletes the rows
+    assert (await sb.delete("/rest/v1/donations", headers=sb.anon, params={"status": "in.(canceled)"})).status == 204
+    stats = await (await sb.get("/__admin/stats")).json()
+    assert stats["rows"]["donations"] == 60
+    admin = await _sign_in(sb)
+    await sb.delete("/rest/v1/donations", headers=admin, params={"status": "in.(canceled,pending)"})
+    remaining = await (await sb.get("/rest/v1/donations", headers=admin, params={"select": "status"})).json()
+    assert {row["status"] for row in remaining} == {"paid"}
+
+
+async def test_dashboard_stats_need_a_session(sb):
+    args = {"today_start": "2000-01-01T00:00:00Z", "month_start": "2000-01-01T00:00:00Z"}
+    res = await sb.post("/rest/v1/rpc/admin_donation_stats", json=args, headers=sb.anon)
+    assert res.status == 401 and (await res.json())["code"] == "42501"
+
+    stats = await (await sb.post("/rest/v1/rpc/admin_donation_stats", json=args, headers=await _sign_in(sb))).json()
+    assert stats["count"] == 60 and stats["pix"] + stats["card"] == 60
+    assert stats["total"] == stats["todayTotal"] > 0
+
+    # A signed-in account that is not in admin_users gets nothing
+    session = await (await sb.post("/auth/v1/signup", json={"email": "x@example.com", "password": "secret123"},
+                                   headers=sb.anon)).json()
+    outsider = {**sb.anon, "Authorization": f"Bearer {session['access_token']}"}
+    res = await sb.post("/rest/v1/rpc/admin_donation_stats", json=args, headers=outsider)
+    assert res.status == 403 and (await res.json())["code"] == "42501"
+
+
+async def test_auth_sessions(sb):
+    res = await sb.post("/auth/v1/token", params={"grant_type": "password"},
+                        json={**ADMIN, "password": "wrong"}, headers=sb.anon)
+    assert res.status == 400 and (await res.json())["error_code"] == "invalid_credentials"
+
+    headers = await _sign_in(sb)
+    user = await (await sb.get("/auth/v1/user", headers=headers)).json()
+    assert user["email"] == ADMIN["email"]
+    assert (await sb.get("/auth/v1/user", headers={**headers, "Authorization": "Bearer x.y.z"})).status == 403
+
+
+async def test_receipt_upload_and_public_download(sb):
+    path = "/storage/v1/object/receipts/v1/abc.pdf"
+    headers = {**sb.anon, "Content-Type": "application/pdf"}
+    assert (await sb.post(path, data=b"%PDF-1.3", headers=headers)).status == 200
+    res = await sb.post(path, data=b"%PDF-1.3", headers=headers)
+    assert "exists" in (await res.json())["message"]
+
+    res = await sb.get("/storage/v1/object/public/receipts/v1/abc.pdf", params={"download": "recibo.pdf"})
+    assert await res.read() == b"%PDF-1.3"
+    assert res.headers["Content-Type"] == "application/pdf"
+    assert res.headers["Content-Disposition"] == 'attachment; filename="recibo.pdf"'
+
+
+async def test_reset_restores_the_seed_and_errors_can_be_injected(sb):
+    admin = await _sign_in(sb)
+    await sb.delete("/rest/v1/donations", headers=admin, params={"status": "neq.x"})
+    await sb.post("/__admin/reset")
+    assert (await (await sb.get("/__admin/stats")).json())["rows"]["donations"] == 60
+
+    await sb.post("/__admin/config", json={"error_rate": 1, "error_status": 503})
+    assert (await sb.get("/rest/v1/donations", headers=sb.anon)).status == 503
@@ -0,0 +1,47 @@
+"""Image byte budget for a donor's first visit on a phone.
+
+Loads ``/`` in a fresh mobile context (390x844 CSS px, 3x DPR, empty
+cache), sums the transferred bytes of every image response and fails when
+the total exceeds IMAGE_BUDGET_BYTES. The originals (1.6 MB hero, 378 KB
+logos) alone are over budget, so this fails whenever the AVIF/WebP variants
+from scripts/build-images.mjs are not being served.
+"""
+import os
+
+from support.pages import DonationWizard
+
+IMAGE_BUDGET_BYTES = int(os.environ.get("IMAGE_BUDGET_BYTES", 300_000))
+ORIGINALS = ("/hero-bg.jpg", "/logo.png", "/logo-black.png", "/pix-logo.png")
+
+
+async def test_first_load_image_bytes_stay_under_budget(browser, base_url):
+    context = await browser.new_context(
+        viewport={"width": 390, "height": 844},
+        device_scale_factor=3,
+        is_mobile=True,
+        has_touch=True,
+    )
+    page = await context.new_page()
+    images = []
+    page.on("requestfinished", lambda request: images.append(request) if request.resource_type == "image" else None)
+
+    try:
+        wizard = await DonationWizard(page).open(base_url)
+        await wizard.waits.ready(wizard.card, "donation card")
+        await page.wait_for_load_state("networkidle")
+
+        transferred = {}
+        for request in images:
+            sizes = await request.sizes()
+            transferred[request.url] = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+    finally:
+        await context.close()
+
+    total = sum(transferred.values())
+    print(f"\nfirst-load images: {total} B of {IMAGE_BUDGET_BYTES} B budget")
+    for url, size in sorted(transferred.items(), key=lambda item: -item[1]):
+        print(f"  {size:>9} B  {url.removeprefix(base_url)}")
+
+    assert not [url for url in transferred if url.removeprefix(base_url) in ORIGINALS], \
+        "original images were downloaded instead of the built variants"
+    assert total <= IMAGE_BUDGET_BYTES
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from load.runner import build_report, compare_to_baseline, main, percentile, run
+from load.scenarios import valid_cpf
+
+
+def _cpf_is_valid(cpf):
+    digits = [int(c) for c in cpf]
+    for size in (9, 10):
+        total = sum(d * (size + 1 - i) for i, d in enumerate(digits[:size]))
+        if (total * 10) % 11 % 10 != digits[size]:
+            return False
+    return len(set(digits)) > 1
+
+
+async def _app_routes():
+    # Minimal stand-in for the three Next.js routes
+    ids = iter(range(1000, 10**6))
+
+    async def donate(request):
+        body = await request.json()
+        if not _cpf_is_valid(body["customer"]["cpf"]):
+            return web.json_response({"error": "CPF inválido"}, status=400)
+        await asyncio.sleep(0.005)
+        return web.json_response({"id": next(ids), "status": "pending"})
+
+    async def check_donor(request):
+        return web.json_response({"exists": False})
+
+    async def check_status(request):
+        body = await request.json()
+        if body["id"] == "123456789":
+            return web.json_response({"error": "not found"}, status=500)
+        return web.json_response({"status": "pending"})
+
+    app = web.Application()
+    app.router.add_post("/api/donate", donate)
+    app.router.add_post("/api/check-donor", check_donor)
+    app.router.add_post("/api/check-status", check_status)
+    return app
+
+
+def test_generated_cpfs_pass_the_checksum():
+    assert all(_cpf_is_valid(valid_cpf()) for _ in range(200))
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 95) == 7.0
+    assert percentile([], 50) is None
+
+
+async def test_run_reports_every_scenario_of_the_mix():
+    server = TestServer(await _app_routes())
+    await server.start_server()
+    try:
+        samples, elapsed = await run(
+            str(server.make_url("")).rstrip("/"), "sunday-offering", "constant",
+            target_rps=100, duration=1.0, seed=1,
+        )
+    finally:
+        await server.close()
+
+    report = build_report(samples, elapsed, {})
+    assert set(report["scenarios"]) == {"check-donor", "check-status", "donate"}
+    assert 80 <= report["total"]["requests"] <= 101
+    assert report["scenarios"]["donate"]["error_rate"] == 0
+    assert report["scenarios"]["check-donor"]["status_codes"] == {"200": report["scenarios"]["check-donor"]["requests"]}
+    latency = report["total"]["latency_ms"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+def _report(p95, error_rate=0.0):
+    return {"scenarios": {"donate": {
+        "error_rate": error_rate,
+        "latency_ms": {"p50": p95 / 2, "p95": p95, "p99": p95 * 1.5},
+    }}}
+
+
+@pytest.mark.parametrize("current, regressed", [
+    (_report(110), False),
+    (_report(200), True),
+    (_report(100, error_rate=0.05), True),
+])
+def test_compare_to_baseline(current, regressed):
+    regressions = compare_to_baseline(current, _report(100), tolerance=0.2)
+    assert bool(regressions) is regressed
+
+
+def test_missing_scenario_is_a_regression():
+    assert compare_to_baseline({"scenarios": {}}, _report(100)) == ["donate: no requests in this run"]
+
+
+def test_non_positive_rates_are_rejected(capsys):
+    with pytest.raises(SystemExit):
+        main(["--rps", "0"])
+    assert "must be greater than 0" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        asyncio.run(run("http://127.0.0.1:9", "donate", "constant", -1, 1))
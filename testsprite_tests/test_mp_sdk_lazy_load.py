@@ -0,0 +1,48 @@
+"""The Mercado Pago JS SDK is only fetched when the card step opens.
+
+The SDK request is intercepted with a stub (hermetic; the real script is
+~100 KB and talks to MP), and /api/check-donor answers "new donor" so the
+wizard always shows the full form. Pages and wizard steps that never take
+a card must not request the SDK at all.
+"""
+import random
+
+from load.scenarios import valid_cpf
+from support.pages import AdminLoginPage, DonationWizard
+
+SDK = "https://sdk.mercadopago.com/**"
+STUB = "window.MercadoPago = function MercadoPago() {};"
+
+
+async def test_mp_sdk_loads_only_on_card_step(page, waits, base_url):
+    sdk_requests = []
+
+    async def sdk(route):
+        sdk_requests.append(route.request.url)
+        await route.fulfill(body=STUB, content_type="application/javascript")
+
+    await page.route(SDK, sdk)
+    await page.route("**/api/check-donor", lambda route: route.fulfill(json={"exists": False}))
+
+    await AdminLoginPage(page, waits).open(base_url)
+    await page.wait_for_load_state("networkidle")
+    assert sdk_requests == [], "admin login page loaded the MP SDK"
+
+    wizard = await DonationWizard(page, waits).open(base_url)
+    await wizard.choose_location("central")
+    await wizard.enter_amount("10")
+    await wizard.continue_to_identification()
+    await wizard.enter_cpf(valid_cpf(random.Random(23)))
+    await wizard.fill_personal_info("Maria Teste", "92999999999")
+    assert sdk_requests == [], "MP SDK requested before the payment step"
+
+    # Card is the default payment tab: opening step 3 starts the download
+    await wizard.continue_to_payment()
+    await page.wait_for_function("typeof window.MercadoPago === 'function'")
+    assert len(sdk_requests) == 1
+
+    # Switching tabs back and forth reuses the loaded SDK
+    await wizard.choose_payment("pix")
+    await wizard.choose_payment("credit_card")
+    await page.wait_for_load_state("networkidle")
+    assert len(sdk_requests) == 1
@@ -0,0 +1,96 @@
+"""The splash screen lifts on the page's readiness signal, not on a timer.
+
+An init script records, in page time, when the above-the-fold images
+(``img[fetchpriority=high]`` outside the splash, the set SplashScreen waits
+for) have decoded, when the splash starts fading and when it leaves the DOM.
+On a first visit the fade must start right after that readiness event, and
+the splash must be gone one fade later; a fixed timer, or a readiness check
+that stops resolving, starts the fade long after the images are ready. With
+the session's "seen" flag set the splash must never be displayed.
+
+Next to the readiness timings the first-visit test reports time to first
+interaction: when, in page time, the donor's first click on the donation
+type trigger (issued as soon as Playwright finds it clickable) lands.
+"""
+from playwright.async_api import expect
+
+from support.pages import DonationWizard
+
+SEEN_KEY = "chamachurch:splash-seen"
+FADE_MS = 300  # SplashScreen's FADE_MS
+# Hydration and effect scheduling between the images decoding and the fade
+READY_MARGIN_MS = 400
+FADE_MARGIN_MS = 150
+
+SPLASH_PROBE = """
+(() => {
+  const timings = window.__splash = { mounted: false, shown: false, ready: null, fading: null, removed: null, interactive: null };
+  const selector = '[data-testid="splash-screen"]';
+  new MutationObserver(() => {
+    const splash = document.querySelector(selector);
+    if (splash) {
+      timings.mounted = true;
+      if (getComputedStyle(splash).display !== 'none') timings.shown = true;
+      if (timings.fading === null && /fadeOut/.test(splash.className)) timings.fading = performance.now();
+    } else if (timings.mounted && timings.removed === null) {
+      timings.removed = performance.now();
+    }
+  }).observe(document, { childList: true, subtree: true, attributes: true, attributeFilter: ['class'] });
+  document.addEventListener('click', event => {
+    if (timings.interactive === null && event.target.closest('[data-testid="type-trigger"]')) {
+      timings.interactive = performance.now();
+    }
+  }, true);
+  document.addEventListener('DOMContentLoaded', () => {
+    const images = [...document.querySelectorAll('img[fetchpriority="high"]')]
+      .filter(img => !img.closest('[data-splash]'));
+    Promise.all(images.map(img => img.decode().catch(() => undefined)))
+      .then(() => { timings.ready = performance.now(); });
+  });
+})();
+"""
+
+
+async def _splash_timings(page):
+    await page.wait_for_function("() => window.__splash && window.__splash.removed !== null", timeout=5000)
+    return await page.evaluate("() => window.__splash")
+
+
+async def test_splash_lifts_right_after_the_page_is_ready(context, page, waits, base_url):
+    await context.add_init_script(SPLASH_PROBE)
+    await page.goto(base_url)
+
+    # Clicked right away: the click only lands once the splash lets it through
+    wizard = DonationWizard(page, waits)
+    await wizard.by("type-trigger").click()
+    await wizard.by("type-done").click()
+    timings = await _splash_timings(page)
+    assert timings["ready"] is not None and timings["fading"] is not None
+    assert timings["interactive"] is not None
+
+    print(f"\nsplash: images ready at {timings['ready']:.0f}ms, fade at {timings['fading']:.0f}ms, "
+          f"gone at {timings['removed']:.0f}ms, first interaction at {timings['interactive']:.0f}ms")
+    assert timings["shown"]
+    # Starting earlier is fine: MAX_SPLASH_MS caps the wait for slow images
+    assert timings["fading"] <= timings["ready"] + READY_MARGIN_MS
+    assert FADE_MS - 50 <= timings["removed"] - timings["fading"] <= FADE_MS + FADE_MARGIN_MS
+
+
+async def test_splash_is_skipped_once_seen(context, page, waits, base_url):
+    await context.add_init_script(f"sessionStorage.setItem('{SEEN_KEY}', '1')")
+    await context.add_init_script(SPLASH_PROBE)
+    wizard = DonationWizard(page, waits)
+    splash = page.get_by_test_id("splash-screen")
+
+    for navigate in (lambda: page.goto(base_url), page.reload):
+        await navigate()
+        await _splash_timings(page)
+        assert not (await page.evaluate("() => window.__splash"))["shown"]
+        await wizard.by("type-trigger").click()
+        await wizard.by("type-done").click()
+
+    # Client-side navigation keeps the layout mounted: no splash either
+    history = await wizard.open_history()
+    await expect(splash).to_have_count(0)
+    await history.back_to_donation()
+    await expect(splash).to_have_count(0)
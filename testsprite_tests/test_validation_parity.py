@@ -0,0 +1,144 @@
+"""Property and benchmark test for lib/validation.ts.
+
+Generates CPF, email and phone inputs in Python, runs them through the
+shared TypeScript module and the legacy checkers it replaced (in Node, see
+support/validation_harness.mjs), and requires all three implementations to
+agree: the TS module, the legacy JS and the Python reference below.
+
+Set VALIDATION_CASES (default 100000 per field) to run millions of inputs.
+Needs node, plus either Node >= 22.6 (type stripping) or the app's
+node_modules/typescript; otherwise the test is skipped.
+"""
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from load.scenarios import valid_cpf
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE = ROOT / "lib" / "validation.ts"
+HARNESS = Path(__file__).resolve().parent / "support" / "validation_harness.mjs"
+CASES = int(os.environ.get("VALIDATION_CASES", "100000"))
+
+# JavaScript's \s, which the legacy email regex used
+JS_WHITESPACE = "\t\n\v\f\r \u00a0\u1680" + "".join(map(chr, range(0x2000, 0x200B))) + \
+    "\u2028\u2029\u202f\u205f\u3000\ufeff"
+EMAIL_RE = re.compile(rf"^[^{re.escape(JS_WHITESPACE)}@]+@[^{re.escape(JS_WHITESPACE)}@]+\.[^{re.escape(JS_WHITESPACE)}@]+\Z")
+
+
+def ascii_digits(value):
+    return "".join(c for c in value if "0" <= c <= "9")
+
+
+def reference_cpf(value):
+    digits = [int(c) for c in ascii_digits(value)]
+    if len(digits) != 11 or len(set(digits)) == 1:
+        return False
+    for size in (9, 10):
+        total = sum(d * (size + 1 - i) for i, d in enumerate(digits[:size]))
+        if (total * 10) % 11 % 10 != digits[size]:
+            return False
+    return True
+
+
+def reference_email(value):
+    return EMAIL_RE.match(value) is not None
+
+
+def reference_phone(value):
+    return 10 <= len(ascii_digits(value)) <= 11
+
+
+NOISE = ".-/ ()+" + JS_WHITESPACE[:8] + "\u0663\u0966a"  # non-ASCII digits must not count
+
+
+def gen_cpf(rng):
+    kind = rng.random()
+    if kind < 0.3:
+        return valid_cpf(rng)
+    if kind < 0.45:
+        cpf = valid_cpf(rng)
+        return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+    if kind < 0.6:
+        cpf = list(valid_cpf(rng))
+        cpf[rng.randrange(11)] = str(rng.randrange(10))
+        return "".join(cpf)
+    if kind < 0.65:
+        return str(rng.randrange(10)) * rng.choice([10, 11, 12])
+    length = rng.randrange(0, 16)
+    return "".join(rng.choice("0123456789" * 3 + NOISE) for _ in range(length))
+
+
+def gen_email(rng):
+    alphabet = "abcxyz019_-+." + "@" * 2 + "." * 3
+    if rng.random() < 0.4:
+        return f"{rng.choice(['joao', 'a', 'maria.s'])}@{rng.choice(['x', 'gmail', 'a.b'])}.{rng.choice(['com', 'br', ''])}"
+    length = rng.randrange(0, 14)
+    chars = [rng.choice(alphabet) for _ in range(length)]
+    if chars and rng.random() < 0.2:
+        chars[rng.randrange(len(chars))] = rng.choice(JS_WHITESPACE)
+    return "".join(chars)
+
+
+def gen_phone(rng):
+    length = rng.randrange(0, 18)
+    return "".join(rng.choice("0123456789" * 4 + NOISE) for _ in range(length))
+
+
+def _compile_module(tmp_path):
+    """Return a path Node can import lib/validation.ts from, or skip."""
+    node = shutil.which("node")
+    if not node:
+        pytest.skip("node is not installed")
+
+    major, minor = (int(x) for x in subprocess.check_output([node, "-p", "process.versions.node"], text=True).split(".")[:2])
+    if (major, minor) >= (22, 6):
+        target = tmp_path / "validation.mts"
+        shutil.copy(MODULE, target)
+        return [node, "--experimental-strip-types", "--no-warnings"], target
+
+    typescript = ROOT / "node_modules" / "typescript"
+    if not typescript.exists():
+        pytest.skip("needs Node >= 22.6 or node_modules/typescript (npm install)")
+    target = tmp_path / "validation.mjs"
+    subprocess.run([node, "-e", (
+        "const ts = require(process.argv[1]); const fs = require('fs');"
+        "const out = ts.transpileModule(fs.readFileSync(process.argv[2], 'utf8'),"
+        " { compilerOptions: { module: ts.ModuleKind.ESNext, target: ts.ScriptTarget.ES2020 } });"
+        "fs.writeFileSync(process.argv[3], out.outputText);"
+    ), str(typescript), str(MODULE), str(target)], check=True)
+    return [node], target
+
+
+def test_validation_matches_legacy_and_reference(tmp_path):
+    command, module = _compile_module(tmp_path)
+    rng = random.Random(1234)
+    generators = {"cpf": gen_cpf, "email": gen_email, "phone": gen_phone}
+    inputs = {name: [gen(rng) for _ in range(CASES)] for name, gen in generators.items()}
+    inputs_path = tmp_path / "inputs.json"
+    inputs_path.write_text(json.dumps(inputs))
+
+    run = subprocess.run(
+        [*command, str(HARNESS), str(module), str(inputs_path)],
+        capture_output=True, text=True, check=True,
+    )
+    output = json.loads(run.stdout)
+
+    references = {"cpf": reference_cpf, "email": reference_email, "phone": reference_phone}
+    for name, values in inputs.items():
+        assert output["mismatches"][name] == [], f"{name}: TS module disagrees with the legacy checker"
+        results = output["results"][name]
+        disagreements = [v for v, r in zip(values, results) if references[name](v) != (r == "1")]
+        assert disagreements[:20] == [], f"{name}: TS module disagrees with the Python reference"
+        # Both outcomes must actually be exercised
+        assert 0 < results.count("1") < len(values)
+
+    print("\nlib/validation.ts ns/call (current vs legacy):")
+    for name, timings in output["timings"].items():
+        print(f"  {name:<6}" + "  ".join(f"{impl}={t['ns_per_call']:.0f}" for impl, t in timings.items()))
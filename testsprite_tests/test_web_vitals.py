@@ -0,0 +1,82 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from vitals.collector import measure
+from vitals.profiles import PROFILES, Profile
+from vitals.routes import Route
+from vitals.runner import append_trend, check_budgets, compare_to_trend, summarize
+
+# A long task during load, a layout shift and a click handler that blocks for 150 ms
+PAGE = """<!doctype html>
+<html><body>
+<h1 id="title">Doação</h1>
+<button id="slow" style="margin-top: 20px">Continuar</button>
+<script>
+  const busy = ms => { const end = performance.now() + ms; while (performance.now() < end); };
+  busy(120);
+  setTimeout(() => { document.getElementById('title').style.marginTop = '200px'; }, 100);
+  document.getElementById('slow').addEventListener('click', () => busy(150));
+</script>
+</body></html>"""
+
+
+def _sample(lcp, inp=80, tbt=50, cls=0.01, heap=8.0):
+    return {"lcp_ms": lcp, "inp_ms": inp, "tbt_ms": tbt, "cls": cls, "heap_mb": heap}
+
+
+def _entry(lcp, passed=True):
+    return {"passed": passed, "routes": {"/": {"mobile-4g": {"lcp_ms": lcp}}}}
+
+
+def test_summarize_takes_the_median_and_skips_missing_metrics():
+    summary = summarize([_sample(1000, inp=None), _sample(3000, inp=None), _sample(2000, inp=None)])
+    assert summary["lcp_ms"] == 2000
+    assert summary["inp_ms"] is None
+    assert summary["runs"] == 3
+
+
+def test_budgets_are_per_profile():
+    results = {"/": {"mobile-4g": summarize([_sample(3000)]), "mobile-3g": summarize([_sample(3000)])}}
+    assert check_budgets(results, PROFILES) == ["/ [mobile-4g]: lcp_ms 3000 > budget 2500"]
+
+
+def test_regressions_compare_against_passing_trend_runs_only():
+    trend = [_entry(2000), _entry(2100), _entry(1900), _entry(9000, passed=False)]
+    assert compare_to_trend({"/": {"mobile-4g": {"lcp_ms": 2500}}}, trend) == []
+    regressions = compare_to_trend({"/": {"mobile-4g": {"lcp_ms": 2600}}}, trend)
+    assert regressions == ["/ [mobile-4g]: lcp_ms 2600 > 2550 (trend median 2000)"]
+    # Nothing to compare with on a new route or profile
+    assert compare_to_trend({"/historico": {"mobile-3g": {"lcp_ms": 9000}}}, trend) == []
+
+
+def test_trend_keeps_the_latest_runs():
+    trend = [_entry(i) for i in range(5)]
+    kept = append_trend(trend, _entry(99), keep=3)
+    assert [e["routes"]["/"]["mobile-4g"]["lcp_ms"] for e in kept] == [3, 4, 99]
+
+
+async def test_collector_reports_lcp_cls_tbt_inp_and_heap(browser):
+    async def index(request):
+        return web.Response(text=PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", index)
+    server = TestServer(app)
+    await server.start_server()
+
+    async def click_slow_button(page):
+        await page.click("#slow")
+
+    try:
+        sample = await measure(
+            browser, str(server.make_url("")).rstrip("/"),
+            Route("/", click_slow_button), Profile("unthrottled", 1),
+        )
+    finally:
+        await server.close()
+
+    assert sample["lcp_ms"] > 0 and sample["lcp_element"] == "h1"
+    assert sample["cls"] > 0
+    assert sample["tbt_ms"] >= 0 and sample["long_tasks"] >= 1
+    assert sample["inp_ms"] >= 150 and sample["interactions"] == 1
+    assert sample["heap_mb"] > 0
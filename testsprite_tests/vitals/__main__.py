@@ -0,0 +1,3 @@
+from vitals.runner import main
+
+main()
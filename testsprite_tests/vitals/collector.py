@@ -0,0 +1,144 @@
+"""Core Web Vitals collection for one page load in a throttled browser context.
+
+The observer script is installed before any of the app's code runs and
+records, through PerformanceObserver:
+
+* LCP: the last ``largest-contentful-paint`` entry (the browser stops
+  reporting candidates at the first input, like the field metric);
+* CLS: the largest session window of layout shifts without recent input
+  (gaps < 1 s, windows <= 5 s);
+* TBT: the blocking part (beyond 50 ms) of every long task from FCP until
+  the page has settled, before any scripted interaction;
+* INP: the slowest interaction (98th percentile from 50 interactions on)
+  from Event Timing entries, grouped by ``interactionId``.
+
+The JS heap is read from CDP ``Performance.getMetrics`` after a forced
+garbage collection, so it is the memory the page actually retains.
+"""
+OBSERVER_SCRIPT = """
+(() => {
+    const state = { fcp: null, lcp: null, lcpElement: null, cls: 0, longTasks: [], interactions: new Map() };
+    let session = 0, sessionStart = 0, lastShift = 0;
+
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true, ...options });
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+
+    observe('paint', entry => {
+        if (entry.name === 'first-contentful-paint') state.fcp = entry.startTime;
+    });
+    observe('largest-contentful-paint', entry => {
+        state.lcp = entry.startTime;
+        const element = entry.element;
+        state.lcpElement = element ? element.tagName.toLowerCase() + (entry.url ? ' ' + entry.url : '') : null;
+    });
+    observe('layout-shift', entry => {
+        if (entry.hadRecentInput) return;
+        if (session && entry.startTime - lastShift < 1000 && entry.startTime - sessionStart < 5000) {
+            session += entry.value;
+        } else {
+            session = entry.value;
+            sessionStart = entry.startTime;
+        }
+        lastShift = entry.startTime;
+        state.cls = Math.max(state.cls, session);
+    });
+    observe('longtask', entry => state.longTasks.push([entry.startTime, entry.duration]));
+    const onEvent = entry => {
+        if (!entry.interactionId) return;
+        const slowest = state.interactions.get(entry.interactionId) || 0;
+        state.interactions.set(entry.interactionId, Math.max(slowest, entry.duration));
+    };
+    observe('event', onEvent, { durationThreshold: 16 });
+    observe('first-input', onEvent);
+
+    window.__vitals = {
+        tbt(until = performance.now()) {
+            const from = state.fcp || 0;
+            return state.longTasks
+                .filter(([start]) => start >= from && start < until)
+                .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0);
+        },
+        read() {
+            const durations = [...state.interactions.values()].sort((a, b) => b - a);
+            const inp = durations.length
+                ? durations[Math.min(durations.length - 1, Math.floor(durations.length / 50))]
+                : null;
+            return {
+                fcp_ms: state.fcp,
+                lcp_ms: state.lcp,
+                lcp_element: state.lcpElement,
+                cls: state.cls,
+                inp_ms: inp,
+                interactions: durations.length,
+                long_tasks: state.longTasks.length,
+            };
+        },
+    };
+})();
+"""
+
+# Event Timing and PerformanceObserver callbacks are delivered after the
+# next paint; give them a couple of frames before reading
+FLUSH_SCRIPT = "new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 250)))"
+
+MIB = 1024 * 1024
+
+
+async def throttle(cdp, profile):
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_slowdown})
+    if profile.network:
+        await cdp.send("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile.network.latency_ms,
+            # CDP wants bytes per second
+            "downloadThroughput": profile.network.download_kbps * 1000 / 8,
+            "uploadThroughput": profile.network.upload_kbps * 1000 / 8,
+        })
+
+
+async def measure(browser, base_url, route, profile, credentials=None, timeout_ms=60000):
+    """Load ``route`` once in a fresh context under ``profile``; returns a dict of metrics."""
+    width, height = profile.viewport
+    context = await browser.new_context(
+        viewport={"width": width, "height": height},
+        device_scale_factor=profile.device_scale_factor,
+        is_mobile=True,
+        has_touch=True,
+    )
+    context.set_default_timeout(timeout_ms)
+    try:
+        await context.add_init_script(OBSERVER_SCRIPT)
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+
+        if route.prepare:
+            # Unthrottled (e.g. the admin login); its downloads must not warm the measured load
+            await route.prepare(page, base_url, credentials)
+            await cdp.send("Network.clearBrowserCache")
+
+        await throttle(cdp, profile)
+        await cdp.send("Performance.enable")
+        await page.goto(f"{base_url}{route.path}", wait_until="load", timeout=timeout_ms)
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        tbt = await page.evaluate("window.__vitals.tbt()")
+
+        if route.interact:
+            await route.interact(page)
+        await page.evaluate(FLUSH_SCRIPT)
+        sample = await page.evaluate("window.__vitals.read()")
+
+        await cdp.send("HeapProfiler.collectGarbage")
+        metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+    finally:
+        await context.close()
+
+    sample["tbt_ms"] = tbt
+    sample["heap_mb"] = metrics["JSHeapUsedSize"] / MIB
+    return sample
@@ -0,0 +1,43 @@
+"""Emulated phones for the Web Vitals benchmark, and their budgets.
+
+Both profiles are a mid-range Android phone (4x CPU slowdown and the
+412x823 @1.75x screen Lighthouse's mobile preset calibrates against) on a
+different network, using the Chrome DevTools presets:
+
+* ``mobile-4g``: "Fast 4G", 170 ms latency, 9 Mbps down, 1.5 Mbps up;
+* ``mobile-3g``: "3G", 562.5 ms latency, 1.6 Mbps down, 750 Kbps up
+  (what Lighthouse applies for its "slow 4G" mobile run).
+
+Throughputs are scaled by 0.9 like DevTools does. Budgets are the Core Web
+Vitals "good" thresholds; only LCP depends on the network, so on 3G it may
+reach the "needs improvement" bound instead.
+"""
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Network:
+    latency_ms: float
+    download_kbps: float
+    upload_kbps: float
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    cpu_slowdown: float
+    network: Network = None
+    budgets: dict = field(default_factory=dict)
+    viewport: tuple = (412, 823)
+    device_scale_factor: float = 1.75
+
+
+# metric -> limit; the same keys as a collector sample
+CPU_BUDGETS = {"inp_ms": 200, "tbt_ms": 200, "cls": 0.1, "heap_mb": 32}
+
+PROFILES = {
+    profile.name: profile for profile in (
+        Profile("mobile-4g", 4, Network(170, 9000 * 0.9, 1500 * 0.9), {"lcp_ms": 2500, **CPU_BUDGETS}),
+        Profile("mobile-3g", 4, Network(562.5, 1600 * 0.9, 750 * 0.9), {"lcp_ms": 4000, **CPU_BUDGETS}),
+    )
+}
@@ -0,0 +1,64 @@
+"""Pages measured by the Web Vitals benchmark and what a visitor does on each.
+
+``interact`` runs after the throttled load has settled; its clicks and
+keystrokes are what INP is measured on, so each one follows the real
+funnel: the donation wizard up to the donor's CPF (no payment is created),
+a history lookup, and a dashboard filter. Keystrokes are typed one by one
+because a single ``fill`` is only one input event.
+"""
+import random
+from dataclasses import dataclass
+
+from load.scenarios import valid_cpf
+
+KEY_DELAY_MS = 80
+
+
+@dataclass(frozen=True)
+class Route:
+    path: str
+    interact: object = None  # async (page) -> None
+    # Unthrottled setup in the same context before the measured load
+    prepare: object = None  # async (page, base_url, credentials) -> None
+    needs_credentials: bool = False
+
+
+async def donation_funnel(page):
+    by = page.get_by_test_id
+    await by("type-trigger").click()
+    await by("type-option-dizimo").click()
+    await by("type-done").click()
+    await by("amount-input").press_sequentially("50", delay=KEY_DELAY_MS)
+    await by("location-trigger").click()
+    await by("location-option-central").click()
+    await by("step1-continue").click()
+    await by("cpf-input").press_sequentially(valid_cpf(random.Random(7)), delay=KEY_DELAY_MS)
+
+
+async def history_lookup(page):
+    by = page.get_by_test_id
+    await by("history-cpf-input").press_sequentially(valid_cpf(random.Random(7)), delay=KEY_DELAY_MS)
+    async with page.expect_response(lambda response: "/rest/v1/donations" in response.url):
+        await by("history-search").click()
+
+
+async def admin_login(page, base_url, credentials):
+    email, password = credentials
+    by = page.get_by_test_id
+    await page.goto(f"{base_url}/admin")
+    await by("admin-email").fill(email)
+    await by("admin-password").fill(password)
+    await by("admin-login").click()
+    await page.wait_for_url("**/admin/dashboard")
+
+
+async def dashboard_filter(page):
+    async with page.expect_response(lambda response: "/api/admin/donations" in response.url):
+        await page.get_by_test_id("filter-status").select_option("paid")
+
+
+ROUTES = {
+    "/": Route("/", donation_funnel),
+    "/historico": Route("/historico", history_lookup),
+    "/admin/dashboard": Route("/admin/dashboard", dashboard_filter, admin_login, needs_credentials=True),
+}
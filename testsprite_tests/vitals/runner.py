@@ -0,0 +1,200 @@
+"""Core Web Vitals benchmark for the donation funnel on throttled phones.
+
+Loads each route in a fresh (cold cache) mobile context under every
+profile of vitals/profiles.py, several times, and records LCP, INP, TBT,
+CLS and the JS heap (see vitals/collector.py). Run from testsprite_tests/
+against a production build (``npm run build && npm start``)::
+
+    python -m vitals --runs 5
+    python -m vitals --route / --profile mobile-3g --runs 9
+
+/admin/dashboard needs an admin account: set ADMIN_EMAIL and
+ADMIN_PASSWORD, otherwise the route is skipped.
+
+The medians are written to web_vitals_results.json and appended to
+web_vitals_trend.json (keep that file between CI runs). The run exits
+non-zero when a median is over its profile's budget, or regressed beyond
+the tolerance against the median of the last passing runs in the trend.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from vitals.collector import measure
+from vitals.profiles import PROFILES
+from vitals.routes import ROUTES
+
+HERE = Path(__file__).resolve().parent.parent
+RESULTS_PATH = HERE / "web_vitals_results.json"
+TREND_PATH = HERE / "web_vitals_trend.json"
+
+METRICS = ("lcp_ms", "inp_ms", "tbt_ms", "cls", "heap_mb")
+# Absolute noise allowance on top of the relative tolerance, per metric
+SLACK = {"lcp_ms": 150, "inp_ms": 24, "tbt_ms": 50, "cls": 0.02, "heap_mb": 1.0}
+
+
+def summarize(samples):
+    """Median of each metric over the runs (metrics a run could not observe are left out)."""
+    summary = {}
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        summary[metric] = round(statistics.median(values), 4) if values else None
+    summary["runs"] = len(samples)
+    return summary
+
+
+def check_budgets(results, profiles=PROFILES):
+    """List the medians over their profile's budget (empty when none)."""
+    violations = []
+    for route, by_profile in results.items():
+        for name, summary in by_profile.items():
+            for metric, limit in profiles[name].budgets.items():
+                value = summary.get(metric)
+                if value is not None and value > limit:
+                    violations.append(f"{route} [{name}]: {metric} {value:g} > budget {limit:g}")
+    return violations
+
+
+def trend_baseline(trend, route, profile, metric, window=5):
+    """Median of ``metric`` over the last ``window`` passing runs that measured it."""
+    values = []
+    for entry in reversed(trend):
+        if not entry.get("passed"):
+            continue
+        value = entry["routes"].get(route, {}).get(profile, {}).get(metric)
+        if value is not None:
+            values.append(value)
+        if len(values) == window:
+            break
+    return statistics.median(values) if values else None
+
+
+def compare_to_trend(results, trend, tolerance=0.2, window=5):
+    """List the regressions of ``results`` against the trend (empty when none)."""
+    regressions = []
+    for route, by_profile in results.items():
+        for name, summary in by_profile.items():
+            for metric in METRICS:
+                now = summary.get(metric)
+                was = trend_baseline(trend, route, name, metric, window)
+                if now is None or was is None:
+                    continue
+                limit = was * (1 + tolerance) + SLACK[metric]
+                if now > limit:
+                    regressions.append(
+                        f"{route} [{name}]: {metric} {now:g} > {limit:g} (trend median {was:g})"
+                    )
+    return regressions
+
+
+def append_trend(trend, entry, keep=100):
+    return (trend + [entry])[-keep:]
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=HERE,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(base_url, routes, profiles, runs, credentials=None, headless=True):
+    """Measure every route under every profile ``runs`` times; returns {route: {profile: [sample]}}."""
+    samples = {}
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=headless, args=["--disable-dev-shm-usage"])
+        try:
+            # One load at a time: parallel pages would compete for the CPU being throttled
+            for path, route in routes.items():
+                for name, profile in profiles.items():
+                    for i in range(runs):
+                        sample = await measure(browser, base_url, route, profile, credentials)
+                        samples.setdefault(path, {}).setdefault(name, []).append(sample)
+                        print(f"  {path} [{name}] run {i + 1}/{runs}: " + ", ".join(
+                            f"{m}={sample[m]:.4g}" for m in METRICS if sample.get(m) is not None
+                        ))
+        finally:
+            await browser.close()
+    return samples
+
+
+def _print_results(results):
+    print(f"\n{'route':<18}{'profile':<11}{'LCP':>9}{'INP':>8}{'TBT':>8}{'CLS':>7}{'heap':>9}")
+    for route, by_profile in results.items():
+        for name, s in by_profile.items():
+            cells = [
+                f"{s['lcp_ms']:>7.0f}ms" if s["lcp_ms"] is not None else f"{'-':>9}",
+                f"{s['inp_ms']:>6.0f}ms" if s["inp_ms"] is not None else f"{'-':>8}",
+                f"{s['tbt_ms']:>6.0f}ms" if s["tbt_ms"] is not None else f"{'-':>8}",
+                f"{s['cls']:>7.3f}" if s["cls"] is not None else f"{'-':>7}",
+                f"{s['heap_mb']:>7.1f}MB" if s["heap_mb"] is not None else f"{'-':>9}",
+            ]
+            print(f"{route:<18}{name:<11}" + "".join(cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Core Web Vitals benchmark on throttled mobile profiles.")
+    parser.add_argument("--base-url", default=os.environ.get("BASE_URL", "http://localhost:3000"))
+    parser.add_argument("--route", action="append", choices=sorted(ROUTES), help="default: all")
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES), help="default: all")
+    parser.add_argument("--runs", type=int, default=5, help="loads per route and profile")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--trend", type=Path, default=TREND_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--window", type=int, default=5, help="passing trend runs the baseline is the median of")
+    parser.add_argument("--keep", type=int, default=100, help="runs kept in the trend file")
+    args = parser.parse_args(argv)
+
+    credentials = None
+    if os.environ.get("ADMIN_EMAIL") and os.environ.get("ADMIN_PASSWORD"):
+        credentials = (os.environ["ADMIN_EMAIL"], os.environ["ADMIN_PASSWORD"])
+    routes = {path: ROUTES[path] for path in (args.route or ROUTES)}
+    for path, route in list(routes.items()):
+        if route.needs_credentials and not credentials:
+            print(f"Skipping {path}: set ADMIN_EMAIL and ADMIN_PASSWORD to measure it")
+            del routes[path]
+    profiles = {name: PROFILES[name] for name in (args.profile or PROFILES)}
+
+    samples = asyncio.run(run(
+        args.base_url.rstrip("/"), routes, profiles, args.runs,
+        credentials=credentials, headless=os.environ.get("HEADED", "") == "",
+    ))
+    results = {
+        route: {name: summarize(runs) for name, runs in by_profile.items()}
+        for route, by_profile in samples.items()
+    }
+    _print_results(results)
+
+    trend = json.loads(args.trend.read_text())["runs"] if args.trend.exists() else []
+    violations = check_budgets(results)
+    regressions = compare_to_trend(results, trend, args.tolerance, args.window)
+
+    entry = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "settings": {"base_url": args.base_url, "runs": args.runs},
+        "routes": results,
+        "passed": not violations and not regressions,
+    }
+    args.trend.write_text(json.dumps({"runs": append_trend(trend, entry, args.keep)}, indent=2) + "\n")
+    report = {**entry, "samples": samples, "budget_violations": violations, "regressions": regressions}
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    print(f"\nReport written to {args.output}, trend to {args.trend}")
+
+    for title, lines in (("Over budget:", violations), ("Regressions against the trend:", regressions)):
+        if lines:
+            print(f"\n{title}")
+            for line in lines:
+                print(f"  - {line}")
+    if violations or regressions:
+        sys.exit(1)